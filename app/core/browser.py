@@ -1,49 +1,374 @@
 import asyncio
-from playwright.async_api import async_playwright, Browser, Playwright
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+from app.core import config
+
+# Options every scraping context is created with (Ukrainian locale and Kyiv timezone)
+CONTEXT_OPTIONS = {
+    "locale": "uk-UA",
+    "timezone_id": "Europe/Kyiv",
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "viewport": {'width': 1920, 'height': 1080},
+}
+
+
+class BrowserPoolBusy(RuntimeError):
+    """Raised when no pooled browser context could be handed out (queue full or wait timed out)"""
+
+
+class ContextLease:
+    """
+    A pooled browser context lent to a single caller.
+
+    Pages opened through the lease are closed when it is returned to the pool.
+
+    Attributes:
+        context (BrowserContext): The warm Playwright context.
+        uses (int): How many times the context has been leased.
+        broken (bool): When True the context is closed instead of being reused.
+    """
+
+    def __init__(self, context: BrowserContext) -> None:
+        self.context = context
+        self.uses = 0
+        self.broken = False
+        self._pages: list[Page] = []
+        context.on("close", lambda _: self.discard())
+
+    async def new_page(self) -> Page:
+        """Opens a page in the leased context"""
+        page = await self.context.new_page()
+        self._pages.append(page)
+        return page
+
+    def discard(self) -> None:
+        """Marks the context as unusable so the pool replaces it"""
+        self.broken = True
+
+    async def release_pages(self) -> None:
+        """Closes every page opened during the lease"""
+        for page in self._pages:
+            try:
+                await page.close()
+            except Exception:
+                self.broken = True
+        self._pages.clear()
+
+
+class ContextPool:
+    """
+    Bounded pool of pre-configured browser contexts for one browser instance.
+
+    Callers queue behind a semaphore of `size` slots. A context is recycled after
+    `max_uses` leases or when the lease ends with an error.
+    """
+
+    def __init__(self, manager: "BrowserManager", headless: bool, size: int, max_uses: int,
+                 max_queue: int, acquire_timeout: float) -> None:
+        self._manager = manager
+        self._headless = headless
+        self.size = size
+        self.max_uses = max_uses
+        self.max_queue = max_queue
+        self.acquire_timeout = acquire_timeout
+
+        self._idle: list[ContextLease] = []
+        self._semaphore = asyncio.Semaphore(size)
+        self._in_use = 0
+        self._waiting = 0
+
+        # -- counters --
+        self._created = 0
+        self._recycled = 0
+        self._acquired = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_last = 0.0
+        self._wait_max = 0.0
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[ContextLease]:
+        """
+        Waits for a free slot and lends a warm context
+
+        Raises:
+            BrowserPoolBusy: If the wait queue is full or the wait exceeds acquire_timeout.
+        """
+        if self._waiting + self._in_use >= self.size + self.max_queue:
+            self._rejected += 1
+            raise BrowserPoolBusy(f"Browser pool queue is full ({self._waiting} waiting).")
+
+        started = time.perf_counter()
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            raise BrowserPoolBusy(f"No browser context became free within {self.acquire_timeout}s.")
+        finally:
+            self._waiting -= 1
+        self._record_wait(time.perf_counter() - started)
+
+        try:
+            lease = await self._checkout()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        self._in_use += 1
+        try:
+            yield lease
+        except BaseException:
+            lease.discard()  # context state is unknown after a failure
+            raise
+        finally:
+            self._in_use -= 1
+            await self._checkin(lease)
+            self._semaphore.release()
+
+    async def warm_up(self) -> None:
+        """Fills the pool with `size` ready contexts"""
+        while len(self._idle) + self._in_use < self.size:
+            self._idle.append(await self._create())
+
+    async def close(self) -> None:
+        """Closes every idle context of the pool"""
+        idle, self._idle = self._idle, []
+        for lease in idle:
+            await self._close(lease)
+
+    def stats(self) -> dict:
+        """Returns pool size, queue depth and wait time figures"""
+        return {
+            'size': self.size,
+            'idle': len(self._idle),
+            'in_use': self._in_use,
+            'waiting': self._waiting,
+            'max_queue': self.max_queue,
+            'created': self._created,
+            'recycled': self._recycled,
+            'acquired': self._acquired,
+            'rejected': self._rejected,
+            'timeouts': self._timeouts,
+            'wait_ms_last': round(self._wait_last * 1000, 2),
+            'wait_ms_avg': round(self._wait_total / self._acquired * 1000, 2) if self._acquired else 0.0,
+            'wait_ms_max': round(self._wait_max * 1000, 2),
+        }
+
+    def _record_wait(self, waited: float) -> None:
+        self._acquired += 1
+        self._wait_total += waited
+        self._wait_last = waited
+        self._wait_max = max(self._wait_max, waited)
+
+    async def _create(self) -> ContextLease:
+        browser = await self._manager.get_browser(headless=self._headless)
+        context = await browser.new_context(**CONTEXT_OPTIONS)
+        self._created += 1
+        return ContextLease(context)
+
+    async def _checkout(self) -> ContextLease:
+        while self._idle:
+            lease = self._idle.pop()
+            if not lease.broken and lease.context.browser and lease.context.browser.is_connected():
+                return lease
+            await self._close(lease)
+        return await self._create()
+
+    async def _checkin(self, lease: ContextLease) -> None:
+        lease.uses += 1
+        await lease.release_pages()
+        if lease.broken or lease.uses >= self.max_uses:
+            await self._close(lease)
+        else:
+            self._idle.append(lease)
+
+    async def _close(self, lease: ContextLease) -> None:
+        self._recycled += 1
+        try:
+            await lease.context.close()
+        except Exception as e:
+            logging.debug(f"Error while closing pooled context: {e}")
+
 
 class BrowserManager():
-    """Playwright browser manager for controlling singleton instances of headless and headless false"""
+    """
+    Playwright browser manager for controlling singleton instances of headless and headless false.
+
+    The headless browser is launched locally unless BROWSER_WS_ENDPOINT or BROWSER_CDP_ENDPOINT
+    is set, in which case every worker process connects to that one shared browser and only
+    keeps its own contexts. The visible (debug) browser is always launched locally.
+    """
     _instance = None
     _playwright: Playwright | None = None
     _headless_browser: Browser | None = None
     _visible_browser: Browser | None = None
+    _pools: dict[bool, ContextPool] = {}
     _lock = asyncio.Lock()
+    _warm_up_task: asyncio.Task | None = None
+    _start_seconds: float | None = None
 
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
-    
+
+    @property
+    def mode(self) -> str:
+        """How the headless browser is obtained: 'launch', 'server' or 'cdp'"""
+        if config.BROWSER_WS_ENDPOINT:
+            return "server"
+        if config.BROWSER_CDP_ENDPOINT:
+            return "cdp"
+        return "launch"
+
     async def get_browser(self, headless: bool = True) -> Browser:
         """Returns a singleton browser instance based on headless parameter"""
 
         async with self._lock:
             if self._playwright is None:
                 self._playwright = await async_playwright().start()
-            
+
             if headless:
-                if self._headless_browser is None:
-                    self._headless_browser = await self._playwright.chromium.launch(headless=True)
+                if self._headless_browser is None or not self._headless_browser.is_connected():
+                    self._headless_browser = await self._start_browser(headless=True)
                 return self._headless_browser
             else:
-                if self._visible_browser is None:
-                    self._visible_browser = await self._playwright.chromium.launch(headless=False)
+                if self._visible_browser is None or not self._visible_browser.is_connected():
+                    self._visible_browser = await self._start_browser(headless=False)
                 return self._visible_browser
-            
+
+    async def _start_browser(self, headless: bool) -> Browser:
+        """Launches Chromium or connects to the shared browser"""
+        started = time.perf_counter()
+        mode = self.mode if headless else "launch"
+        if mode == "server":
+            browser = await self._playwright.chromium.connect(config.BROWSER_WS_ENDPOINT)
+        elif mode == "cdp":
+            browser = await self._playwright.chromium.connect_over_cdp(config.BROWSER_CDP_ENDPOINT)
+        else:
+            browser = await self._playwright.chromium.launch(headless=headless)
+        elapsed = time.perf_counter() - started
+        if headless:
+            self._start_seconds = elapsed
+        logging.info(f"Browser ready ({mode}, headless={headless}) in {elapsed:.2f}s.")
+        return browser
+
+    def pool(self, headless: bool = True) -> ContextPool:
+        """Returns the context pool of the headless or visible browser"""
+        if headless not in self._pools:
+            self._pools[headless] = ContextPool(
+                manager=self,
+                headless=headless,
+                size=config.BROWSER_POOL_SIZE,
+                max_uses=config.BROWSER_POOL_MAX_USES,
+                max_queue=config.BROWSER_POOL_MAX_QUEUE,
+                acquire_timeout=config.BROWSER_POOL_ACQUIRE_TIMEOUT,
+            )
+        return self._pools[headless]
+
+    def lease(self, headless: bool = True):
+        """Lends a pooled context, see ContextPool.lease"""
+        return self.pool(headless).lease()
+
+    async def new_context(self, headless: bool = True, **options) -> BrowserContext:
+        """
+        Creates a dedicated context outside the pool, the caller must close it
+
+        Args:
+            headless (bool): Browser to open the context in.
+            **options: Overrides of CONTEXT_OPTIONS.
+        """
+        browser = await self.get_browser(headless=headless)
+        return await browser.new_context(**{**CONTEXT_OPTIONS, **options})
+
+    @asynccontextmanager
+    async def dedicated(self, headless: bool = True, **options) -> AsyncIterator[ContextLease]:
+        """
+        Lends a fresh context outside the pool and closes it afterwards
+
+        Used when a scrape needs its own context options (e.g. record_har_path, which is
+        written when the context closes). Does not count against BROWSER_POOL_SIZE.
+        """
+        lease = ContextLease(await self.new_context(headless=headless, **options))
+        try:
+            yield lease
+        finally:
+            await lease.context.close()
+
+    async def warm_up(self, headless: bool = True) -> None:
+        """Launches the browser and pre-creates its pooled contexts"""
+        await self.get_browser(headless=headless)
+        if config.BROWSER_POOL_PREWARM:
+            await self.pool(headless).warm_up()
+
+    async def start(self, headless: bool = True) -> None:
+        """
+        Starts the browser according to BROWSER_STARTUP
+
+        'eager' warms up before returning, 'background' warms up in a task so the app
+        can serve the HTTP endpoints meanwhile, 'lazy' leaves it to the first scrape.
+        """
+        if config.BROWSER_STARTUP == "lazy":
+            return
+        if config.BROWSER_STARTUP == "background":
+            self._warm_up_task = asyncio.create_task(self._warm_up_quietly(headless))
+            return
+        await self.warm_up(headless=headless)
+
+    async def _warm_up_quietly(self, headless: bool) -> None:
+        try:
+            await self.warm_up(headless=headless)
+        except Exception as e:
+            # the first scrape retries the launch and reports the error to its caller
+            logging.error(f"Background browser warm-up failed: {e}")
+
+    def info(self) -> dict:
+        """Returns how the browser is started and whether it is up"""
+        browser = self._headless_browser
+        return {
+            'mode': self.mode,
+            'startup': config.BROWSER_STARTUP,
+            'connected': browser is not None and browser.is_connected(),
+            'warming_up': self._warm_up_task is not None and not self._warm_up_task.done(),
+            'start_ms': round(self._start_seconds * 1000, 2) if self._start_seconds is not None else None,
+        }
+
+    def stats(self) -> dict:
+        """Returns context pool statistics per browser mode"""
+        return {
+            ('headless' if headless else 'visible'): pool.stats()
+            for headless, pool in self._pools.items()
+        }
+
     async def stop_engine(self) -> None:
         """Closes all browser instances and stops playwright"""
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+            await asyncio.gather(self._warm_up_task, return_exceptions=True)
+            self._warm_up_task = None
+
+        for pool in self._pools.values():
+            await pool.close()
+        self._pools.clear()
+
         async with self._lock:
+            # a connected shared browser is only disconnected from, it keeps serving other workers
             if self._headless_browser:
                 await self._headless_browser.close()
                 self._headless_browser = None
-            
+
             if self._visible_browser:
                 await self._visible_browser.close()
                 self._visible_browser = None
-            
+
             if self._playwright:
                 await self._playwright.stop()
                 self._playwright = None
 
-browser_manager = BrowserManager()
\ No newline at end of file
+browser_manager = BrowserManager()
@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+
+@dataclass
+class _Entry:
+    value: Any
+    stored_at: float
+
+
+class TTLCache:
+    """
+    In-memory async cache with TTL, LRU eviction, stale-while-revalidate and request coalescing.
+
+    - Entries younger than `ttl` are served as hits.
+    - Entries younger than `ttl + stale_ttl` are served stale while one background reload refreshes them.
+    - Concurrent misses for the same key share a single loader call.
+    - At most `max_size` entries are kept; the least recently used one is evicted first.
+
+    Attributes:
+        name (str): Cache name used in logs and stats.
+        ttl (float): Seconds an entry is fresh.
+        stale_ttl (float): Extra seconds an expired entry may be served while it is refreshed.
+        max_size (int): Maximum number of entries.
+        cache_if (Callable[[Any], bool]): Decides whether a loaded value is stored (empty results are not).
+    """
+
+    def __init__(self, name: str, ttl: float, stale_ttl: float, max_size: int,
+                 cache_if: Callable[[Any], bool] = bool) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_size = max_size
+        self.cache_if = cache_if
+
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+        # -- counters --
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._refreshes = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._load_errors = 0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]], force: bool = False) -> Any:
+        """
+        Returns the cached value for `key`, calling `loader` on a miss
+
+        Args:
+            key (Hashable): Cache key.
+            loader (Callable[[], Awaitable[Any]]): Coroutine factory producing the value.
+            force (bool): Skip the cached value and reload (still coalesced with other loads).
+
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and not force:
+            age = time.monotonic() - entry.stored_at
+            if age <= self.ttl:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if age <= self.ttl + self.stale_ttl:
+                self._stale_hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._inflight:
+                    self._refreshes += 1
+                    self._start_load(key, loader)
+                return entry.value
+            del self._entries[key]
+            self._expirations += 1
+
+        if key in self._inflight:
+            self._coalesced += 1
+        else:
+            self._misses += 1
+        # shield: a caller that goes away must not cancel the load the others are waiting for
+        return await asyncio.shield(self._start_load(key, loader))
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drops the entry for `key` if present"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops every entry"""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Returns size and hit/miss/eviction counters"""
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'ttl': self.ttl,
+            'stale_ttl': self.stale_ttl,
+            'hits': self._hits,
+            'stale_hits': self._stale_hits,
+            'misses': self._misses,
+            'coalesced': self._coalesced,
+            'refreshes': self._refreshes,
+            'evictions': self._evictions,
+            'expirations': self._expirations,
+            'load_errors': self._load_errors,
+            'inflight': len(self._inflight),
+        }
+
+    def _start_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fill(key, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_load(key, done))
+        return task
+
+    async def _fill(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await loader()
+        if self.cache_if(value):
+            self._entries[key] = _Entry(value=value, stored_at=time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def _finish_load(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            self._load_errors += 1
+            logging.warning(f"{self.name} cache load for {key!r} failed: {task.exception()}")
@@ -0,0 +1,185 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Reads a boolean flag from the environment ('1', 'true', 'yes', 'on' are truthy)"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# -- Target site --
+# Root URL of the scraped site; point it at benchmarks/standin_server.py for offline runs
+KINORIUM_BASE_URL = os.getenv("KINORIUM_BASE_URL", "https://ua.kinorium.com").rstrip("/")
+
+# -- Browser context pool --
+# Number of warm browser contexts (and so the number of concurrent Playwright scrapes) per browser
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "4"))
+# A context is closed and replaced after this many leases
+BROWSER_POOL_MAX_USES = int(os.getenv("BROWSER_POOL_MAX_USES", "50"))
+# Callers allowed to wait for a free context before new ones are rejected
+BROWSER_POOL_MAX_QUEUE = int(os.getenv("BROWSER_POOL_MAX_QUEUE", "32"))
+# Seconds a caller waits for a free context before giving up
+BROWSER_POOL_ACQUIRE_TIMEOUT = float(os.getenv("BROWSER_POOL_ACQUIRE_TIMEOUT", "30"))
+# Create all pool contexts at startup instead of on first use
+BROWSER_POOL_PREWARM = _env_bool("BROWSER_POOL_PREWARM", True)
+
+# -- Browser startup --
+# When the headless browser starts: 'eager' (before serving), 'background' (warmed up after startup) or 'lazy' (first scrape)
+BROWSER_STARTUP = os.getenv("BROWSER_STARTUP", "eager").strip().lower()
+# Connect to a shared Playwright browser server (`playwright run-server`) instead of launching Chromium
+BROWSER_WS_ENDPOINT = os.getenv("BROWSER_WS_ENDPOINT", "")
+# Connect to a running Chromium over the DevTools protocol (e.g. http://browser:9222) instead of launching one
+BROWSER_CDP_ENDPOINT = os.getenv("BROWSER_CDP_ENDPOINT", "")
+
+# -- Request interception --
+# Default resource policy of Playwright scrapes: 'full', 'no-media' or 'text-only'
+ROUTE_POLICY = os.getenv("ROUTE_POLICY", "no-media")
+
+# -- Bulk crawl --
+# Default and maximum number of filmList pages fetched at the same time by one crawl
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "4"))
+CRAWL_MAX_CONCURRENCY = int(os.getenv("CRAWL_MAX_CONCURRENCY", "16"))
+# Safety cap on pages per genre when crawling "until empty"
+CRAWL_MAX_PAGES = int(os.getenv("CRAWL_MAX_PAGES", "500"))
+
+# -- filmList response cache --
+# Seconds a cached (genre, page, per_page) result is fresh, and how long after that it may be served stale
+LIST_CACHE_TTL = float(os.getenv("LIST_CACHE_TTL", "300"))
+LIST_CACHE_STALE_TTL = float(os.getenv("LIST_CACHE_STALE_TTL", "600"))
+# Maximum number of cached pages (least recently used are evicted)
+LIST_CACHE_MAX_SIZE = int(os.getenv("LIST_CACHE_MAX_SIZE", "512"))
+
+# -- Movie detail cache --
+# Seconds a scraped movie detail is served from memory (0 keeps only the sharing of in-flight scrapes)
+DETAIL_CACHE_TTL = float(os.getenv("DETAIL_CACHE_TTL", "900"))
+# Extra seconds an expired detail may be served while it is re-scraped in the background
+DETAIL_CACHE_STALE_TTL = float(os.getenv("DETAIL_CACHE_STALE_TTL", "0"))
+# Maximum number of cached titles (least recently used are evicted)
+DETAIL_CACHE_MAX_SIZE = int(os.getenv("DETAIL_CACHE_MAX_SIZE", "256"))
+
+# -- Catalogue store --
+# Persist scrape results (SQLite by default; PostgreSQL and SQLite upsert natively, other SQLAlchemy URLs use a slower portable upsert)
+CATALOGUE_ENABLED = _env_bool("CATALOGUE_ENABLED", True)
+CATALOGUE_DB_URL = os.getenv("CATALOGUE_DB_URL", "sqlite:///./kinorium.db")
+# Rows written per bulk statement
+CATALOGUE_BATCH_SIZE = int(os.getenv("CATALOGUE_BATCH_SIZE", "500"))
+# Default max-age in seconds for serving endpoints from the store; 0 always scrapes
+CATALOGUE_MAX_AGE = int(os.getenv("CATALOGUE_MAX_AGE", "0"))
+
+# -- filmList parsing --
+# Parser backend for filmList HTML: 'lxml' (precompiled XPath) or 'bs4' (BeautifulSoup reference)
+FILM_LIST_PARSER = os.getenv("FILM_LIST_PARSER", "lxml")
+
+# -- Parse worker pool --
+# Where filmList and detail page HTML is parsed: 'thread', 'process' or 'inline' (on the event loop)
+PARSE_EXECUTOR = os.getenv("PARSE_EXECUTOR", "thread")
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "2"))
+# Parse jobs allowed to wait for a worker; further callers wait on the event loop
+PARSE_MAX_QUEUE = int(os.getenv("PARSE_MAX_QUEUE", "64"))
+# Payloads shorter than this many characters are parsed inline, dispatch is not worth it
+PARSE_INLINE_THRESHOLD = int(os.getenv("PARSE_INLINE_THRESHOLD", "20000"))
+
+# -- HTTP client --
+# Connection pool: total connections, connections per host, idle keep-alive seconds, DNS cache seconds
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+HTTP_LIMIT_PER_HOST = int(os.getenv("HTTP_LIMIT_PER_HOST", "20"))
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+HTTP_DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+# Default timeout budget of a request in seconds (whole request, connect, and between reads)
+HTTP_TOTAL_TIMEOUT = float(os.getenv("HTTP_TOTAL_TIMEOUT", "30"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "20"))
+# Token bucket per host: steady requests/second (0 disables), burst size and the floor adaptive backoff may reach
+HTTP_RATE_LIMIT = float(os.getenv("HTTP_RATE_LIMIT", "5"))
+HTTP_RATE_BURST = int(os.getenv("HTTP_RATE_BURST", "10"))
+HTTP_RATE_MIN = float(os.getenv("HTTP_RATE_MIN", "0.5"))
+# Longest pause in seconds after a 429/503, also the cap of Retry-After
+HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "60"))
+
+# -- Kinorium credentials --
+# Seed cookie/UA set of the HTTP scraper, copied from a browser session (see README)
+SESSION = os.getenv("SESSION", "1u2j4mf7a3i0i3d9h83rfb8a44")
+X119 = os.getenv("X119", "88513")
+PHPSESSID = os.getenv("PHPSESSID", "pj95efe3eommbikt25idka2osn")
+USER_AGENT = os.getenv("USER_AGENT", "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:146.0) Gecko/20100101 Firefox/146.0")
+# Optional JSON file with more sets: [{"session": ..., "x119": ..., "phpsessid": ..., "user_agent": ...}, ...]
+CREDENTIALS_FILE = os.getenv("CREDENTIALS_FILE", "")
+# Healthy sets the pool keeps; below this a rejected session triggers minting with the browser (0 disables minting)
+CREDENTIAL_POOL_MIN = int(os.getenv("CREDENTIAL_POOL_MIN", "2"))
+# Consecutive failures after which a set is benched, and seconds before a benched seed set is retried
+CREDENTIAL_MAX_FAILURES = int(os.getenv("CREDENTIAL_MAX_FAILURES", "2"))
+CREDENTIAL_RETRY_AFTER = float(os.getenv("CREDENTIAL_RETRY_AFTER", "600"))
+# Sets tried per request before a scrape gives up
+CREDENTIAL_ATTEMPTS = int(os.getenv("CREDENTIAL_ATTEMPTS", "2"))
+
+# -- Background jobs --
+# Jobs executed at the same time (defaults to the browser pool size, so jobs never queue for a context)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", str(BROWSER_POOL_SIZE)))
+# Jobs allowed to wait for a worker before submissions are rejected
+JOB_MAX_QUEUE = int(os.getenv("JOB_MAX_QUEUE", "1000"))
+# Titles accepted by one batch submission
+JOB_MAX_BATCH = int(os.getenv("JOB_MAX_BATCH", "100"))
+# Seconds a finished job and its result are kept
+JOB_RESULT_TTL = float(os.getenv("JOB_RESULT_TTL", "3600"))
+
+# -- Streaming filmList parsing --
+# Bytes read from the response per step of /scraper/http/stream
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", "16384"))
+
+# -- Title resolution index --
+# Remember which detail URL a title resolves to, so detail scrapes can skip the search page
+TITLE_INDEX_ENABLED = _env_bool("TITLE_INDEX_ENABLED", True)
+TITLE_INDEX_PATH = os.getenv("TITLE_INDEX_PATH", "./title_index.json")
+# Titles kept (oldest entries are dropped first)
+TITLE_INDEX_MAX_SIZE = int(os.getenv("TITLE_INDEX_MAX_SIZE", "200000"))
+# Seconds between writes of a changed index to disk
+TITLE_INDEX_FLUSH_INTERVAL = float(os.getenv("TITLE_INDEX_FLUSH_INTERVAL", "30"))
+
+# -- Upstream health --
+# Seconds between background health probes of the site (0 probes only when /health is called)
+UPSTREAM_PROBE_INTERVAL = float(os.getenv("UPSTREAM_PROBE_INTERVAL", "30"))
+UPSTREAM_PROBE_TIMEOUT = float(os.getenv("UPSTREAM_PROBE_TIMEOUT", "10"))
+# Fail scrapes fast while the site is down instead of waiting for timeouts
+UPSTREAM_BREAKER_ENABLED = _env_bool("UPSTREAM_BREAKER_ENABLED", True)
+# Consecutive failures (connection errors, timeouts, 5xx/403, anti-bot pages, failed probes) that open the circuit
+UPSTREAM_FAILURE_THRESHOLD = int(os.getenv("UPSTREAM_FAILURE_THRESHOLD", "5"))
+# Seconds the circuit stays open before trial requests are let through
+UPSTREAM_RESET_TIMEOUT = float(os.getenv("UPSTREAM_RESET_TIMEOUT", "30"))
+# Requests let through at a time while half-open
+UPSTREAM_HALF_OPEN_TRIALS = int(os.getenv("UPSTREAM_HALF_OPEN_TRIALS", "2"))
+
+# -- Page readiness (Playwright) --
+# Navigation event waited for before the stage selectors: 'domcontentloaded' (default), 'load' or 'commit'
+NAVIGATION_WAIT_UNTIL = os.getenv("NAVIGATION_WAIT_UNTIL", "domcontentloaded")
+# Seconds a page navigation may take
+NAVIGATION_TIMEOUT = float(os.getenv("NAVIGATION_TIMEOUT", "30"))
+# Seconds each stage waits for its selectors (a search without results waits the full READY_TIMEOUT_SEARCH)
+READY_TIMEOUT_SEARCH = float(os.getenv("READY_TIMEOUT_SEARCH", "3"))
+READY_TIMEOUT_DETAIL = float(os.getenv("READY_TIMEOUT_DETAIL", "10"))
+READY_TIMEOUT_CAST = float(os.getenv("READY_TIMEOUT_CAST", "10"))
+# Seconds the visible debug browser stays on the page before the context is returned (0 = no pause)
+DEBUG_HOLD_SECONDS = float(os.getenv("DEBUG_HOLD_SECONDS", "5"))
+
+# -- Profiling (profile=true on the scraper endpoints) --
+# Directory profile reports, cProfile stats, Playwright traces and HAR files are written to
+PROFILE_DIR = os.getenv("PROFILE_DIR", "./profiles")
+# Functions and allocation sites listed in the text reports
+PROFILE_TOP = int(os.getenv("PROFILE_TOP", "30"))
+
+# -- Exports --
+# Directory export files are written to (one subdirectory per export)
+EXPORT_DIR = os.getenv("EXPORT_DIR", "./exports")
+# Rows buffered per table before they are appended to its file
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+# Detail scrapes in flight while an export includes movie details
+EXPORT_DETAIL_CONCURRENCY = int(os.getenv("EXPORT_DETAIL_CONCURRENCY", "4"))
+# Parquet compression codec (zstd, snappy, gzip or none)
+EXPORT_PARQUET_COMPRESSION = os.getenv("EXPORT_PARQUET_COMPRESSION", "zstd")
+# Exports running at the same time (separate from JOB_WORKERS), and exports allowed to wait
+EXPORT_WORKERS = int(os.getenv("EXPORT_WORKERS", "1"))
+EXPORT_MAX_QUEUE = int(os.getenv("EXPORT_MAX_QUEUE", "10"))
@@ -0,0 +1,228 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from app.core import config
+from app.core.browser import browser_manager, CONTEXT_OPTIONS
+
+# Page visited to obtain a fresh anonymous session, the filmList handler is called from it
+MINT_PAGE = f"{config.KINORIUM_BASE_URL}/R2D2/"
+# Attempts of one background refresh before it gives up until the next failure
+MINT_ATTEMPTS = 3
+
+
+class CredentialsExhausted(RuntimeError):
+    """Raised when every credential set tried for a request was rejected or throttled"""
+
+
+@dataclass(eq=False)
+class Credential:
+    """
+    One cookie/User-Agent set of the HTTP scrapers.
+
+    Attributes:
+        source (str): 'env', 'file' or 'minted'.
+        failures (int): Consecutive failed requests.
+        benched_at (float | None): Monotonic time the set was taken out of rotation.
+    """
+    session: str
+    x119: str
+    phpsessid: str
+    user_agent: str
+    source: str = "env"
+    uses: int = 0
+    failures: int = 0
+    benched_at: float | None = None
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def cookies(self) -> dict:
+        return {
+            "session": self.session,
+            "x119": self.x119,
+            "PHPSESSID": self.phpsessid
+        }
+
+    @property
+    def healthy(self) -> bool:
+        return self.benched_at is None
+
+
+class CredentialPool:
+    """
+    Rotating pool of kinorium session cookies for the HTTP scrapers.
+
+    Requests take sets round-robin and report back whether the session was accepted.
+    A set failing CREDENTIAL_MAX_FAILURES times in a row is benched: minted sets are
+    dropped, seed sets (env / CREDENTIALS_FILE) get another chance after
+    CREDENTIAL_RETRY_AFTER seconds. When a session is rejected and fewer than
+    CREDENTIAL_POOL_MIN sets are healthy, new ones are minted in the background by opening
+    /R2D2/ in the browser. Nothing is minted before the first rejection, so HTTP-only
+    deployments never start a browser while their seed sets work. A refresh that gives up
+    pauses minting for CREDENTIAL_RETRY_AFTER seconds.
+    """
+
+    def __init__(self) -> None:
+        self._credentials: list[Credential] = self._load_seeds()
+        self._next = 0
+        self._refresh_task: asyncio.Task | None = None
+        self._mint_paused_until = 0.0
+
+        # -- counters --
+        self._minted = 0
+        self._mint_failures = 0
+        self._benched = 0
+
+    def acquire(self) -> Credential:
+        """
+        Returns the next healthy set (round-robin)
+
+        When every set is benched the one benched longest ago is returned, so requests
+        keep trying while a refresh is in progress.
+        """
+        self._revive()
+        healthy = [credential for credential in self._credentials if credential.healthy]
+        if healthy:
+            credential = healthy[self._next % len(healthy)]
+            self._next += 1
+        else:
+            credential = min(self._credentials, key=lambda c: c.benched_at)
+        credential.uses += 1
+        return credential
+
+    def report_success(self, credential: Credential) -> None:
+        """The session was accepted"""
+        credential.failures = 0
+        credential.benched_at = None
+
+    def report_failure(self, credential: Credential, reason: str) -> None:
+        """
+        The session was rejected or served no data
+
+        Args:
+            credential (Credential): Set used for the request.
+            reason (str): Short description for the log.
+        """
+        credential.failures += 1
+        if credential.healthy and credential.failures >= config.CREDENTIAL_MAX_FAILURES:
+            logging.warning(f"Benching {credential.source} session {credential.session[:6]}…: {reason}")
+            self._benched += 1
+            # benched first: requests still holding the set report it again, and must not remove it twice
+            credential.benched_at = time.monotonic()
+            if credential.source == "minted" and credential in self._credentials:
+                self._credentials.remove(credential)  # minted sets are never revived
+        self._schedule_refresh()
+
+    async def stop(self) -> None:
+        """Cancels a running background refresh"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+            self._refresh_task = None
+
+    def stats(self) -> dict:
+        """Returns the size and health of the pool"""
+        return {
+            'total': len(self._credentials),
+            'healthy': sum(1 for credential in self._credentials if credential.healthy),
+            'min_healthy': config.CREDENTIAL_POOL_MIN,
+            'refreshing': self._refresh_task is not None and not self._refresh_task.done(),
+            'minted': self._minted,
+            'mint_failures': self._mint_failures,
+            'benched': self._benched,
+            'credentials': [
+                {
+                    'source': credential.source,
+                    'healthy': credential.healthy,
+                    'uses': credential.uses,
+                    'failures': credential.failures,
+                }
+                for credential in self._credentials
+            ],
+        }
+
+    # -- internals --
+
+    def _load_seeds(self) -> list[Credential]:
+        seeds = [Credential(config.SESSION, config.X119, config.PHPSESSID, config.USER_AGENT, source="env")]
+        if not config.CREDENTIALS_FILE:
+            return seeds
+        try:
+            with open(config.CREDENTIALS_FILE, encoding="utf-8") as file:
+                entries = json.load(file)
+            for entry in entries:
+                seeds.append(Credential(
+                    session=entry["session"],
+                    x119=entry.get("x119", ""),
+                    phpsessid=entry["phpsessid"],
+                    user_agent=entry.get("user_agent", config.USER_AGENT),
+                    source="file",
+                ))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.error(f"Could not load credentials from {config.CREDENTIALS_FILE}: {e}")
+        return seeds
+
+    def _revive(self) -> None:
+        """Puts seed sets benched longer than CREDENTIAL_RETRY_AFTER back into rotation"""
+        now = time.monotonic()
+        for credential in self._credentials:
+            if credential.benched_at is not None and now - credential.benched_at >= config.CREDENTIAL_RETRY_AFTER:
+                credential.benched_at = None
+                credential.failures = 0
+
+    def _schedule_refresh(self) -> None:
+        if config.CREDENTIAL_POOL_MIN <= 0 or time.monotonic() < self._mint_paused_until:
+            return
+        healthy = sum(1 for credential in self._credentials if credential.healthy)
+        if healthy >= config.CREDENTIAL_POOL_MIN:
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+
+    async def _refresh(self) -> None:
+        """Mints sets until CREDENTIAL_POOL_MIN are healthy; after MINT_ATTEMPTS failures minting pauses"""
+        attempts = 0
+        while attempts < MINT_ATTEMPTS:
+            healthy = sum(1 for credential in self._credentials if credential.healthy)
+            if healthy >= config.CREDENTIAL_POOL_MIN:
+                return
+            try:
+                credential = await self._mint()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                attempts += 1
+                self._mint_failures += 1
+                logging.warning(f"Could not mint a kinorium session (attempt {attempts}): {e}")
+                await asyncio.sleep(2 ** attempts)
+                continue
+            self._credentials.append(credential)
+            self._minted += 1
+            logging.info("Minted a fresh kinorium session.")
+
+        self._mint_paused_until = time.monotonic() + config.CREDENTIAL_RETRY_AFTER
+        logging.warning(f"Could not mint a kinorium session, next try in {config.CREDENTIAL_RETRY_AFTER}s.")
+
+    async def _mint(self) -> Credential:
+        """Opens /R2D2/ in a fresh browser context and takes over its cookies"""
+        context = await browser_manager.new_context(headless=True)
+        try:
+            page = await context.new_page()
+            await page.goto(MINT_PAGE, wait_until="domcontentloaded")
+            cookies = {cookie['name']: cookie['value'] for cookie in await context.cookies(MINT_PAGE)}
+        finally:
+            await context.close()
+
+        if not cookies.get("session") or not cookies.get("PHPSESSID"):
+            raise RuntimeError(f"no session cookies were set (got {sorted(cookies)})")
+        return Credential(
+            session=cookies["session"],
+            x119=cookies.get("x119", ""),
+            phpsessid=cookies["PHPSESSID"],
+            user_agent=CONTEXT_OPTIONS["user_agent"],
+            source="minted",
+        )
+
+
+credential_pool = CredentialPool()
@@ -0,0 +1,28 @@
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from app.core import config
+
+
+class Base(DeclarativeBase):
+    """Declarative base of the catalogue tables"""
+
+
+engine = create_engine(config.CATALOGUE_DB_URL)
+SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, _) -> None:
+        # WAL lets readers run while a crawl is writing
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
+def init_db() -> None:
+    """Creates missing catalogue tables"""
+    from app.models import catalogue  # noqa: F401  registers the models on Base
+
+    Base.metadata.create_all(bind=engine)
@@ -1,18 +1,163 @@
+import asyncio
 import aiohttp
-from typing import AsyncContextManager
+import math
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, AsyncIterator
+from urllib.parse import urlsplit
+from app.core import config
+
+if TYPE_CHECKING:
+    from app.core.upstream import CircuitBreaker
+
+# Statuses that mean the upstream wants us to slow down
+THROTTLE_STATUSES = (429, 503)
+
+
+class UpstreamBlocked(Exception):
+    """
+    Raised by a caller inside a `get()` block when the response is an anti-bot or rejected-session
+    page; the circuit breaker counts the request as a failure
+    """
+
+
+class HostRateLimiter:
+    """
+    Token bucket for a single host with adaptive backoff.
+
+    A 429/503 response halves the refill rate (down to `min_rate`) and pauses the host
+    for Retry-After (seconds or an HTTP date), or an exponential backoff when the header
+    is missing or invalid. Either pause is capped at `backoff_max`.
+    Each successful response then restores a tenth of the configured rate.
+    """
+
+    def __init__(self, rate: float, burst: int, min_rate: float, backoff_max: float) -> None:
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.backoff_max = backoff_max
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._consecutive_throttles = 0
+        self._lock = asyncio.Lock()
+
+        # -- counters --
+        self._requests = 0
+        self._throttled = 0
+        self._waited = 0.0
+
+    async def acquire(self) -> None:
+        """Waits until a request to the host is allowed"""
+        started = time.monotonic()
+        async with self._lock:  # waiters are served in arrival order
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+        self._requests += 1
+        self._waited += time.monotonic() - started
+
+    def feedback(self, status: int, retry_after: str | None = None) -> None:
+        """Adapts the rate to the response status"""
+        if status in THROTTLE_STATUSES:
+            self._throttled += 1
+            self._consecutive_throttles += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+
+            delay = _parse_retry_after(retry_after)
+            if delay is None:
+                delay = 2 ** (self._consecutive_throttles - 1)
+            self._blocked_until = max(self._blocked_until, time.monotonic() + min(self.backoff_max, delay))
+            self._tokens = 0.0
+
+        elif status < 500:
+            self._consecutive_throttles = 0
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+    def stats(self) -> dict:
+        return {
+            'rate': round(self.rate, 3),
+            'max_rate': self.max_rate,
+            'tokens': round(self._tokens, 2),
+            'paused_for': round(max(0.0, self._blocked_until - time.monotonic()), 2),
+            'requests': self._requests,
+            'throttled': self._throttled,
+            'wait_seconds': round(self._waited, 3),
+        }
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds a Retry-After header asks to wait, None when it is missing or invalid"""
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            return None  # HTTP dates are always GMT; a naive one is malformed
+        delay = max(0.0, retry_at.timestamp() - time.time())  # a date in the past means now
+    if not math.isfinite(delay) or delay < 0:
+        return None
+    return delay
+
 
 class HTTPClient:
     """A singleton HTTP client using aiohttp.ClientSession for the entire project."""
 
     def __init__(self):
         self._session: aiohttp.ClientSession | None = None
+        self._limiters: dict[str, HostRateLimiter] = {}
 
-    async def start(self):
-        """Creates ClientSession for aiohttp for full project"""
+    async def start(
+            self,
+            limit: int | None = None,
+            limit_per_host: int | None = None,
+            keepalive_timeout: float | None = None,
+            ttl_dns_cache: int | None = None
+    ):
+        """
+        Creates ClientSession for aiohttp for full project
+
+        Connection pool options default to the HTTP_* settings.
+
+        Args:
+            limit (int | None): Total simultaneous connections.
+            limit_per_host (int | None): Simultaneous connections per host.
+            keepalive_timeout (float | None): Seconds an idle connection is kept.
+            ttl_dns_cache (int | None): Seconds DNS answers are cached.
+        """
         if self._session is not None:
             return
-        
-        self._session = aiohttp.ClientSession()
+
+        connector = aiohttp.TCPConnector(
+            limit=limit if limit is not None else config.HTTP_POOL_LIMIT,
+            limit_per_host=limit_per_host if limit_per_host is not None else config.HTTP_LIMIT_PER_HOST,
+            keepalive_timeout=keepalive_timeout if keepalive_timeout is not None else config.HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=ttl_dns_cache if ttl_dns_cache is not None else config.HTTP_DNS_CACHE_TTL,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=config.HTTP_TOTAL_TIMEOUT,
+            connect=config.HTTP_CONNECT_TIMEOUT,
+            sock_read=config.HTTP_READ_TIMEOUT,
+        )
+        self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
 
     async def stop(self):
         """Closes ClientSession for aiohttp for full project"""
@@ -20,12 +165,105 @@ class HTTPClient:
             await self._session.close()
             self._session = None
 
-    def get(self, url: str, **kwargs) -> AsyncContextManager[aiohttp.ClientResponse]:
-        """Performs a GET request using the aiohttp ClientSession"""
+    @asynccontextmanager
+    async def get(
+            self,
+            url: str,
+            timeout: float | aiohttp.ClientTimeout | None = None,
+            breaker: "CircuitBreaker | None" = None,
+            **kwargs
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Performs a GET request using the aiohttp ClientSession
+
+        The request first waits for the host's rate limiter, and the response
+        status is fed back to it.
+
+        Args:
+            url (str): Request URL.
+            timeout (float | ClientTimeout | None): Budget for this call; a number is the
+                total seconds, None keeps the session defaults.
+            breaker (CircuitBreaker | None): Circuit breaker that must admit the request and
+                is told its outcome once the block is left: the status, a connection error or
+                timeout (also while reading the body), or UpstreamBlocked raised by the caller.
+            **kwargs: Passed to aiohttp (params, headers, cookies, ...).
+
+        Raises:
+            UpstreamUnavailable: When the breaker does not admit the request.
+        """
         if self._session is None:
             raise RuntimeError("HTTPClient session is not started.")
-        
-        return self._session.get(url, **kwargs)
+
+        if isinstance(timeout, (int, float)):
+            timeout = aiohttp.ClientTimeout(
+                total=timeout,
+                connect=min(timeout, config.HTTP_CONNECT_TIMEOUT),
+                sock_read=min(timeout, config.HTTP_READ_TIMEOUT),
+            )
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+
+        if breaker is not None:
+            breaker.admit()
+        reported = breaker is None
+        status = None
+        try:
+            limiter = self._limiter_for(url)
+            if limiter:
+                await limiter.acquire()
+
+            async with self._session.get(url, **kwargs) as response:
+                if limiter:
+                    limiter.feedback(response.status, response.headers.get("Retry-After"))
+                status = response.status
+                yield response
+        except UpstreamBlocked as e:
+            if not reported:
+                breaker.record_failure(f"{url}: {e}")
+                reported = True
+            raise
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            # also raised while the caller reads the body: a dropped or stalled response
+            if not reported:
+                breaker.record_failure(f"{url}: {e.__class__.__name__}")
+                reported = True
+            raise
+        except Exception:
+            # the caller gave up on the response for its own reasons, its status still counts
+            if not reported and status is not None:
+                breaker.record_status(status)
+                reported = True
+            raise
+        else:
+            if not reported:
+                breaker.record_status(status)
+                reported = True
+        finally:
+            if not reported:
+                breaker.release()
+
+    def stats(self) -> dict:
+        """Returns connection pool settings and per-host rate limiter state"""
+        connector = self._session.connector if self._session else None
+        return {
+            'started': self._session is not None,
+            'limit': connector.limit if connector else None,
+            'limit_per_host': connector.limit_per_host if connector else None,
+            'hosts': {host: limiter.stats() for host, limiter in self._limiters.items()},
+        }
+
+    def _limiter_for(self, url: str) -> HostRateLimiter | None:
+        if config.HTTP_RATE_LIMIT <= 0:
+            return None
+        host = urlsplit(url).netloc
+        if host not in self._limiters:
+            self._limiters[host] = HostRateLimiter(
+                rate=config.HTTP_RATE_LIMIT,
+                burst=config.HTTP_RATE_BURST,
+                min_rate=config.HTTP_RATE_MIN,
+                backoff_max=config.HTTP_BACKOFF_MAX,
+            )
+        return self._limiters[host]
 
     
-http_client = HTTPClient()
\ No newline at end of file
+http_client = HTTPClient()
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+from app.core import config
+
+# Job lifecycle states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class JobQueueFull(RuntimeError):
+    """Raised when a submission would exceed JOB_MAX_QUEUE waiting jobs"""
+
+
+class JobFailed(Exception):
+    """Raised by a job function to finish the job as failed with a message"""
+
+
+@dataclass(eq=False)
+class Job:
+    """
+    One unit of background work.
+
+    Attributes:
+        id (str): Identifier handed to the client.
+        label (str): What the job works on (e.g. the movie title).
+        status (str): queued, running, done or failed.
+        result (Any): Return value of the job function once done.
+        error (str | None): Failure message once failed.
+    """
+    func: Callable[..., Awaitable[Any]]
+    args: tuple
+    label: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = QUEUED
+    result: Any = None
+    error: str | None = None
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+
+class JobManager:
+    """
+    In-process job queue with a fixed number of asyncio workers.
+
+    Submissions return immediately; `workers` jobs run at a time and at most
+    `max_queue` wait. Finished jobs are kept for `result_ttl` seconds and then
+    forgotten. Jobs live in memory only, a restart drops queued and finished jobs.
+
+    Args:
+        name (str): Prefix of the worker task names.
+        workers (int | None): Worker count, defaults to JOB_WORKERS.
+        max_queue (int | None): Waiting jobs allowed, defaults to JOB_MAX_QUEUE.
+    """
+
+    def __init__(self, name: str = "job", workers: int | None = None, max_queue: int | None = None) -> None:
+        self.name = name
+        self.workers = workers if workers is not None else config.JOB_WORKERS
+        self.max_queue = max_queue if max_queue is not None else config.JOB_MAX_QUEUE
+        self.result_ttl = config.JOB_RESULT_TTL
+
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._queue: asyncio.Queue[Job] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+
+        # -- counters --
+        self._submitted = 0
+        self._rejected = 0
+        self._done = 0
+        self._failed = 0
+        self._expired = 0
+
+    def start(self) -> None:
+        """Starts the worker tasks"""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"{self.name}-worker-{number}")
+            for number in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Cancels the workers; running jobs are interrupted"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def submit(self, items: list[tuple[str, Callable[..., Awaitable[Any]], tuple]]) -> list[Job]:
+        """
+        Queues a batch of jobs, all or none
+
+        Args:
+            items (list[tuple]): (label, async function, positional arguments) per job.
+
+        Returns:
+            list[Job]: The queued jobs in submission order.
+
+        Raises:
+            JobQueueFull: If the batch does not fit into the queue.
+        """
+        self._purge()
+        if self._queue.qsize() + len(items) > self.max_queue:
+            self._rejected += len(items)
+            raise JobQueueFull(f"Job queue is full ({self._queue.qsize()} waiting).")
+
+        jobs = [Job(func=func, args=args, label=label) for label, func, args in items]
+        for job in jobs:
+            self._jobs[job.id] = job
+            self._queue.put_nowait(job)
+        self._submitted += len(jobs)
+        return jobs
+
+    def get(self, job_id: str) -> Job | None:
+        """Returns a job, or None if unknown or expired"""
+        self._purge()
+        return self._jobs.get(job_id)
+
+    def stats(self) -> dict:
+        """Returns worker, queue and outcome figures"""
+        self._purge()
+        return {
+            'workers': len(self._tasks),
+            'queued': self._queue.qsize(),
+            'running': sum(1 for job in self._jobs.values() if job.status == RUNNING),
+            'kept': len(self._jobs),
+            'max_queue': self.max_queue,
+            'submitted': self._submitted,
+            'rejected': self._rejected,
+            'done': self._done,
+            'failed': self._failed,
+            'expired': self._expired,
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            job.status = RUNNING
+            job.started_at = time.time()
+            try:
+                job.result = await job.func(*job.args)
+                job.status = DONE
+                self._done += 1
+            except asyncio.CancelledError:
+                job.status = FAILED
+                job.error = "Job was interrupted by shutdown."
+                raise
+            except Exception as e:
+                if not isinstance(e, JobFailed):
+                    logging.error(f"Job {job.id} ({job.label}) failed: {e}")
+                job.status = FAILED
+                job.error = str(e) or e.__class__.__name__
+                self._failed += 1
+            finally:
+                job.finished_at = time.time()
+                self._queue.task_done()
+
+    def _purge(self) -> None:
+        """Forgets finished jobs older than result_ttl"""
+        oldest = time.time() - self.result_ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and job.finished_at < oldest
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        self._expired += len(expired)
+
+
+job_manager = JobManager()
+# Exports crawl for minutes; they get their own workers so they never hold up detail jobs
+export_manager = JobManager(name="export", workers=config.EXPORT_WORKERS, max_queue=config.EXPORT_MAX_QUEUE)
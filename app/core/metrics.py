@@ -0,0 +1,209 @@
+"""
+Minimal Prometheus instrumentation.
+
+Counters, gauges and histograms are kept in plain dicts keyed by label values and
+rendered in the Prometheus text exposition format (version 0.0.4) on demand.
+Updating a metric is a dict lookup and an addition, cheap enough to stay on in production.
+All updates happen on the event loop thread, so no locking is needed.
+"""
+import asyncio
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator
+from app.core.profiling import record_stage
+
+# Upper bounds in seconds; covers cached hits (ms) up to slow browser navigations (tens of seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Registry:
+    """Collection of metrics rendered together on /metrics"""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, "Metric"] = {}
+
+    def register(self, metric: "Metric") -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """Returns every metric in the Prometheus text format"""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class Metric:
+    """
+    Base class of a metric family.
+
+    Attributes:
+        name (str): Metric name.
+        documentation (str): HELP text.
+        labelnames (tuple[str, ...]): Label names every update must provide.
+    """
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 registry: Registry | None = REGISTRY) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        if registry is not None:
+            registry.register(self)
+
+    def _key(self, labels: dict) -> tuple:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple) -> dict:
+        return dict(zip(self.labelnames, key))
+
+    def samples(self) -> Iterator[tuple[str, dict, float]]:
+        raise NotImplementedError
+
+
+class _Value(Metric):
+    """
+    Metric with one value per label set.
+
+    With `callback` the values are read when the metrics are rendered; the callback
+    returns (labels, value) pairs, which is how pool and cache figures are exported.
+    """
+
+    def __init__(self, *args, callback: Callable[[], Iterable[tuple[dict, float]]] | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple, float] = {}
+        self._callback = callback
+
+    def samples(self) -> Iterator[tuple[str, dict, float]]:
+        if self._callback is not None:
+            for labels, value in self._callback():
+                if value is not None:
+                    yield self.name, labels, value
+            return
+        for key, value in self._values.items():
+            yield self.name, self._labels(key), value
+
+
+class Counter(_Value):
+    """Monotonically increasing count"""
+    type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Value):
+    """Value that goes up and down"""
+    type = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets"""
+    type = "histogram"
+
+    def __init__(self, *args, buckets: Iterable[float] = DEFAULT_BUCKETS, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: [count per bucket (non-cumulative, last one is +Inf), sum]
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        state[0][bisect.bisect_left(self.buckets, value)] += 1
+        state[1] += value
+
+    def samples(self) -> Iterator[tuple[str, dict, float]]:
+        for key, (counts, total) in self._values.items():
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, 'le': _format_value(bound)}, cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, cumulative
+
+
+# -- scraper metrics --
+
+STAGE_SECONDS = Histogram(
+    "kinorium_stage_duration_seconds",
+    "Duration of scrape stages.",
+    ("service", "stage"),
+)
+STAGE_ERRORS = Counter(
+    "kinorium_stage_errors_total",
+    "Scrape stages that raised an exception.",
+    ("service", "stage"),
+)
+SCRAPE_RESULTS = Counter(
+    "kinorium_scrape_results_total",
+    "Scrape outcomes per scraper and engine (ok, empty, error, busy).",
+    ("scraper", "engine", "result"),
+)
+FALLBACKS = Counter(
+    "kinorium_fallbacks_total",
+    "Fallbacks to a slower path (HTTP detail engine to browser, bulk to per-locator extraction).",
+    ("kind",),
+)
+
+
+@contextmanager
+def timed(service: str, stage: str) -> Iterator[None]:
+    """
+    Records the duration of the enclosed block in STAGE_SECONDS, and a STAGE_ERRORS hit if it raises
+
+    The stage is also added to the profile of the current scrape when it is profiled.
+
+    Args:
+        service (str): 'playwright', 'http_detail', 'http_list' or 'api'.
+        stage (str): Stage name within the service.
+    """
+    started = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except (asyncio.CancelledError, GeneratorExit):
+        raise
+    except BaseException:
+        failed = True
+        STAGE_ERRORS.inc(service=service, stage=stage)
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.observe(elapsed, service=service, stage=stage)
+        record_stage(service, stage, started, elapsed, failed)
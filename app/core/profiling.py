@@ -0,0 +1,294 @@
+import asyncio
+import cProfile
+import inspect
+import io
+import json
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable
+from playwright.async_api import Locator
+from app.core import config
+
+# Profile of the scrape running in the current task (child tasks inherit it)
+_current: ContextVar["ScrapeProfile | None"] = ContextVar("scrape_profile", default=None)
+# cProfile and tracemalloc are process-wide, so only one Python-level profile runs at a time
+_python_profile_lock = asyncio.Lock()
+
+
+class ScrapeProfile:
+    """
+    Timings and artifacts of one profiled scrape (`profile=true` on the scraper endpoints).
+
+    Filled from the outside while the scrape runs:
+        - every `timed()` stage, with its offset from the start of the scrape
+        - awaited Playwright calls of pages wrapped with `wrap_page` (one browser round trip each)
+        - cProfile and tracemalloc results of `python_profile` blocks
+        - cProfile results of parsing done in the parse pool meanwhile (see profiled_call), as 'parse_pool'
+        - Playwright trace and HAR files when `capture_trace` is set
+
+    Artifacts are written to PROFILE_DIR/<id>/, together with profile.json (the summary).
+
+    Attributes:
+        id (str): Timestamp plus a random suffix, also the artifact directory name.
+        label (str): What was scraped (title or list page).
+        capture_trace (bool): Whether browser scrapes record a Playwright trace and HAR.
+    """
+
+    def __init__(self, label: str, capture_trace: bool = False) -> None:
+        self.id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        self.label = label
+        self.capture_trace = capture_trace
+        self.directory = os.path.join(config.PROFILE_DIR, self.id)
+
+        self._started = time.perf_counter()
+        self._elapsed: float | None = None
+        self._stages: list[dict] = []
+        self._round_trips: Counter[str] = Counter()
+        self._python: dict[str, dict] = {}
+        self._reports: dict[str, str] = {}
+        self._stats: dict[str, pstats.Stats] = {}
+        self._artifacts: list[str] = []
+        self._parse_stats: pstats.Stats | None = None
+        self._parse_calls = 0
+        self._parse_reported = 0
+
+    def record_stage(self, service: str, stage: str, started: float, elapsed: float, failed: bool) -> None:
+        """Adds a finished `timed()` stage (started is a perf_counter value)"""
+        self._stages.append({
+            'service': service,
+            'stage': stage,
+            'start_ms': round((started - self._started) * 1000, 2),
+            'ms': round(elapsed * 1000, 2),
+            'failed': failed,
+        })
+
+    def artifact_path(self, name: str) -> str:
+        """Returns the path of an artifact in the profile directory, creating the directory"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, name)
+        self._artifacts.append(path)
+        return path
+
+    def add_parse_stats(self, stats: dict | None) -> None:
+        """Merges the cProfile data of one parse pool call (see profiled_call)"""
+        if stats is None:
+            return
+        if self._parse_stats is None:
+            self._parse_stats = pstats.Stats(_RawStats(stats))
+        else:
+            self._parse_stats.add(_RawStats(stats))
+        self._parse_calls += 1
+
+    def wrap_page(self, page: Any) -> Any:
+        """Returns a proxy of a Playwright page that counts its awaited calls"""
+        return _RoundTripCounter(page, self)
+
+    def summary(self) -> dict:
+        """Returns the profile as sent back with the scrape result"""
+        self._report_parse_stats()
+        elapsed = self._elapsed if self._elapsed is not None else time.perf_counter() - self._started
+        return {
+            'id': self.id,
+            'label': self.label,
+            'total_ms': round(elapsed * 1000, 2),
+            'stages': sorted(self._stages, key=lambda stage: stage['start_ms']),
+            'round_trips': {'total': sum(self._round_trips.values()), 'by_call': dict(self._round_trips.most_common())},
+            'python': self._python,
+            'artifacts': list(self._artifacts),
+        }
+
+    async def save(self) -> None:
+        """Writes profile.json and the cProfile/tracemalloc reports"""
+        self._elapsed = time.perf_counter() - self._started
+        self._report_parse_stats()
+        for name, stats in self._stats.items():
+            self.artifact_path(f"{name}.pstats")
+        for name in self._reports:
+            self.artifact_path(name)
+        self.artifact_path("profile.json")
+        try:
+            await asyncio.to_thread(self._write)
+        except OSError as e:
+            logging.error(f"Could not save profile {self.id} to {self.directory}: {e}")
+
+    def _write(self) -> None:
+        for name, stats in self._stats.items():
+            stats.dump_stats(os.path.join(self.directory, f"{name}.pstats"))
+        for name, report in self._reports.items():
+            with open(os.path.join(self.directory, name), "w", encoding="utf-8") as file:
+                file.write(report)
+        with open(os.path.join(self.directory, "profile.json"), "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, ensure_ascii=False, indent=2)
+
+    def _count(self, call: str, awaitable: Any) -> Any:
+        self._round_trips[call] += 1
+        return awaitable
+
+    def _add_python_profile(self, name: str, profiler: cProfile.Profile, allocations: list, traced: tuple[int, int]) -> None:
+        self._add_cpu_report(name, pstats.Stats(profiler))
+        self._reports[f"{name}_allocations.txt"] = "\n".join(str(line) for line in allocations[:config.PROFILE_TOP])
+        self._python[name].update({
+            'allocated_kb': round(sum(line.size_diff for line in allocations if line.size_diff > 0) / 1024, 1),
+            'peak_kb': round(traced[1] / 1024, 1),
+        })
+
+    def _report_parse_stats(self) -> None:
+        # parse pool workers run outside the python_profile block's cProfile and tracemalloc: CPU only
+        if self._parse_stats is None or self._parse_reported == self._parse_calls:
+            return
+        self._add_cpu_report("parse_pool", self._parse_stats)
+        self._python["parse_pool"]['calls'] = self._parse_calls
+        self._parse_reported = self._parse_calls
+
+    def _add_cpu_report(self, name: str, stats: pstats.Stats) -> None:
+        text = io.StringIO()
+        stats.stream = text
+        self._stats[name] = stats
+
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(config.PROFILE_TOP)
+        self._reports[f"{name}_cpu.txt"] = text.getvalue()
+
+        # stats.stats: (file, line, function) -> (primitive calls, calls, own time, cumulative time, callers)
+        top = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:10]
+        self._python[name] = {
+            'cpu_ms': round(stats.total_tt * 1000, 2),
+            'top_cumulative': [
+                {'function': f"{os.path.basename(file)}:{line}({function})", 'calls': calls,
+                 'cumulative_ms': round(cumulative * 1000, 2)}
+                for (file, line, function), (_, calls, _, cumulative, _) in top
+            ],
+        }
+
+
+class _RawStats:
+    """Raw cProfile data sent back by a parse pool worker, in the shape pstats.Stats loads"""
+
+    def __init__(self, stats: dict) -> None:
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class _RoundTripCounter:
+    """
+    Proxy of a Playwright Page or Locator that counts every awaited call (one browser round trip each)
+
+    Locators handed out by the proxy are wrapped as well, so `page.locator(...).first.inner_text()`
+    is counted. Everything else is passed through unchanged.
+    """
+
+    def __init__(self, target: Any, profile: ScrapeProfile) -> None:
+        self._target = target
+        self._profile = profile
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        if isinstance(value, Locator):
+            return _RoundTripCounter(value, self._profile)
+        if not callable(value):
+            return value
+
+        def call(*args, **kwargs):
+            result = value(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return self._profile._count(name, result)
+            if isinstance(result, Locator):
+                return _RoundTripCounter(result, self._profile)
+            return result
+        return call
+
+
+def current_profile() -> ScrapeProfile | None:
+    """Returns the profile of the scrape running in this task, if it is profiled"""
+    return _current.get()
+
+
+def record_stage(service: str, stage: str, started: float, elapsed: float, failed: bool) -> None:
+    """Adds a `timed()` stage to the current profile, if any"""
+    profile = _current.get()
+    if profile is not None:
+        profile.record_stage(service, stage, started, elapsed, failed)
+
+
+def profiled_call(func: Callable[..., Any], payload: str, *args) -> tuple[Any, dict | None]:
+    """
+    Calls func(payload, *args) under its own cProfile, in a parse pool worker (see ParsePool.run)
+
+    Returns:
+        tuple: The result and the raw cProfile data, which is None when another profiler is
+               already active (on Python 3.12+ the request's own cProfile then covers the call).
+    """
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        return func(payload, *args), None
+    try:
+        result = func(payload, *args)
+    finally:
+        profiler.disable()
+    profiler.create_stats()
+    return result, profiler.stats
+
+
+@asynccontextmanager
+async def profile_scrape(label: str, capture_trace: bool = False) -> AsyncIterator[ScrapeProfile]:
+    """
+    Profiles the scrape run inside the block and saves the profile when it ends
+
+    Args:
+        label (str): What is scraped, stored in profile.json.
+        capture_trace (bool): Record a Playwright trace and HAR of browser scrapes.
+    """
+    profile = ScrapeProfile(label, capture_trace=capture_trace)
+    token = _current.set(profile)
+    try:
+        yield profile
+    finally:
+        _current.reset(token)
+        await profile.save()
+        logging.info(f"Profile {profile.id} of {label} saved to {profile.directory}")
+
+
+@asynccontextmanager
+async def python_profile(name: str) -> AsyncIterator[None]:
+    """
+    Runs the block under cProfile and tracemalloc when the current scrape is profiled
+
+    Both are process-wide: code of other requests running on the event loop meanwhile is
+    included, and profiled blocks wait for each other. Parsing handed to the parse pool runs
+    in other threads or processes and is profiled per call instead (the 'parse_pool' report).
+
+    Args:
+        name (str): Report name ('http_detail', 'http_list').
+    """
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+
+    async with _python_profile_lock:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            allocations = tracemalloc.take_snapshot().compare_to(before, "lineno")
+            traced = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            profile._add_python_profile(name, profiler, allocations, traced)
@@ -0,0 +1,86 @@
+import time
+from dataclasses import dataclass, field
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from app.core.tasks import gather_or_cancel
+
+
+class PageNotReady(Exception):
+    """Raised when the elements a required stage needs did not appear in time"""
+
+
+@dataclass(frozen=True)
+class ReadinessPolicy:
+    """
+    What one scrape stage needs from a page before it is read.
+
+    Navigation only waits for DOMContentLoaded; the stage is ready as soon as every
+    selector is attached, images, fonts and late scripts are not waited for.
+
+    Attributes:
+        stage (str): Stage name used in stats ('search', 'detail', 'cast').
+        selectors (tuple[str, ...]): Elements that must be present.
+        timeout (float): Seconds to wait for them.
+        required (bool): Raise PageNotReady on timeout; otherwise the stage goes on
+            and decides itself (e.g. a search without results).
+    """
+    stage: str
+    selectors: tuple[str, ...]
+    timeout: float
+    required: bool = True
+
+
+@dataclass
+class ReadinessStats:
+    """Process-wide per-stage counters of readiness waits"""
+    _stages: dict[str, dict] = field(default_factory=dict)
+
+    def record(self, stage: str, ready: bool, waited: float) -> None:
+        figures = self._stages.setdefault(stage, {'ready': 0, 'timeouts': 0, 'wait_total': 0.0, 'wait_max': 0.0})
+        figures['ready' if ready else 'timeouts'] += 1
+        figures['wait_total'] += waited
+        figures['wait_max'] = max(figures['wait_max'], waited)
+
+    def stats(self) -> dict:
+        result = {}
+        for stage, figures in self._stages.items():
+            waits = figures['ready'] + figures['timeouts']
+            result[stage] = {
+                'ready': figures['ready'],
+                'timeouts': figures['timeouts'],
+                'wait_ms_avg': round(figures['wait_total'] / waits * 1000, 2) if waits else 0.0,
+                'wait_ms_max': round(figures['wait_max'] * 1000, 2),
+            }
+        return result
+
+
+readiness_stats = ReadinessStats()
+
+
+async def wait_until_ready(page: Page, policy: ReadinessPolicy) -> bool:
+    """
+    Waits until every selector of the policy is attached to the page
+
+    Args:
+        page (Page): Page that was navigated with wait_until="domcontentloaded".
+        policy (ReadinessPolicy): What the stage needs.
+
+    Returns:
+        bool: True when the page is ready, False when a non-required stage timed out.
+
+    Raises:
+        PageNotReady: When a required stage timed out.
+    """
+    started = time.perf_counter()
+    try:
+        await gather_or_cancel(*(
+            page.wait_for_selector(selector, state="attached", timeout=policy.timeout * 1000)
+            for selector in policy.selectors
+        ))
+        ready = True
+    except PlaywrightTimeoutError:
+        ready = False
+    readiness_stats.record(policy.stage, ready, time.perf_counter() - started)
+
+    if not ready and policy.required:
+        raise PageNotReady(f"{policy.stage} page: {', '.join(policy.selectors)} not found within {policy.timeout}s")
+    return ready
@@ -0,0 +1,21 @@
+from typing import Any
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core's Rust serializer.
+
+    Models, dicts, lists and datetimes are written straight to UTF-8 bytes, skipping
+    FastAPI's jsonable_encoder pass and the stdlib json module. Endpoints return it
+    directly so FastAPI does not re-encode the content.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def to_json_line(content: Any) -> bytes:
+    """Serializes one NDJSON line"""
+    return to_json(content) + b"\n"
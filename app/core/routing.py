@@ -0,0 +1,176 @@
+import logging
+from urllib.parse import urlparse
+from dataclasses import dataclass, field
+from playwright.async_api import Page, Request, Response, Route
+
+# Hosts of ads and analytics that are never needed to read page content
+TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "mc.yandex.ru",
+    "an.yandex.ru",
+    "adfox.ru",
+    "facebook.net",
+    "connect.facebook.com",
+    "criteo.com",
+    "adriver.ru",
+    "top-fwz1.mail.ru",
+)
+
+# Typical transfer size (bytes) per resource type, used for blocked requests of a type that was
+# never allowed through (the presets block images, fonts and media on every page)
+TYPICAL_RESOURCE_SIZES = {
+    "image": 20_000,
+    "media": 250_000,
+    "font": 25_000,
+    "stylesheet": 15_000,
+    "script": 20_000,
+    "manifest": 1_000,
+    "texttrack": 5_000,
+}
+
+
+@dataclass(frozen=True)
+class RoutePolicy:
+    """
+    Named request interception policy for Playwright pages.
+
+    Attributes:
+        name (str): Preset name.
+        blocked_types (frozenset[str]): Playwright resource types that are aborted.
+        block_trackers (bool): Whether requests to TRACKER_HOSTS are aborted.
+    """
+    name: str
+    blocked_types: frozenset[str] = frozenset()
+    block_trackers: bool = False
+
+    @property
+    def intercepts(self) -> bool:
+        """True when the policy can block anything, so a route handler is needed"""
+        return bool(self.blocked_types) or self.block_trackers
+
+    def blocks(self, request: Request) -> bool:
+        """Decides whether the request is aborted under this policy"""
+        if request.resource_type in self.blocked_types:
+            return True
+        if self.block_trackers:
+            host = urlparse(request.url).hostname or ""
+            return any(host == tracker or host.endswith("." + tracker) for tracker in TRACKER_HOSTS)
+        return False
+
+
+ROUTE_POLICIES: dict[str, RoutePolicy] = {
+    "full": RoutePolicy(name="full"),
+    "no-media": RoutePolicy(
+        name="no-media",
+        blocked_types=frozenset({"image", "media", "font"}),
+        block_trackers=True,
+    ),
+    # Stylesheets are blocked too; scripts stay because the site may render with them
+    "text-only": RoutePolicy(
+        name="text-only",
+        blocked_types=frozenset({"image", "media", "font", "stylesheet", "manifest", "texttrack", "websocket", "eventsource"}),
+        block_trackers=True,
+    ),
+}
+
+
+@dataclass
+class RouteStats:
+    """
+    Process-wide counters of intercepted requests.
+
+    Aborted requests never download, so their size is estimated from the
+    average Content-Length seen for the same resource type on allowed responses,
+    or from TYPICAL_RESOURCE_SIZES when that type was never allowed. Blocked requests
+    of a type with neither are counted as unestimated instead of adding 0 bytes.
+    """
+    allowed_requests: int = 0
+    allowed_bytes: int = 0
+    blocked_requests: int = 0
+    estimated_blocked_bytes: int = 0
+    unestimated_blocked_requests: int = 0
+    blocked_by_type: dict[str, int] = field(default_factory=dict)
+    by_policy: dict[str, int] = field(default_factory=dict)
+    _size_samples: dict[str, list[int]] = field(default_factory=dict)  # resource type -> [count, total bytes]
+
+    def record_blocked(self, resource_type: str) -> None:
+        self.blocked_requests += 1
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        count, total = self._size_samples.get(resource_type, (0, 0))
+        if count:
+            self.estimated_blocked_bytes += total // count
+        elif resource_type in TYPICAL_RESOURCE_SIZES:
+            self.estimated_blocked_bytes += TYPICAL_RESOURCE_SIZES[resource_type]
+        else:
+            self.unestimated_blocked_requests += 1
+
+    def record_response(self, resource_type: str, size: int) -> None:
+        self.allowed_requests += 1
+        self.allowed_bytes += size
+        sample = self._size_samples.setdefault(resource_type, [0, 0])
+        sample[0] += 1
+        sample[1] += size
+
+    def record_page(self, policy_name: str) -> None:
+        self.by_policy[policy_name] = self.by_policy.get(policy_name, 0) + 1
+
+    def stats(self) -> dict:
+        return {
+            'allowed_requests': self.allowed_requests,
+            'allowed_bytes': self.allowed_bytes,
+            'blocked_requests': self.blocked_requests,
+            'estimated_blocked_bytes': self.estimated_blocked_bytes,
+            'unestimated_blocked_requests': self.unestimated_blocked_requests,
+            'blocked_by_type': dict(self.blocked_by_type),
+            'pages_by_policy': dict(self.by_policy),
+        }
+
+
+route_stats = RouteStats()
+
+
+def get_route_policy(name: str) -> RoutePolicy:
+    """Returns the preset by name, raising ValueError for unknown names"""
+    try:
+        return ROUTE_POLICIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown route policy '{name}', expected one of {sorted(ROUTE_POLICIES)}")
+
+
+async def apply_route_policy(page: Page, policy: RoutePolicy) -> None:
+    """
+    Installs the interception policy on a page and starts counting its traffic
+
+    Args:
+        page: Playwright page object, before its first navigation.
+        policy (RoutePolicy): Policy to enforce.
+    """
+    route_stats.record_page(policy.name)
+
+    def on_response(response: Response) -> None:
+        try:
+            size = int(response.headers.get("content-length", 0))
+        except ValueError:
+            size = 0
+        route_stats.record_response(response.request.resource_type, size)
+
+    page.on("response", on_response)
+
+    if not policy.intercepts:
+        return
+
+    async def handler(route: Route) -> None:
+        request = route.request
+        if policy.blocks(request):
+            route_stats.record_blocked(request.resource_type)
+            try:
+                await route.abort()
+            except Exception as e:
+                logging.debug(f"Could not abort {request.url}: {e}")
+            return
+        await route.fallback()
+
+    await page.route("**/*", handler)
@@ -0,0 +1,18 @@
+import asyncio
+from typing import Any, Awaitable
+
+
+async def gather_or_cancel(*awaitables: Awaitable) -> list[Any]:
+    """
+    Like asyncio.gather, but when one awaitable fails the others are cancelled and
+    awaited before the error is raised, so nothing keeps running in the background
+    (e.g. a navigation on a page the caller is about to reuse).
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
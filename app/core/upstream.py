@@ -0,0 +1,298 @@
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator
+from app.core import config
+from app.core.http_client import http_client
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Every regular kinorium page renders the top menu logo server-side
+HEALTH_MARKER = b"topMenu__logo"
+# Bytes read from the homepage per step while looking for the marker
+PROBE_CHUNK_SIZE = 8192
+# Statuses of an anti-bot wall or a banned client, failures like 5xx
+BLOCKED_STATUSES = (403,)
+
+
+class UpstreamUnavailable(RuntimeError):
+    """
+    Raised instead of contacting the site while the circuit breaker is open
+
+    Attributes:
+        retry_after (float): Seconds until trial requests are let through again.
+    """
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker in front of the kinorium scrapers.
+
+    - closed: requests pass; `failure_threshold` consecutive failures open the circuit.
+    - open: requests fail fast with UpstreamUnavailable for `reset_timeout` seconds.
+    - half_open: at most `half_open_trials` requests are let through at a time; a success
+      closes the circuit, a failure opens it again.
+
+    Failures are connection errors, timeouts, 5xx and 403 responses and anti-bot pages (UpstreamBlocked)
+    of the HTTP scrapers, failed browser navigations and failed health probes. A successful probe
+    moves an open circuit to half_open right away.
+
+    Attributes:
+        enabled (bool): When False every request passes and nothing is counted.
+    """
+
+    def __init__(self, enabled: bool, failure_threshold: int, reset_timeout: float, half_open_trials: int) -> None:
+        self.enabled = enabled
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.half_open_trials = max(1, half_open_trials)
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+
+        # -- counters --
+        self._opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._half_open()
+        return self._state
+
+    def admit(self) -> None:
+        """
+        Lets a request through or raises
+
+        A request admitted while half-open takes a trial slot; it is given back by
+        record_success, record_failure or release.
+
+        Raises:
+            UpstreamUnavailable: While the circuit is open, or half-open with every trial slot taken.
+        """
+        if not self.enabled:
+            return
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and self._trials < self.half_open_trials:
+            self._trials += 1
+            return
+        self._reject()
+
+    def check(self) -> None:
+        """Raises UpstreamUnavailable while the circuit is open, without taking a trial slot"""
+        if self.enabled and self.state == OPEN:
+            self._reject()
+
+    def release(self) -> None:
+        """An admitted request ended without telling anything about the upstream"""
+        if self._state == HALF_OPEN and self._trials:
+            self._trials -= 1
+
+    def record_success(self) -> None:
+        """The upstream answered normally"""
+        if not self.enabled:
+            return
+        if self._state == HALF_OPEN:
+            logging.info("Upstream recovered, closing the circuit.")
+        self._state = CLOSED
+        self._failures = 0
+        self._trials = 0
+
+    def record_failure(self, reason: str) -> None:
+        """The upstream could not be reached or failed"""
+        if not self.enabled:
+            return
+        self._failures += 1
+        if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self.failure_threshold):
+            logging.warning(f"Opening the circuit for {self.reset_timeout}s: {reason}")
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+            self._trials = 0
+            self._opened += 1
+        elif self._state == OPEN:
+            self._opened_at = time.monotonic()  # still down: keep the pause going
+
+    def record_status(self, status: int) -> None:
+        """Classifies an HTTP response: 5xx and 403 are failures, 429 says nothing, anything else is a success"""
+        if status >= 500 or status in BLOCKED_STATUSES:
+            self.record_failure(f"upstream returned status {status}")
+        elif status == 429:
+            self.release()
+        else:
+            self.record_success()
+
+    def record_probe(self, healthy: bool, reason: str = "") -> None:
+        """Feeds a health probe result; a healthy probe lets trial requests through at once"""
+        if not self.enabled:
+            return
+        if not healthy:
+            self.record_failure(f"health probe failed: {reason}")
+        elif self._state == OPEN:
+            self._half_open()
+        elif self._state == HALF_OPEN and not self._trials:
+            self.record_success()  # no traffic to confirm the recovery, the probe does
+        else:
+            self._failures = 0
+
+    @contextmanager
+    def gate(self) -> Iterator[None]:
+        """
+        Admits a request for its whole duration (browser scrapes)
+
+        The gate does not judge the outcome: the caller records the status or error of every
+        navigation with record_status / record_failure while it holds the gate.
+        """
+        self.admit()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets trial requests through"""
+        if self._state != OPEN:
+            return 0.0
+        return round(max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at)), 1)
+
+    def stats(self) -> dict:
+        """Returns the circuit state and counters"""
+        return {
+            'enabled': self.enabled,
+            'state': self.state,
+            'consecutive_failures': self._failures,
+            'retry_after': self.retry_after(),
+            'trials_in_flight': self._trials,
+            'opened': self._opened,
+            'rejected': self._rejected,
+        }
+
+    def _reject(self) -> None:
+        self._rejected += 1
+        raise UpstreamUnavailable("kinorium.com is unavailable, requests are paused", retry_after=self.retry_after())
+
+    def _half_open(self) -> None:
+        self._state = HALF_OPEN
+        self._trials = 0
+
+
+class UpstreamProber:
+    """
+    Checks kinorium.com in the background and caches the result for the health endpoint.
+
+    Every UPSTREAM_PROBE_INTERVAL seconds the homepage is requested and read in small
+    chunks only until the top menu marker shows up. Results feed the circuit breaker.
+    """
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        self.breaker = breaker
+        self.url = config.KINORIUM_BASE_URL
+        self.interval = config.UPSTREAM_PROBE_INTERVAL
+        self.timeout = config.UPSTREAM_PROBE_TIMEOUT
+
+        self._task: asyncio.Task | None = None
+        self._last: dict | None = None
+
+        # -- counters --
+        self._probes = 0
+        self._probe_failures = 0
+
+    def start(self) -> None:
+        """Starts the background probe loop (UPSTREAM_PROBE_INTERVAL 0 disables it)"""
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancels the probe loop"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def status(self) -> dict:
+        """Returns the last probe result, probing now if there is none yet or the loop is off"""
+        if self._last is None or self._task is None:
+            await self.probe()
+        return self._last
+
+    async def probe(self) -> dict:
+        """
+        Requests the homepage once and records the outcome
+
+        Returns:
+            dict: {'healthy', 'message', 'status', 'latency_ms', 'checked_at'}
+        """
+        started = time.perf_counter()
+        status = None
+        try:
+            async with http_client.get(self.url, timeout=self.timeout) as response:
+                status = response.status
+                if status != 200:
+                    healthy, message = False, f"External service returned status {status}"
+                elif await self._find_marker(response):
+                    healthy, message = True, "ua.kinorium.com is up and running."
+                else:
+                    healthy, message = False, "ua.kinorium.com is down or content has changed."
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            healthy, message = False, f"Error occurred while checking external service: {e.__class__.__name__}"
+
+        self._probes += 1
+        if not healthy:
+            self._probe_failures += 1
+            logging.warning(f"Health probe failed: {message}")
+        self.breaker.record_probe(healthy, message)
+        self._last = {
+            'healthy': healthy,
+            'message': message,
+            'status': status,
+            'latency_ms': round((time.perf_counter() - started) * 1000, 2),
+            'checked_at': time.time(),
+        }
+        return self._last
+
+    def stats(self) -> dict:
+        """Returns the probe loop settings and counters"""
+        return {
+            'interval': self.interval,
+            'running': self._task is not None and not self._task.done(),
+            'probes': self._probes,
+            'failures': self._probe_failures,
+            'last': self._last,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.interval)
+
+    async def _find_marker(self, response) -> bool:
+        """Reads the body until the marker is found; a marker split between chunks is still seen"""
+        tail = b""
+        async for chunk in response.content.iter_chunked(PROBE_CHUNK_SIZE):
+            window = tail + chunk
+            if HEALTH_MARKER in window:
+                return True
+            tail = window[-(len(HEALTH_MARKER) - 1):]
+        return False
+
+
+upstream_breaker = CircuitBreaker(
+    enabled=config.UPSTREAM_BREAKER_ENABLED,
+    failure_threshold=config.UPSTREAM_FAILURE_THRESHOLD,
+    reset_timeout=config.UPSTREAM_RESET_TIMEOUT,
+    half_open_trials=config.UPSTREAM_HALF_OPEN_TRIALS,
+)
+upstream_prober = UpstreamProber(upstream_breaker)
@@ -0,0 +1,121 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+from app.core import config
+from app.core.profiling import current_profile, profiled_call
+
+
+class ParsePool:
+    """
+    Runs CPU-bound parsing off the event loop in a thread or process pool.
+
+    At most `workers + max_queue` jobs are handed to the executor at once; further
+    callers wait on an asyncio semaphore, so the executor queue stays bounded.
+    Payloads shorter than `inline_threshold` are parsed directly on the event loop.
+
+    Attributes:
+        kind (str): 'thread', 'process' or 'inline'.
+        workers (int): Executor worker count.
+        max_queue (int): Jobs allowed to wait for a worker inside the executor.
+        inline_threshold (int): Payload length under which parsing stays inline.
+    """
+
+    def __init__(self) -> None:
+        self.kind = config.PARSE_EXECUTOR
+        self.workers = config.PARSE_WORKERS
+        self.max_queue = config.PARSE_MAX_QUEUE
+        self.inline_threshold = config.PARSE_INLINE_THRESHOLD
+
+        self._executor: Executor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._active = 0
+        self._waiting = 0
+
+        # -- counters --
+        self._inline = 0
+        self._dispatched = 0
+        self._busy_seconds = 0.0
+
+    def start(self) -> None:
+        """Creates the executor"""
+        if self._executor is not None or self.kind == "inline":
+            return
+        if self.kind == "process":
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        elif self.kind == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="parse")
+        else:
+            raise ValueError(f"Unknown PARSE_EXECUTOR '{self.kind}', expected thread, process or inline")
+        self._slots = asyncio.Semaphore(self.workers + self.max_queue)
+
+    async def stop(self) -> None:
+        """Shuts the executor down, dropping jobs that have not started"""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    async def run(self, func: Callable[..., Any], payload: str, *args) -> Any:
+        """
+        Calls func(payload, *args) in the pool, or inline for small payloads
+
+        When the calling scrape is profiled, a pooled call runs under profiled_call and its
+        cProfile data is added to the scrape's profile (inline calls are covered by the
+        request's own cProfile).
+
+        Args:
+            func (Callable): Module-level function (must be picklable for the process pool).
+            payload (str): Text to parse; its length decides inline vs pooled execution.
+            *args: Extra positional arguments for func.
+
+        Returns:
+            Any: Whatever func returns.
+        """
+        if self._executor is None or len(payload) < self.inline_threshold:
+            self._inline += 1
+            return func(payload, *args)
+
+        profile = current_profile()
+        call = partial(profiled_call, func) if profile is not None else func
+
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._active += 1
+        self._dispatched += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, partial(call, payload, *args))
+        finally:
+            self._busy_seconds += time.perf_counter() - started
+            self._active -= 1
+            self._slots.release()
+
+        if profile is None:
+            return result
+        result, stats = result
+        profile.add_parse_stats(stats)
+        return result
+
+    def stats(self) -> dict:
+        """Returns executor kind, queue depth and dispatch counters"""
+        return {
+            'kind': self.kind,
+            'running': self._executor is not None,
+            'workers': self.workers,
+            'max_queue': self.max_queue,
+            'inline_threshold': self.inline_threshold,
+            'active': self._active,
+            'waiting': self._waiting,
+            'inline': self._inline,
+            'dispatched': self._dispatched,
+            'busy_seconds': round(self._busy_seconds, 3),
+        }
+
+
+parse_pool = ParsePool()
@@ -1,9 +1,17 @@
 import asyncio
-from fastapi import FastAPI
-from app.routers import kinorium
+import math
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from app.routers import kinorium, metrics
 from contextlib import asynccontextmanager
 from app.core.http_client import http_client
 from app.core.browser import browser_manager
+from app.core.credentials import credential_pool, CredentialsExhausted
+from app.core.jobs import job_manager, export_manager
+from app.core.upstream import upstream_prober, UpstreamUnavailable
+from app.core.workers import parse_pool
+from app.services.catalogue_store import catalogue_store
+from app.services.title_index import title_index
 
 # Set event loop policy for Windows compatibility
 if hasattr(asyncio, 'WindowsProactorEventLoopPolicy'):
@@ -15,12 +23,44 @@ async def lifespan(app: FastAPI):
     """Application lifespan context manager to handle startup and shutdown events"""
 
     await http_client.start()
-    await browser_manager.get_browser(headless=True)
+    upstream_prober.start()
+    parse_pool.start()
+    await catalogue_store.start()
+    await title_index.load()
+    await browser_manager.start(headless=True)
+    job_manager.start()
+    export_manager.start()
     yield
+    await export_manager.stop()
+    await job_manager.stop()
+    await title_index.stop()
+    await credential_pool.stop()
+    await upstream_prober.stop()
     await http_client.stop()
+    await parse_pool.stop()
     await browser_manager.stop_engine()
 
 app = FastAPI(lifespan=lifespan)
 
 
-app.include_router(kinorium.router)
\ No newline at end of file
+@app.exception_handler(UpstreamUnavailable)
+async def upstream_unavailable_handler(request: Request, exc: UpstreamUnavailable) -> JSONResponse:
+    """Scrapes rejected by the open circuit breaker become 503 with Retry-After"""
+    return JSONResponse(
+        content={'status': 'error', 'message': str(exc), 'retry_after': exc.retry_after},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={'Retry-After': str(math.ceil(exc.retry_after))}
+    )
+
+
+@app.exception_handler(CredentialsExhausted)
+async def credentials_exhausted_handler(request: Request, exc: CredentialsExhausted) -> JSONResponse:
+    """Scrapes whose every session was rejected or throttled become 503"""
+    return JSONResponse(
+        content={'status': 'error', 'message': str(exc)},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+
+
+app.include_router(kinorium.router)
+app.include_router(metrics.router)
\ No newline at end of file
@@ -0,0 +1,101 @@
+from datetime import datetime
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from app.core.database import Base
+
+
+class ListItem(Base):
+    """A movie as seen in a filmList page, identified by a hash of its detail page path (see list_item_key)"""
+    __tablename__ = "list_items"
+
+    item_key: Mapped[str] = mapped_column(String(40), primary_key=True)
+    title: Mapped[str | None] = mapped_column(String(512))
+    title_eng: Mapped[str | None] = mapped_column(String(512))
+    year: Mapped[str | None] = mapped_column(String(16))
+    genres: Mapped[list] = mapped_column(JSON, default=list)
+    duration: Mapped[str | None] = mapped_column(String(64))
+    poster: Mapped[str | None] = mapped_column(String(1024))
+    url: Mapped[str | None] = mapped_column(String(1024))
+    scraped_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+
+
+class ListPage(Base):
+    """Position of a list item on a (genre, page, per_page) filmList page"""
+    __tablename__ = "list_pages"
+
+    genre_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    page: Mapped[int] = mapped_column(Integer, primary_key=True)
+    per_page: Mapped[int] = mapped_column(Integer, primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    item_key: Mapped[str] = mapped_column(String(40))
+    scraped_at: Mapped[datetime] = mapped_column(DateTime)
+
+
+class Movie(Base):
+    """A scraped MovieDetail record"""
+    __tablename__ = "movies"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    url: Mapped[str] = mapped_column(String(1024), unique=True)
+    query_key: Mapped[str | None] = mapped_column(String(512), index=True)
+    title: Mapped[str] = mapped_column(String(512))
+    description: Mapped[str] = mapped_column(Text)
+    year: Mapped[int] = mapped_column(Integer)
+    country: Mapped[list] = mapped_column(JSON, default=list)
+    duration: Mapped[str] = mapped_column(String(64))
+    budget: Mapped[str] = mapped_column(String(128))
+    poster: Mapped[str] = mapped_column(String(1024))
+    age_restriction: Mapped[str] = mapped_column(String(16))
+    logline: Mapped[str] = mapped_column(Text)
+    production_companies: Mapped[list] = mapped_column(JSON, default=list)
+    genres: Mapped[list] = mapped_column(JSON, default=list)
+    scraped_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+
+
+class Rating(Base):
+    """PlatformRating of a movie"""
+    __tablename__ = "movie_ratings"
+
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    platform: Mapped[str] = mapped_column(String(128))
+    rating: Mapped[str | None] = mapped_column(String(32))
+
+
+class CrewRole(Base):
+    """RoleGroup of a movie's crew"""
+    __tablename__ = "crew_roles"
+
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    role: Mapped[str] = mapped_column(String(256))
+
+
+class CrewPerson(Base):
+    """Person inside a RoleGroup, keyed by the role's position"""
+    __tablename__ = "crew_people"
+
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    role_position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(512))
+    image: Mapped[str | None] = mapped_column(String(1024))
+
+
+class CrawlFingerprint(Base):
+    """Last seen fingerprint of a list item in an incremental crawl, keyed like ListItem"""
+    __tablename__ = "crawl_fingerprints"
+
+    item_key: Mapped[str] = mapped_column(String(40), primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(40))
+    seen_at: Mapped[datetime] = mapped_column(DateTime)
+
+
+class CrawlCheckpoint(Base):
+    """Last page of a (genre, per_page) incremental crawl completed without gaps, 0 once a run finished"""
+    __tablename__ = "crawl_checkpoints"
+
+    genre_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    per_page: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_page: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
@@ -1,104 +1,496 @@
 from fastapi import APIRouter, status, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+import json
 import logging
-from app.schemas.options import PerPageLimit, Genre
-from app.services.kinorium_playwright import KinoriumPlaywrightService
-from app.services.kinorium_http import KinoriumHTTPService
-from app.schemas.movies import MovieDetail
+from app.core import config
+from app.schemas.options import PerPageLimit, Genre, ResourcePolicy, ScrapeEngine
+from app.services.kinorium_playwright import KinoriumPlaywrightService, detail_cache
+from app.services.kinorium_http import KinoriumHTTPService, list_cache
+from app.services.kinorium_http_detail import KinoriumHTTPDetailService
+from app.services.catalogue_store import catalogue_store, normalize_title
+from app.services.title_index import title_index
+from app.services.exporter import CatalogueExport, ExportFormatUnavailable, check_export_format, export_catalogue
+from app.schemas.movies import MOVIE_DETAIL_ADAPTER, MOVIE_LIST_ADAPTER, MovieDetail
 from app.core.http_client import http_client
+from app.core.upstream import upstream_breaker, upstream_prober, UpstreamUnavailable
+from app.core.credentials import credential_pool
+from app.core.browser import browser_manager, BrowserPoolBusy
+from app.core.readiness import readiness_stats
+from app.core.routing import route_stats
+from app.core.workers import parse_pool
+from app.core.metrics import FALLBACKS, SCRAPE_RESULTS, timed
+from app.core.profiling import ScrapeProfile, profile_scrape, python_profile
+from app.core.responses import FastJSONResponse, to_json_line
+from app.core.jobs import job_manager, export_manager, Job, JobFailed, JobQueueFull, DONE, FAILED
+from app.schemas.jobs import DetailJobRequest, ExportRequest, JobInfo
 
 router = APIRouter(prefix="/v1/kinorium", tags=["kinorium service"])
 
-async def _run_kinorium_logic(movie_title: str, headless: bool, should_scrape: bool = True) -> dict:
+MAX_AGE_DESCRIPTION = "Serve from the catalogue store when the stored record is younger than this many seconds (0 = always scrape)"
+PROFILE_DESCRIPTION = "Scrape live and return a stage timing breakdown; reports are saved to PROFILE_DIR"
+TRACE_DESCRIPTION = "Also save a Playwright trace and HAR of the browser scrape (implies profile)"
+
+async def _run_kinorium_logic(
+        movie_title: str,
+        headless: bool,
+        should_scrape: bool = True,
+        resource_policy: ResourcePolicy | None = None,
+        engine: ScrapeEngine = ScrapeEngine.BROWSER,
+        max_age: int = 0,
+        refresh: bool = False,
+        profile: bool = False,
+        trace: bool = False
+) -> dict | JSONResponse:
+    """
+    Handler for detail endpoints. Serves scraped details from detail_cache.
+
+    Concurrent requests for the same title share one scrape, successful results are kept
+    for DETAIL_CACHE_TTL seconds. The debug (URL only) mode is never cached.
+
+    Args:
+        refresh (bool): Ignore the cached result and the catalogue store and scrape again.
+        profile (bool): Scrape live, bypassing the cache and the store, and add the profile to the response.
+        trace (bool): Profile and record a Playwright trace and HAR of the browser scrape.
+        Other arguments: see _scrape_kinorium.
+    """
+    if profile or trace:
+        async with profile_scrape(movie_title, capture_trace=trace) as scrape_profile:
+            result = await _scrape_kinorium(movie_title, headless, should_scrape, resource_policy, engine, max_age=0)
+        return _with_profile(result, scrape_profile)
+
+    if not should_scrape:
+        return await _scrape_kinorium(movie_title, headless, should_scrape, resource_policy, engine, max_age)
+
+    return await detail_cache.get_or_load(
+        normalize_title(movie_title),
+        lambda: _scrape_kinorium(movie_title, headless, should_scrape, resource_policy, engine,
+                                 0 if refresh else max_age),
+        force=refresh,
+    )
+
+
+async def _scrape_kinorium(
+        movie_title: str,
+        headless: bool,
+        should_scrape: bool = True,
+        resource_policy: ResourcePolicy | None = None,
+        engine: ScrapeEngine = ScrapeEngine.BROWSER,
+        max_age: int = 0
+) -> dict | JSONResponse:
     """
-    Handler for Playwright endpoints. KinoriumPlaywrightService Controller.
+    KinoriumHTTPDetailService and KinoriumPlaywrightService Controller.
+
+    With engine AUTO the browserless HTTP engine is tried first and Playwright is only
+    used when the page needs JS or the response looks like an anti-bot wall.
     
     Args:
         movie_title (str): Accepts movie title for search
         headless (bool): True == Headless (Hidden), False == Non-headless (Visible)
         should_scrape (bool): Toggle to enable (True) or disable (False) detail scraping.
+        resource_policy (ResourcePolicy | None): Request interception preset, None uses ROUTE_POLICY.
+        engine (ScrapeEngine): Which engine serves the request (HTTP engine only applies to detail scraping).
+        max_age (int): Serve a stored record younger than this many seconds instead of scraping (0 = never).
 
     Returns:
-        dict[str, Any]: A dictionary containing the execution status and either 
-                         the scraped data, a URL, or an error message.
+        dict[str, Any]: A dictionary containing the execution status, the engine that served
+                         the request and either the scraped data, a URL, or an error message.
     """
 
-    kinorium = KinoriumPlaywrightService(headless=headless, should_scrape=should_scrape)
-    result = await kinorium.movie_detail_executor(movie_title=movie_title)
-    
+    if should_scrape and max_age:
+        stored = await catalogue_store.get_movie_detail(movie_title, max_age)
+        if stored:
+            SCRAPE_RESULTS.inc(scraper="detail", engine="store", result="ok")
+            return {'status': 'OK', 'data': MOVIE_DETAIL_ADAPTER.validate_python(stored), 'engine': 'store'}
+
+    if should_scrape and engine != ScrapeEngine.BROWSER:
+        try:
+            async with python_profile("http_detail"):
+                result = await KinoriumHTTPDetailService().movie_detail_executor(movie_title=movie_title)
+            return await _detail_response(result, engine="http", movie_title=movie_title)
+        except UpstreamUnavailable:
+            raise
+        except Exception as e:
+            if engine == ScrapeEngine.HTTP:
+                logging.warning(f"HTTP detail engine failed: {e}")
+                SCRAPE_RESULTS.inc(scraper="detail", engine="http", result="error")
+                return JSONResponse(
+                    content={'status': 'error', 'message': 'Page could not be scraped without a browser', 'engine': 'http'},
+                    status_code=status.HTTP_502_BAD_GATEWAY
+                )
+            logging.info(f"HTTP detail engine fell back to the browser: {e}")
+            FALLBACKS.inc(kind="http_to_browser")
+
+    kinorium = KinoriumPlaywrightService(
+        headless=headless,
+        should_scrape=should_scrape,
+        route_policy=resource_policy.value if resource_policy else None
+    )
+    try:
+        result = await kinorium.movie_detail_executor(movie_title=movie_title)
+    except BrowserPoolBusy as e:
+        logging.warning(f"Browser pool busy: {e}")
+        SCRAPE_RESULTS.inc(scraper="detail", engine="browser", result="busy")
+        return JSONResponse(
+            content={'status': 'error', 'message': 'Browser pool is busy, try again later', 'engine': 'browser'},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+    return await _detail_response(result, engine="browser", movie_title=movie_title)
+
+
+def _with_profile(result: dict | JSONResponse, scrape_profile: ScrapeProfile) -> dict | JSONResponse:
+    """Adds the profile summary to an endpoint result, error responses keep their status code"""
+    if isinstance(result, JSONResponse):
+        return JSONResponse(
+            content={**json.loads(result.body), 'profile': scrape_profile.summary()},
+            status_code=result.status_code
+        )
+    return {**result, 'profile': scrape_profile.summary()}
+
+
+def _fast_response(result: dict | JSONResponse) -> JSONResponse:
+    """Renders an endpoint result with FastJSONResponse, error responses are passed through"""
+    return result if isinstance(result, JSONResponse) else FastJSONResponse(result)
+
+
+async def _detail_response(result: dict | str | None, engine: str, movie_title: str) -> dict:
+    """Builds the endpoint response from a detail executor result and stores scraped details"""
+
     if not result:
-        return {'status': 'error', 'message': 'No data found'}
+        SCRAPE_RESULTS.inc(scraper="detail", engine=engine, result="empty")
+        return {'status': 'error', 'message': 'No data found', 'engine': engine}
     
+    SCRAPE_RESULTS.inc(scraper="detail", engine=engine, result="ok")
     if isinstance(result, str):
-        return {'status': 'OK', 'url': result}
+        return {'status': 'OK', 'url': result, 'engine': engine}
+
+    validated_result = MOVIE_DETAIL_ADAPTER.validate_python(result)
+    await catalogue_store.save_movie_detail(movie_title, validated_result.model_dump())
+    return {'status': 'OK', 'data': validated_result, 'engine': engine}
+
+
+async def _detail_job(
+        movie_title: str,
+        resource_policy: ResourcePolicy | None,
+        engine: ScrapeEngine,
+        max_age: int,
+        refresh: bool = False
+) -> dict:
+    """Background job body: a headless detail scrape, failing the job on an error response"""
+
+    with timed("api", "job_detail"):
+        result = await _run_kinorium_logic(
+            movie_title=movie_title,
+            headless=True,
+            should_scrape=True,
+            resource_policy=resource_policy,
+            engine=engine,
+            max_age=max_age,
+            refresh=refresh
+        )
+    if isinstance(result, JSONResponse):
+        result = json.loads(result.body)
+    if result['status'] != 'OK':
+        raise JobFailed(result['message'])
+    return result
 
-    validated_result = MovieDetail(**result)
-    return {'status': 'OK', 'data': validated_result}
+
+async def _export_job(export: CatalogueExport, request: ExportRequest) -> dict:
+    """Background job body: crawls the requested pages into the export files"""
+
+    async def load_detail(movie_title: str) -> MovieDetail | None:
+        result = await _run_kinorium_logic(
+            movie_title=movie_title,
+            headless=True,
+            resource_policy=request.resource_policy,
+            engine=request.engine,
+            max_age=request.max_age
+        )
+        if isinstance(result, JSONResponse) or result['status'] != 'OK':
+            return None
+        return result['data']
+
+    with timed("api", "job_export"):
+        summary = await export_catalogue(
+            export,
+            genre_ids=[genre.id for genre in request.genres],
+            per_page=request.per_page,
+            first_page=request.page_from,
+            last_page=request.page_to,
+            concurrency=request.concurrency,
+            detail_loader=load_detail if request.details else None
+        )
+    return {'status': 'OK', 'data': summary}
+
+
+def _get_job(job_id: str) -> Job | None:
+    """Looks a job id up among detail jobs and exports"""
+    return job_manager.get(job_id) or export_manager.get(job_id)
+
+
+@router.get("/browser/stats", status_code=status.HTTP_200_OK)
+async def kinorium_browser_stats():
+    """Browser context pool statistics (pool size, queue depth, wait times), blocked request counters and page readiness waits"""
+
+    return {"status": "OK", "data": {
+        "browser": browser_manager.info(), "pools": browser_manager.stats(),
+        "routing": route_stats.stats(), "readiness": readiness_stats.stats(),
+    }}
+
+
+@router.get("/cache/stats", status_code=status.HTTP_200_OK)
+async def kinorium_cache_stats():
+    """Response cache and title index statistics (size, hits, misses, coalesced loads, evictions)"""
+
+    return {"status": "OK", "data": {
+        "list": list_cache.stats(), "detail": detail_cache.stats(), "title_index": title_index.stats()
+    }}
+
+
+@router.get("/parser/stats", status_code=status.HTTP_200_OK)
+async def kinorium_parser_stats():
+    """Parse worker pool statistics (executor kind, active and waiting jobs, inline vs dispatched parses)"""
+
+    return {"status": "OK", "data": parse_pool.stats()}
+
+
+@router.get("/http/stats", status_code=status.HTTP_200_OK)
+async def kinorium_http_stats():
+    """HTTP client statistics (connection pool limits, per-host rate limiter state, throttling, credential pool and circuit breaker)"""
+
+    return {"status": "OK", "data": {
+        **http_client.stats(), 'credentials': credential_pool.stats(),
+        'upstream': {'circuit': upstream_breaker.stats(), 'prober': upstream_prober.stats()}
+    }}
+
+
+@router.get("/jobs/stats", status_code=status.HTTP_200_OK)
+async def kinorium_job_stats():
+    """Background job statistics (workers, queue depth, outcomes), exports under 'exports'"""
+
+    return {"status": "OK", "data": {**job_manager.stats(), "exports": export_manager.stats()}}
 
 
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def kinorium_health_check():
-    """Health check endpoint for external service https://ua.kinorium.com/"""
+    """
+    Health check endpoint for external service https://ua.kinorium.com/
+
+    Serves the result of the last background probe (see UPSTREAM_PROBE_INTERVAL) together with
+    the state of the circuit breaker that pauses scrapes while the site is down.
+    """
+
+    probe = await upstream_prober.status()
+    body = {
+        "status": "OK" if probe['healthy'] else "BAD",
+        "message": probe['message'],
+        "data": {**probe, "circuit": upstream_breaker.stats()}
+    }
+    if probe['status'] is None:
+        # the site could not be reached at all
+        return JSONResponse(content=body, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return body
 
-    try:
-        async with http_client.get("https://ua.kinorium.com") as response:
-            if response.status != 200:
-                 # If status is not 200, log and return BAD status
-                 logging.warning(f"External service returned {response.status}")
-                 return {
-                      "status": "BAD",
-                      "message": f"External service returned status {response.status}"
-                      }
-        
-            html = await response.text()
-            if "topMenu__logo" in html:
-                return {"status": "OK", "message": "ua.kinorium.com is up and running."}
-            
-            logging.warning("Expected content not found in response.")
-            return {
-                "status": "BAD", 
-                "message": "ua.kinorium.com is down or content has changed."
-            }
-        
-    except Exception as e:
-        logging.warning(f"Error during health check: {e}")
-        return JSONResponse(
-            content={
-                "status": "BAD", 
-                "message": "Error occurred while checking external service"
-            },
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
-        )
-    
 
-@router.get("/scraper/http", status_code=status.HTTP_200_OK)
+@router.get("/scraper/http", status_code=status.HTTP_200_OK, response_class=FastJSONResponse)
 async def kinorium_via_http_client(
     genre: Genre = Query(default=Genre.FANTASY, description="Genre to filter by"),
     page: int = Query(default=1, ge=1),
-    per_page: PerPageLimit = PerPageLimit.SMALL
+    per_page: PerPageLimit = PerPageLimit.SMALL,
+    max_age: int = Query(default=config.CATALOGUE_MAX_AGE, ge=0, description=MAX_AGE_DESCRIPTION),
+    profile: bool = Query(default=False, description=PROFILE_DESCRIPTION)
 ):
     """
     1️⃣ Простий запит (без браузера)
     Uses the aiohttp HTTP client to fetch data from kinorium by genre and pagination.
     """
-    result = await KinoriumHTTPService().start_scraper(genre.id, page, per_page)
+    if profile:
+        async with profile_scrape(f"genre {genre.id} page {page} per_page {per_page}") as scrape_profile:
+            async with python_profile("http_list"):
+                result = await KinoriumHTTPService().start_scraper(genre.id, page, per_page, refresh=True)
+        return FastJSONResponse({
+            "status": "OK", "data": MOVIE_LIST_ADAPTER.validate_python(result), "profile": scrape_profile.summary()
+        })
 
-    return {"status": "OK", "data": result}
+    with timed("api", "scraper_http"):
+        stored = await catalogue_store.get_list_page(genre.id, page, per_page, max_age)
+        if stored:
+            SCRAPE_RESULTS.inc(scraper="list", engine="store", result="ok")
+            return FastJSONResponse({"status": "OK", "data": MOVIE_LIST_ADAPTER.validate_python(stored), "source": "store"})
+
+        result = await KinoriumHTTPService().start_scraper(genre.id, page, per_page)
+
+    SCRAPE_RESULTS.inc(scraper="list", engine="http", result="ok" if result else "empty")
+    return FastJSONResponse({"status": "OK", "data": MOVIE_LIST_ADAPTER.validate_python(result)})
+
+
+@router.get("/scraper/http/stream", status_code=status.HTTP_200_OK)
+async def kinorium_stream_via_http_client(
+    genre: Genre = Query(default=Genre.FANTASY, description="Genre to filter by"),
+    page: int = Query(default=1, ge=1),
+    per_page: PerPageLimit = PerPageLimit.LARGE
+):
+    """
+    Streaming variant of /scraper/http.
+
+    Movies are parsed while the filmList response downloads and sent as NDJSON
+    (one movie per line, in page order), so memory use does not depend on `per_page`.
+    Always fetched live: neither the response cache nor the catalogue store is used.
+    """
+    # checked before the response starts, a stream cannot turn into a 503 later
+    upstream_breaker.check()
+
+    async def ndjson():
+        items = 0
+        async for item in KinoriumHTTPService().stream_scraper(genre.id, page, per_page):
+            items += 1
+            yield to_json_line(item)
+        SCRAPE_RESULTS.inc(scraper="stream", engine="http", result="ok" if items else "empty")
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.get("/scraper/http/crawl", status_code=status.HTTP_200_OK)
+async def kinorium_crawl_via_http_client(
+    genres: list[Genre] = Query(default=[Genre.FANTASY], description="Genres to crawl"),
+    page_from: int = Query(default=1, ge=1),
+    page_to: int | None = Query(default=None, ge=1, description="Last page to fetch, empty = until a page comes back empty"),
+    per_page: PerPageLimit = PerPageLimit.LARGE,
+    concurrency: int = Query(default=config.CRAWL_CONCURRENCY, ge=1, le=config.CRAWL_MAX_CONCURRENCY)
+):
+    """
+    Bulk crawl of several genres and pages over the aiohttp HTTP client.
+
+    Pages are fetched concurrently and streamed back as NDJSON (one JSON object per line)
+    as soon as each page completes, so the order of lines is not the page order.
+    """
+    upstream_breaker.check()
+    genre_names = {genre.id: genre.value for genre in genres}
+
+    async def ndjson():
+        crawl = KinoriumHTTPService().crawl(
+            genre_ids=list(genre_names),
+            per_page=per_page,
+            first_page=page_from,
+            last_page=page_to,
+            concurrency=concurrency
+        )
+        async for page_result in crawl:
+            SCRAPE_RESULTS.inc(scraper="crawl", engine="http", result="error" if "error" in page_result else "ok")
+            line = {
+                "status": "error" if "error" in page_result else "OK",
+                "genre": genre_names[page_result["genre_id"]],
+                **page_result
+            }
+            yield to_json_line(line)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.get("/scraper/http/crawl/incremental", status_code=status.HTTP_200_OK)
+async def kinorium_incremental_crawl_via_http_client(
+    genres: list[Genre] = Query(default=[Genre.FANTASY], description="Genres to crawl"),
+    page_to: int | None = Query(default=None, ge=1, description="Last page to fetch, empty = until a page comes back empty"),
+    per_page: PerPageLimit = PerPageLimit.LARGE,
+    concurrency: int = Query(default=config.CRAWL_CONCURRENCY, ge=1, le=config.CRAWL_MAX_CONCURRENCY),
+    resume: bool = Query(default=True, description="Continue an interrupted crawl from its last completed page"),
+    scrape_details: bool = Query(default=False, description="Queue a detail scrape job for every new or changed movie")
+):
+    """
+    Incremental variant of /scraper/http/crawl.
+
+    Streams NDJSON lines only for pages with movies that are new or changed since the previous
+    incremental crawl (`change`: new | changed). With `scrape_details` a background detail job is
+    queued per such movie and the job ids are listed in the line. The last line is a summary,
+    with status error when the catalogue store failed and the crawl was stopped.
+    An interrupted crawl resumes after the last page completed without gaps.
+    Needs the catalogue store (CATALOGUE_ENABLED).
+    """
+    if not catalogue_store.enabled:
+        return JSONResponse(
+            content={'status': 'error', 'message': 'Incremental crawls need the catalogue store (CATALOGUE_ENABLED)'},
+            status_code=status.HTTP_409_CONFLICT
+        )
+    upstream_breaker.check()
+    genre_names = {genre.id: genre.value for genre in genres}
+
+    async def ndjson():
+        crawl = KinoriumHTTPService().incremental_crawl(
+            genre_ids=list(genre_names),
+            per_page=per_page,
+            last_page=page_to,
+            concurrency=concurrency,
+            resume=resume
+        )
+        try:
+            async for page_result in crawl:
+                if 'summary' in page_result:
+                    yield to_json_line({"status": "error" if "error" in page_result else "done", **page_result})
+                    continue
+
+                SCRAPE_RESULTS.inc(scraper="crawl", engine="http", result="error" if "error" in page_result else "ok")
+                line = {
+                    "status": "error" if "error" in page_result else "OK",
+                    "genre": genre_names[page_result["genre_id"]],
+                    **page_result
+                }
+                if scrape_details and "data" in page_result:
+                    titles = [item['title'] for item in page_result['data'] if item['title']]
+                    try:
+                        jobs = job_manager.submit([
+                            (title, _detail_job, (title, None, ScrapeEngine.AUTO, 0, True)) for title in titles
+                        ])
+                    except JobQueueFull as e:
+                        # stop before the page is checkpointed, a resumed crawl reports it again
+                        logging.warning(f"Job queue full, incremental crawl stopped: {e}")
+                        yield to_json_line({"status": "error", "message": "Job queue is full, resume the crawl later"})
+                        return
+                    line["jobs"] = [job.id for job in jobs]
+                yield to_json_line(line)
+        finally:
+            await crawl.aclose()
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
 
 @router.post("/scraper/browser/headless", 
              status_code=status.HTTP_200_OK,
+             response_class=FastJSONResponse,
              summary="Scrape movie details (headless)")
-async def kinorium_via_browser_headless(movie_title: str):
+async def kinorium_via_browser_headless(
+    movie_title: str,
+    resource_policy: ResourcePolicy | None = Query(default=None, description="Resources to block while loading pages"),
+    engine: ScrapeEngine = Query(default=ScrapeEngine.AUTO, description="auto tries plain HTTP first, then the browser"),
+    max_age: int = Query(default=config.CATALOGUE_MAX_AGE, ge=0, description=MAX_AGE_DESCRIPTION),
+    refresh: bool = Query(default=False, description="Scrape again even if the title is cached or stored"),
+    profile: bool = Query(default=False, description=PROFILE_DESCRIPTION),
+    trace: bool = Query(default=False, description=TRACE_DESCRIPTION)
+):
     """
     2️⃣ Headless-браузер (скрейпінг деталей фільму)
     
-    Opens the browser in headless mode to scrape detailed movie information.
+    Scrapes detailed movie information. By default the pages are fetched over plain HTTP
+    and the headless browser is only opened when that is not enough.
+    Results are cached in memory for DETAIL_CACHE_TTL seconds; concurrent requests for
+    the same title wait for one shared scrape.
+    With `profile` the title is scraped live and the response carries per-stage timings,
+    browser round trips and (HTTP engine) cProfile/allocation figures.
 
-    Returns: Scraped movie details as a structured dictionary (Pydantic Model).
+    Returns: Scraped movie details as a structured dictionary (Pydantic Model) and the engine that served them.
     """
 
-    return await _run_kinorium_logic(movie_title=movie_title, headless=True, should_scrape=True)
+    with timed("api", "scraper_browser_headless"):
+        return _fast_response(await _run_kinorium_logic(
+            movie_title=movie_title,
+            headless=True,
+            should_scrape=True,
+            resource_policy=resource_policy,
+            engine=engine,
+            max_age=max_age,
+            refresh=refresh,
+            profile=profile,
+            trace=trace
+        ))
 
 
 
@@ -108,7 +500,12 @@ async def kinorium_via_browser_headless(movie_title: str):
         status_code=status.HTTP_200_OK,
         summary="Scrape movie details (Debug/Visual)"
         )
-async def kinorium_via_browser_debug(movie_title: str):
+async def kinorium_via_browser_debug(
+    movie_title: str,
+    resource_policy: ResourcePolicy | None = Query(default=None, description="Resources to block while loading pages"),
+    profile: bool = Query(default=False, description=PROFILE_DESCRIPTION),
+    trace: bool = Query(default=False, description=TRACE_DESCRIPTION)
+):
     """
     3️⃣ Браузер без headless (відкриття сторінки фільму)
 
@@ -118,5 +515,95 @@ async def kinorium_via_browser_debug(movie_title: str):
 
     """
 
-    return await _run_kinorium_logic(movie_title=movie_title, headless=False, should_scrape=False)
+    with timed("api", "scraper_browser_debug"):
+        return await _run_kinorium_logic(
+            movie_title=movie_title, headless=False, should_scrape=False, resource_policy=resource_policy,
+            profile=profile, trace=trace
+        )
+
+
+@router.post("/jobs", status_code=status.HTTP_202_ACCEPTED, summary="Queue movie detail scrapes")
+async def kinorium_submit_jobs(request: DetailJobRequest):
+    """
+    Queues a headless detail scrape per title and returns right away.
+
+    Poll `GET /jobs/{job_id}` for the status and fetch the scraped details from
+    `GET /jobs/{job_id}/result`. Finished jobs are kept for JOB_RESULT_TTL seconds.
+    """
+    try:
+        jobs = job_manager.submit([
+            (title, _detail_job, (title, request.resource_policy, request.engine, request.max_age, request.refresh))
+            for title in request.titles
+        ])
+    except JobQueueFull as e:
+        logging.warning(f"Job queue full: {e}")
+        return JSONResponse(
+            content={'status': 'error', 'message': 'Job queue is full, try again later'},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+    return {"status": "OK", "data": [JobInfo.from_job(job) for job in jobs]}
+
+
+@router.post("/exports", status_code=status.HTTP_202_ACCEPTED, summary="Export crawled movies to files")
+async def kinorium_submit_export(request: ExportRequest):
+    """
+    Queues a crawl that writes list items (and optionally movie details) to NDJSON, CSV or Parquet files.
+
+    Every table gets its own file in `EXPORT_DIR/<export_id>/`: list_items, list_item_genres, details,
+    detail_ratings and detail_crew. Rows are written in batches of EXPORT_BATCH_SIZE while the crawl runs.
+    Exports run on their own EXPORT_WORKERS workers, not on the detail job workers.
+    Poll `GET /jobs/{job_id}`; the job result lists the files and their row counts.
+    """
+    try:
+        check_export_format(request.format)
+    except ExportFormatUnavailable as e:
+        return JSONResponse(content={'status': 'error', 'message': str(e)}, status_code=status.HTTP_400_BAD_REQUEST)
+
+    export = CatalogueExport(request.format)
+    try:
+        job, = export_manager.submit([(f"export {export.id}", _export_job, (export, request))])
+    except JobQueueFull as e:
+        logging.warning(f"Export queue full: {e}")
+        return JSONResponse(
+            content={'status': 'error', 'message': 'Export queue is full, try again later'},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+    return {"status": "OK", "data": {"export_id": export.id, "directory": export.directory, "job": JobInfo.from_job(job)}}
+
+
+@router.get("/jobs/{job_id}", status_code=status.HTTP_200_OK)
+async def kinorium_job_status(job_id: str):
+    """Status of a queued job"""
+
+    job = _get_job(job_id)
+    if job is None:
+        return JSONResponse(
+            content={'status': 'error', 'message': 'Job not found or expired'},
+            status_code=status.HTTP_404_NOT_FOUND
+        )
+    return {"status": "OK", "data": JobInfo.from_job(job)}
 
+
+@router.get("/jobs/{job_id}/result", status_code=status.HTTP_200_OK, response_class=FastJSONResponse)
+async def kinorium_job_result(job_id: str):
+    """
+    Result of a finished job.
+
+    Returns 202 with the job status while it is queued or running.
+    """
+    job = _get_job(job_id)
+    if job is None:
+        return JSONResponse(
+            content={'status': 'error', 'message': 'Job not found or expired'},
+            status_code=status.HTTP_404_NOT_FOUND
+        )
+    if job.status == FAILED:
+        return {'status': 'error', 'message': job.error, 'job': JobInfo.from_job(job)}
+    if job.status != DONE:
+        return JSONResponse(
+            content={'status': job.status, 'job': JobInfo.from_job(job).model_dump(mode="json")},
+            status_code=status.HTTP_202_ACCEPTED
+        )
+    return FastJSONResponse({**job.result, 'job': JobInfo.from_job(job)})
@@ -0,0 +1,121 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.core.browser import browser_manager
+from app.core.credentials import credential_pool
+from app.core.http_client import http_client
+from app.core.jobs import job_manager, export_manager
+from app.core.metrics import REGISTRY, Counter, Gauge
+from app.core.readiness import readiness_stats
+from app.core.routing import route_stats
+from app.core.upstream import upstream_breaker, upstream_prober, CLOSED, HALF_OPEN, OPEN
+from app.core.workers import parse_pool
+from app.services.kinorium_http import list_cache
+from app.services.kinorium_playwright import detail_cache
+from app.services.title_index import title_index
+
+router = APIRouter(tags=["metrics"])
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# -- gauges and counters read from the components' stats() on every scrape --
+
+def _pool_figures(*fields: str):
+    def collect():
+        for mode, stats in browser_manager.stats().items():
+            for field in fields:
+                yield {'mode': mode, 'state': field}, stats[field]
+    return collect
+
+
+Gauge("kinorium_browser_pool_contexts", "Browser contexts by state.", ("mode", "state"),
+      callback=_pool_figures('idle', 'in_use'))
+Gauge("kinorium_browser_pool_waiting", "Callers waiting for a browser context.", ("mode",),
+      callback=lambda: (({'mode': mode}, stats['waiting']) for mode, stats in browser_manager.stats().items()))
+Gauge("kinorium_browser_pool_wait_seconds", "Browser context wait time (last, avg, max).", ("mode", "stat"),
+      callback=lambda: (
+          ({'mode': mode, 'stat': stat}, stats[f'wait_ms_{stat}'] / 1000)
+          for mode, stats in browser_manager.stats().items() for stat in ('last', 'avg', 'max')
+      ))
+Gauge("kinorium_browser_connected", "Whether the headless browser is up (1) or not started / disconnected (0).", ("mode",),
+      callback=lambda: [({'mode': browser_manager.info()['mode']}, int(browser_manager.info()['connected']))])
+Counter("kinorium_browser_pool_events_total", "Browser context pool events.", ("mode", "state"),
+        callback=_pool_figures('created', 'recycled', 'acquired', 'rejected', 'timeouts'))
+
+Counter("kinorium_blocked_requests_total", "Requests aborted by the route policy, by resource type.", ("type",),
+        callback=lambda: (({'type': kind}, count) for kind, count in route_stats.stats()['blocked_by_type'].items()))
+Counter("kinorium_blocked_bytes_estimated_total", "Estimated bytes not downloaded thanks to the route policy.",
+        callback=lambda: [({}, route_stats.stats()['estimated_blocked_bytes'])])
+Counter("kinorium_blocked_requests_unestimated_total", "Blocked requests of a type without a size estimate.",
+        callback=lambda: [({}, route_stats.stats()['unestimated_blocked_requests'])])
+
+Counter("kinorium_page_readiness_total", "Page readiness waits by stage and outcome.", ("stage", "outcome"),
+        callback=lambda: (({'stage': stage, 'outcome': outcome}, stats[outcome])
+                          for stage, stats in readiness_stats.stats().items() for outcome in ('ready', 'timeouts')))
+Gauge("kinorium_page_readiness_wait_seconds", "Time spent waiting for stage selectors (avg, max).", ("stage", "stat"),
+      callback=lambda: (({'stage': stage, 'stat': stat}, stats[f'wait_ms_{stat}'] / 1000)
+                        for stage, stats in readiness_stats.stats().items() for stat in ('avg', 'max')))
+
+Gauge("kinorium_list_cache_entries", "Entries in the filmList cache.",
+      callback=lambda: [({}, list_cache.stats()['size'])])
+Counter("kinorium_list_cache_lookups_total", "filmList cache lookups by outcome.", ("result",),
+        callback=lambda: (
+            ({'result': result}, list_cache.stats()[result])
+            for result in ('hits', 'stale_hits', 'misses', 'coalesced', 'evictions', 'load_errors')
+        ))
+
+Gauge("kinorium_detail_cache_entries", "Entries in the movie detail cache.",
+      callback=lambda: [({}, detail_cache.stats()['size'])])
+Gauge("kinorium_detail_cache_inflight", "Detail scrapes in flight (joined by identical requests).",
+      callback=lambda: [({}, detail_cache.stats()['inflight'])])
+Counter("kinorium_detail_cache_lookups_total", "Movie detail cache lookups by outcome.", ("result",),
+        callback=lambda: (
+            ({'result': result}, detail_cache.stats()[result])
+            for result in ('hits', 'stale_hits', 'misses', 'coalesced', 'evictions', 'load_errors')
+        ))
+
+Gauge("kinorium_title_index_entries", "Titles with a known detail URL.",
+      callback=lambda: [({}, title_index.stats()['size'])])
+Counter("kinorium_title_index_lookups_total", "Title index lookups by outcome.", ("result",),
+        callback=lambda: (({'result': result}, title_index.stats()[result]) for result in ('hits', 'misses', 'stale')))
+
+Gauge("kinorium_parse_pool_tasks", "Parse jobs by state.", ("state",),
+      callback=lambda: (({'state': state}, parse_pool.stats()[state]) for state in ('active', 'waiting')))
+
+Gauge("kinorium_jobs", "Background jobs by state.", ("state",),
+      callback=lambda: (({'state': state}, job_manager.stats()[state]) for state in ('queued', 'running')))
+Counter("kinorium_jobs_finished_total", "Background jobs by outcome.", ("outcome",),
+        callback=lambda: (({'outcome': outcome}, job_manager.stats()[outcome]) for outcome in ('done', 'failed', 'rejected')))
+Gauge("kinorium_export_jobs", "Export jobs by state.", ("state",),
+      callback=lambda: (({'state': state}, export_manager.stats()[state]) for state in ('queued', 'running')))
+
+Gauge("kinorium_credentials", "HTTP scraper sessions (total and healthy).", ("state",),
+      callback=lambda: (({'state': state}, credential_pool.stats()[state]) for state in ('total', 'healthy')))
+
+Gauge("kinorium_http_rate", "Current allowed requests/second per host.", ("host",),
+      callback=lambda: (({'host': host}, stats['rate']) for host, stats in http_client.stats()['hosts'].items()))
+Counter("kinorium_http_throttled_total", "429/503 responses per host.", ("host",),
+        callback=lambda: (({'host': host}, stats['throttled']) for host, stats in http_client.stats()['hosts'].items()))
+
+
+def _last_probe(field: str, default: float = 0):
+    last = upstream_prober.stats()['last']
+    return default if last is None else last[field]
+
+
+Gauge("kinorium_upstream_up", "Whether the last health probe found the site up.",
+      callback=lambda: [({}, int(_last_probe('healthy')))])
+Gauge("kinorium_upstream_probe_seconds", "Duration of the last health probe.",
+      callback=lambda: [({}, _last_probe('latency_ms') / 1000)])
+Gauge("kinorium_upstream_circuit_state", "Circuit breaker state (1 for the current state).", ("state",),
+      callback=lambda: (({'state': state}, int(upstream_breaker.state == state)) for state in (CLOSED, HALF_OPEN, OPEN)))
+Counter("kinorium_upstream_circuit_events_total", "Circuit breaker openings and rejected requests.", ("event",),
+        callback=lambda: (({'event': event}, upstream_breaker.stats()[event]) for event in ('opened', 'rejected')))
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint"""
+
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+from pydantic import BaseModel, Field
+from app.core import config
+from app.core.jobs import Job
+from app.schemas.options import ExportFormat, Genre, PerPageLimit, ResourcePolicy, ScrapeEngine
+
+
+class DetailJobRequest(BaseModel):
+    """Batch of movie titles to scrape in the background"""
+    titles: list[str] = Field(min_length=1, max_length=config.JOB_MAX_BATCH)
+    resource_policy: ResourcePolicy | None = None
+    engine: ScrapeEngine = ScrapeEngine.AUTO
+    max_age: int = Field(default=config.CATALOGUE_MAX_AGE, ge=0)
+    refresh: bool = False
+
+
+class ExportRequest(BaseModel):
+    """Crawl written to files in EXPORT_DIR (see app/services/exporter.py)"""
+    genres: list[Genre] = Field(default=[Genre.FANTASY], min_length=1)
+    page_from: int = Field(default=1, ge=1)
+    page_to: int | None = Field(default=None, ge=1, description="Last page, empty = until a page comes back empty")
+    per_page: PerPageLimit = PerPageLimit.LARGE
+    concurrency: int = Field(default=config.CRAWL_CONCURRENCY, ge=1, le=config.CRAWL_MAX_CONCURRENCY)
+    format: ExportFormat = ExportFormat.NDJSON
+    details: bool = Field(default=False, description="Also scrape and export the details of every movie")
+    resource_policy: ResourcePolicy | None = None
+    engine: ScrapeEngine = ScrapeEngine.AUTO
+    max_age: int = Field(default=config.CATALOGUE_MAX_AGE, ge=0)
+
+
+class JobInfo(BaseModel):
+    id: str
+    title: str
+    status: str
+    error: str | None = None
+    submitted_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @classmethod
+    def from_job(cls, job: Job) -> "JobInfo":
+        return cls(
+            id=job.id,
+            title=job.label,
+            status=job.status,
+            error=job.error,
+            submitted_at=_timestamp(job.submitted_at),
+            started_at=_timestamp(job.started_at),
+            finished_at=_timestamp(job.finished_at),
+        )
+
+
+def _timestamp(value: float | None) -> datetime | None:
+    return datetime.fromtimestamp(value, tz=timezone.utc) if value is not None else None
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, TypeAdapter, field_validator
 
 class PlatformRating(BaseModel):
     platform: str
@@ -34,4 +34,19 @@ class MovieDetail(BaseModel):
 
     @field_validator('logline', mode='after')
     def clean_logline(cls, v: str) -> str:
-        return v.replace("»", "").replace("«", "").strip()
\ No newline at end of file
+        return v.replace("»", "").replace("«", "").strip()
+
+class MovieListItem(BaseModel):
+    """One movie of a filmList page (see parse_film_list)"""
+    title: str | None = None
+    title_eng: str | None = None
+    year: str | None = None
+    genres: list[str] = []
+    duration: str | None = None
+    poster: str | None = None
+    url: str | None = None  # detail page link as found on the page (site-relative)
+
+
+# Built once: creating an adapter compiles the validator, validating through it is cheap
+MOVIE_DETAIL_ADAPTER = TypeAdapter(MovieDetail)
+MOVIE_LIST_ADAPTER = TypeAdapter(list[MovieListItem])
@@ -7,6 +7,27 @@ class PerPageLimit(IntEnum):
     LARGE = 200
 
 
+class ResourcePolicy(str, Enum):
+    """Request interception presets for Playwright scrapes (see app/core/routing.py)"""
+    FULL = "full"
+    NO_MEDIA = "no-media"
+    TEXT_ONLY = "text-only"
+
+
+class ScrapeEngine(str, Enum):
+    """Engine used for movie detail scraping"""
+    AUTO = "auto"        # plain HTTP first, Playwright when the page needs JS or is blocked
+    HTTP = "http"
+    BROWSER = "browser"
+
+
+class ExportFormat(str, Enum):
+    """File formats of catalogue exports (see app/services/exporter.py)"""
+    NDJSON = "ndjson"
+    CSV = "csv"
+    PARQUET = "parquet"   # needs pyarrow
+
+
 from enum import Enum
 
 class Genre(str, Enum):
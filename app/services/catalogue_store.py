@@ -0,0 +1,432 @@
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator
+from urllib.parse import urlsplit
+from sqlalchemy import and_, delete, insert, or_, select, update
+from sqlalchemy.orm import Session
+from app.core import config
+from app.core.database import SessionLocal, engine, init_db
+from app.models.catalogue import (
+    CrawlCheckpoint, CrawlFingerprint, CrewPerson, CrewRole, ListItem, ListPage, Movie, Rating
+)
+
+
+# Fields of a filmList item, in the order they are fingerprinted
+LIST_ITEM_FIELDS = ('title', 'title_eng', 'year', 'genres', 'duration', 'poster')
+
+
+def normalize_title(title: str) -> str:
+    """Normalizes a movie title for lookups (case-folded, single spaced)"""
+    return " ".join(title.casefold().split())
+
+
+def list_item_key(item: dict) -> str:
+    """
+    Stable identity of a filmList item: hash of its detail page path
+
+    Remakes and same-name releases share title and year but not the kinorium page. Items
+    without a link fall back to a hash of title, English title and year.
+    """
+    if item.get('url'):
+        raw = urlsplit(item['url']).path
+    else:
+        raw = json.dumps([item.get('title'), item.get('title_eng'), item.get('year')], ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def list_item_fingerprint(item: dict) -> str:
+    """Hash of every field of a filmList item, changes whenever any of them does"""
+    raw = json.dumps([item.get(field) for field in LIST_ITEM_FIELDS], ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _batched(rows: list[dict], size: int) -> Iterator[list[dict]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+class CatalogueStoreError(RuntimeError):
+    """Raised by the incremental crawl methods when the database call failed"""
+
+
+class CatalogueStore:
+    """
+    Persistence of scraped list items and MovieDetail records.
+
+    Writes are bulk upserts in batches of CATALOGUE_BATCH_SIZE rows, one transaction per call.
+    The database work is synchronous SQLAlchemy, run in a worker thread so the
+    event loop is never blocked. Errors are logged and treated as a cache miss, except
+    for the incremental crawl state, where they raise CatalogueStoreError.
+
+    Attributes:
+        enabled (bool): When False every read misses and every write is skipped.
+        batch_size (int): Rows per bulk statement.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = config.CATALOGUE_ENABLED
+        self.batch_size = config.CATALOGUE_BATCH_SIZE
+
+    async def start(self) -> None:
+        """Creates the catalogue tables"""
+        if self.enabled:
+            await asyncio.to_thread(init_db)
+
+    # -- list items --
+
+    async def save_list_pages(self, pages: list[tuple[int, int, int, list[dict]]]) -> None:
+        """
+        Upserts filmList pages
+
+        Args:
+            pages (list[tuple]): (genre_id, page, per_page, items) per page.
+        """
+        if self.enabled and pages:
+            await self._run(self._save_list_pages, pages)
+
+    async def save_list_page(self, genre_id: int, page: int, per_page: int, items: list[dict]) -> None:
+        """Upserts one filmList page"""
+        await self.save_list_pages([(genre_id, page, per_page, items)])
+
+    async def get_list_page(self, genre_id: int, page: int, per_page: int, max_age: int) -> list[dict] | None:
+        """
+        Returns a stored filmList page scraped less than `max_age` seconds ago
+
+        Returns:
+            list[dict] | None: Items in page order, or None if missing or stale.
+        """
+        if not self.enabled or max_age <= 0:
+            return None
+        return await self._run(self._get_list_page, genre_id, page, per_page, max_age)
+
+    # -- movie details --
+
+    async def save_movie_details(self, records: list[tuple[str | None, dict]]) -> None:
+        """
+        Upserts MovieDetail records with their ratings and crew
+
+        Args:
+            records (list[tuple]): (search title or None, MovieDetail dict) per movie.
+        """
+        if self.enabled and records:
+            await self._run(self._save_movie_details, records)
+
+    async def save_movie_detail(self, movie_title: str | None, detail: dict) -> None:
+        """Upserts one MovieDetail record"""
+        await self.save_movie_details([(movie_title, detail)])
+
+    async def get_movie_detail(self, movie_title: str, max_age: int) -> dict | None:
+        """
+        Returns the MovieDetail dict last scraped for this search title, if younger than `max_age` seconds
+        """
+        if not self.enabled or max_age <= 0:
+            return None
+        return await self._run(self._get_movie_detail, normalize_title(movie_title), max_age)
+
+    # -- incremental crawl --
+
+    async def get_crawl_checkpoints(self, genre_ids: list[int], per_page: int) -> dict[int, int]:
+        """
+        Returns the checkpoint page of every genre with an unfinished incremental crawl
+
+        Raises:
+            CatalogueStoreError: If the checkpoints could not be read.
+        """
+        if not self.enabled:
+            return {}
+        return await self._run_strict(self._get_crawl_checkpoints, genre_ids, per_page)
+
+    async def get_crawl_fingerprints(self, item_keys: list[str]) -> dict[str, str]:
+        """
+        Returns the fingerprints the last incremental crawl saw for these items
+
+        Raises:
+            CatalogueStoreError: If the fingerprints could not be read (an empty result
+                would make every item look new).
+        """
+        if not self.enabled or not item_keys:
+            return {}
+        return await self._run_strict(self._get_crawl_fingerprints, item_keys)
+
+    async def save_crawl_progress(self, genre_id: int, per_page: int, fingerprints: dict[str, str],
+                                  last_page: int) -> None:
+        """
+        Records the fingerprints of a crawled page and moves the genre's checkpoint, in one transaction
+
+        Args:
+            genre_id (int): Crawled genre.
+            per_page (int): Page size of the crawl.
+            fingerprints (dict[str, str]): item_key -> fingerprint of the page's items.
+            last_page (int): New checkpoint, 0 marks the crawl of the genre as finished.
+
+        Raises:
+            CatalogueStoreError: If the progress could not be saved.
+        """
+        if self.enabled:
+            await self._run_strict(self._save_crawl_progress, genre_id, per_page, fingerprints, last_page)
+
+    async def _run(self, func, *args):
+        try:
+            return await asyncio.to_thread(func, *args)
+        except Exception as e:
+            logging.error(f"Catalogue store error in {func.__name__}: {e}")
+            return None
+
+    async def _run_strict(self, func, *args):
+        try:
+            return await asyncio.to_thread(func, *args)
+        except Exception as e:
+            logging.error(f"Catalogue store error in {func.__name__}: {e}")
+            raise CatalogueStoreError(f"Catalogue store error in {func.__name__}: {e}") from e
+
+    # -- synchronous implementation --
+
+    def _upsert(self, session: Session, model, rows: list[dict], keys: list[str]) -> None:
+        """
+        Bulk INSERT ... ON CONFLICT DO UPDATE in batches
+
+        PostgreSQL and SQLite upsert natively; other dialects use _upsert_generic.
+        """
+        if not rows:
+            return
+        if engine.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif engine.dialect.name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            self._upsert_generic(session, model, rows, keys)
+            return
+
+        for batch in _batched(rows, self.batch_size):
+            statement = dialect_insert(model).values(batch)
+            updates = {
+                column: statement.excluded[column]
+                for column in batch[0] if column not in keys
+            }
+            session.execute(statement.on_conflict_do_update(index_elements=keys, set_=updates))
+
+    def _upsert_generic(self, session: Session, model, rows: list[dict], keys: list[str]) -> None:
+        """Portable upsert: looks up which keys exist, UPDATEs those rows and INSERTs the rest"""
+        key_columns = [getattr(model, key) for key in keys]
+
+        def matches(row: dict):
+            return and_(*(column == row[key] for column, key in zip(key_columns, keys)))
+
+        for batch in _batched(rows, self.batch_size):
+            found = session.execute(select(*key_columns).where(or_(*(matches(row) for row in batch))))
+            existing = {tuple(key_values) for key_values in found}
+            new_rows = []
+            for row in batch:
+                if tuple(row[key] for key in keys) not in existing:
+                    new_rows.append(row)
+                    continue
+                values = {column: value for column, value in row.items() if column not in keys}
+                if values:
+                    session.execute(update(model).where(matches(row)).values(values))
+            if new_rows:
+                session.execute(insert(model), new_rows)
+
+    def _insert(self, session: Session, model, rows: Iterable[dict]) -> None:
+        """Plain bulk INSERT (executemany) in batches"""
+        rows = list(rows)
+        for batch in _batched(rows, self.batch_size):
+            session.execute(insert(model), batch)
+
+    def _save_list_pages(self, pages: list[tuple[int, int, int, list[dict]]]) -> None:
+        now = _utcnow()
+        items: dict[str, dict] = {}
+        positions: list[dict] = []
+
+        for genre_id, page, per_page, page_items in pages:
+            for position, item in enumerate(page_items):
+                key = list_item_key(item)
+                items[key] = {
+                    'item_key': key,
+                    'title': item.get('title'),
+                    'title_eng': item.get('title_eng'),
+                    'year': item.get('year'),
+                    'genres': item.get('genres') or [],
+                    'duration': item.get('duration'),
+                    'poster': item.get('poster'),
+                    'url': item.get('url'),
+                    'scraped_at': now,
+                }
+                positions.append({
+                    'genre_id': genre_id,
+                    'page': page,
+                    'per_page': per_page,
+                    'position': position,
+                    'item_key': key,
+                    'scraped_at': now,
+                })
+
+        with SessionLocal.begin() as session:
+            self._upsert(session, ListItem, list(items.values()), ['item_key'])
+            for genre_id, page, per_page, page_items in pages:
+                # a page that shrank keeps no leftovers from its previous version
+                session.execute(delete(ListPage).where(
+                    ListPage.genre_id == genre_id,
+                    ListPage.page == page,
+                    ListPage.per_page == per_page,
+                    ListPage.position >= len(page_items),
+                ))
+            self._upsert(session, ListPage, positions, ['genre_id', 'page', 'per_page', 'position'])
+
+    def _get_list_page(self, genre_id: int, page: int, per_page: int, max_age: int) -> list[dict] | None:
+        oldest = _utcnow() - timedelta(seconds=max_age)
+        with SessionLocal() as session:
+            rows = session.execute(
+                select(ListItem)
+                .join(ListPage, ListPage.item_key == ListItem.item_key)
+                .where(
+                    ListPage.genre_id == genre_id,
+                    ListPage.page == page,
+                    ListPage.per_page == per_page,
+                    ListPage.scraped_at >= oldest,
+                )
+                .order_by(ListPage.position)
+            ).scalars().all()
+
+        if not rows:
+            return None
+        return [
+            {
+                'title': row.title,
+                'title_eng': row.title_eng,
+                'year': row.year,
+                'genres': row.genres or [],
+                'duration': row.duration,
+                'poster': row.poster,
+                'url': row.url,
+            }
+            for row in rows
+        ]
+
+    def _get_crawl_checkpoints(self, genre_ids: list[int], per_page: int) -> dict[int, int]:
+        with SessionLocal() as session:
+            rows = session.execute(
+                select(CrawlCheckpoint.genre_id, CrawlCheckpoint.last_page)
+                .where(CrawlCheckpoint.genre_id.in_(genre_ids), CrawlCheckpoint.per_page == per_page,
+                       CrawlCheckpoint.last_page > 0)
+            ).all()
+        return dict(rows)
+
+    def _get_crawl_fingerprints(self, item_keys: list[str]) -> dict[str, str]:
+        with SessionLocal() as session:
+            rows = session.execute(
+                select(CrawlFingerprint.item_key, CrawlFingerprint.fingerprint)
+                .where(CrawlFingerprint.item_key.in_(item_keys))
+            ).all()
+        return dict(rows)
+
+    def _save_crawl_progress(self, genre_id: int, per_page: int, fingerprints: dict[str, str], last_page: int) -> None:
+        now = _utcnow()
+        with SessionLocal.begin() as session:
+            self._upsert(session, CrawlFingerprint, [
+                {'item_key': key, 'fingerprint': fingerprint, 'seen_at': now}
+                for key, fingerprint in fingerprints.items()
+            ], ['item_key'])
+            self._upsert(session, CrawlCheckpoint, [
+                {'genre_id': genre_id, 'per_page': per_page, 'last_page': last_page, 'updated_at': now}
+            ], ['genre_id', 'per_page'])
+
+    def _save_movie_details(self, records: list[tuple[str | None, dict]]) -> None:
+        now = _utcnow()
+        movies: dict[str, dict] = {}
+        for movie_title, detail in records:
+            movies[detail['url']] = {
+                'url': detail['url'],
+                'query_key': normalize_title(movie_title) if movie_title else None,
+                'title': detail['title'],
+                'description': detail['description'],
+                'year': int(detail['year']),
+                'country': detail['country'],
+                'duration': detail['duration'],
+                'budget': detail['budget'],
+                'poster': detail['poster'],
+                'age_restriction': detail['age_restriction'],
+                'logline': detail['logline'],
+                'production_companies': detail['production_companies'],
+                'genres': detail['genres'],
+                'scraped_at': now,
+            }
+        details = {detail['url']: detail for _, detail in records}
+
+        with SessionLocal.begin() as session:
+            self._upsert(session, Movie, list(movies.values()), ['url'])
+            ids = dict(session.execute(select(Movie.url, Movie.id).where(Movie.url.in_(movies))).all())
+            movie_ids = list(ids.values())
+
+            # children are replaced wholesale: delete per movie set, then bulk insert
+            for model in (Rating, CrewPerson, CrewRole):
+                session.execute(delete(model).where(model.movie_id.in_(movie_ids)))
+
+            ratings, roles, people = [], [], []
+            for url, detail in details.items():
+                movie_id = ids[url]
+                for position, rating in enumerate(detail['ratings']):
+                    ratings.append({'movie_id': movie_id, 'position': position,
+                                    'platform': rating['platform'], 'rating': rating['rating']})
+                for role_position, group in enumerate(detail['crew']):
+                    roles.append({'movie_id': movie_id, 'position': role_position, 'role': group['role']})
+                    for position, person in enumerate(group['people']):
+                        people.append({'movie_id': movie_id, 'role_position': role_position, 'position': position,
+                                       'name': person['name'], 'image': person['image']})
+
+            self._insert(session, Rating, ratings)
+            self._insert(session, CrewRole, roles)
+            self._insert(session, CrewPerson, people)
+
+    def _get_movie_detail(self, query_key: str, max_age: int) -> dict | None:
+        oldest = _utcnow() - timedelta(seconds=max_age)
+        with SessionLocal() as session:
+            movie = session.execute(
+                select(Movie)
+                .where(Movie.query_key == query_key, Movie.scraped_at >= oldest)
+                .order_by(Movie.scraped_at.desc())
+                .limit(1)
+            ).scalar_one_or_none()
+            if movie is None:
+                return None
+
+            ratings = session.execute(
+                select(Rating).where(Rating.movie_id == movie.id).order_by(Rating.position)
+            ).scalars().all()
+            roles = session.execute(
+                select(CrewRole).where(CrewRole.movie_id == movie.id).order_by(CrewRole.position)
+            ).scalars().all()
+            people = session.execute(
+                select(CrewPerson).where(CrewPerson.movie_id == movie.id)
+                .order_by(CrewPerson.role_position, CrewPerson.position)
+            ).scalars().all()
+
+        people_by_role: dict[int, list[dict]] = {}
+        for person in people:
+            people_by_role.setdefault(person.role_position, []).append({'name': person.name, 'image': person.image})
+
+        return {
+            'url': movie.url,
+            'title': movie.title,
+            'description': movie.description,
+            'year': movie.year,
+            'country': movie.country,
+            'duration': movie.duration,
+            'budget': movie.budget,
+            'poster': movie.poster,
+            'age_restriction': movie.age_restriction,
+            'logline': movie.logline,
+            'production_companies': movie.production_companies,
+            'genres': movie.genres,
+            'ratings': [{'platform': rating.platform, 'rating': rating.rating} for rating in ratings],
+            'crew': [{'role': role.role, 'people': people_by_role.get(role.position, [])} for role in roles],
+        }
+
+
+catalogue_store = CatalogueStore()
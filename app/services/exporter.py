@@ -0,0 +1,323 @@
+import asyncio
+import csv
+import logging
+import os
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+from app.core import config
+from app.core.responses import to_json_line
+from app.schemas.movies import MOVIE_DETAIL_ADAPTER, MovieDetail
+from app.schemas.options import ExportFormat
+from app.services.catalogue_store import list_item_key
+from app.services.kinorium_http import KinoriumHTTPService
+
+# Columns of every export table: (name, type), type is 'str', 'int' or 'list' (of strings).
+# Nested detail fields are flattened into child tables joined on `url`; list items on `item_key`.
+EXPORT_TABLES: dict[str, tuple[tuple[str, str], ...]] = {
+    'list_items': (
+        ('item_key', 'str'), ('genre_id', 'int'), ('page', 'int'), ('position', 'int'),
+        ('title', 'str'), ('title_eng', 'str'), ('year', 'str'), ('duration', 'str'), ('poster', 'str'), ('url', 'str'),
+    ),
+    'list_item_genres': (('item_key', 'str'), ('genre', 'str')),
+    'details': (
+        ('url', 'str'), ('item_key', 'str'), ('title', 'str'), ('description', 'str'), ('year', 'int'),
+        ('duration', 'str'), ('budget', 'str'), ('poster', 'str'), ('age_restriction', 'str'), ('logline', 'str'),
+        ('country', 'list'), ('production_companies', 'list'), ('genres', 'list'),
+    ),
+    'detail_ratings': (('url', 'str'), ('platform', 'str'), ('rating', 'str')),
+    'detail_crew': (('url', 'str'), ('role', 'str'), ('position', 'int'), ('name', 'str'), ('image', 'str')),
+}
+
+# Separator of list values in CSV cells
+CSV_LIST_SEPARATOR = "|"
+
+FILE_EXTENSIONS = {ExportFormat.NDJSON: "ndjson", ExportFormat.CSV: "csv", ExportFormat.PARQUET: "parquet"}
+
+
+class ExportFormatUnavailable(RuntimeError):
+    """Raised when the dependency of an export format is not installed"""
+
+
+def check_export_format(export_format: ExportFormat) -> None:
+    """
+    Fails early when a format cannot be written in this installation
+
+    Raises:
+        ExportFormatUnavailable: For Parquet without pyarrow.
+    """
+    if export_format == ExportFormat.PARQUET:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ExportFormatUnavailable("Parquet export needs pyarrow (pip install pyarrow)") from None
+
+
+# -- table writers (run in a worker thread, one per table file) --
+
+class _NDJSONTableWriter:
+    def __init__(self, path: str, columns: tuple[tuple[str, str], ...]) -> None:
+        self._file = open(path, "wb")
+
+    def write(self, rows: list[dict]) -> None:
+        self._file.write(b"".join(to_json_line(row) for row in rows))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _CSVTableWriter:
+    def __init__(self, path: str, columns: tuple[tuple[str, str], ...]) -> None:
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._lists = [name for name, kind in columns if kind == 'list']
+        self._writer = csv.DictWriter(self._file, fieldnames=[name for name, _ in columns])
+        self._writer.writeheader()
+
+    def write(self, rows: list[dict]) -> None:
+        for row in rows:
+            if self._lists:
+                row = {**row, **{name: CSV_LIST_SEPARATOR.join(row[name] or []) for name in self._lists}}
+            self._writer.writerow(row)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetTableWriter:
+    """Appends every batch as a row group, so a file never has to be held in memory"""
+
+    def __init__(self, path: str, columns: tuple[tuple[str, str], ...]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {'str': pa.string(), 'int': pa.int64(), 'list': pa.list_(pa.string())}
+        self._pa = pa
+        self._schema = pa.schema([(name, types[kind]) for name, kind in columns])
+        compression = config.EXPORT_PARQUET_COMPRESSION
+        self._writer = pq.ParquetWriter(path, self._schema, compression=None if compression == "none" else compression)
+
+    def write(self, rows: list[dict]) -> None:
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+TABLE_WRITERS = {
+    ExportFormat.NDJSON: _NDJSONTableWriter,
+    ExportFormat.CSV: _CSVTableWriter,
+    ExportFormat.PARQUET: _ParquetTableWriter,
+}
+
+
+class CatalogueExport:
+    """
+    Writes crawled list items and movie details to one file per table, batch by batch.
+
+    Rows are buffered per table and appended to the table file every `batch_size` rows
+    in a worker thread, so memory is bounded by the batch size, not the export size.
+    Files are written as `<table>.<ext>.part` and renamed when the export completes;
+    a failed export removes them.
+
+    Attributes:
+        id (str): Export identifier, also the name of its directory in EXPORT_DIR.
+        export_format (ExportFormat): File format of every table.
+        directory (str): Directory holding the table files.
+    """
+
+    def __init__(self, export_format: ExportFormat, export_id: str | None = None, batch_size: int | None = None) -> None:
+        self.id = export_id or new_export_id()
+        self.export_format = export_format
+        self.directory = os.path.join(config.EXPORT_DIR, self.id)
+        self.batch_size = max(1, batch_size or config.EXPORT_BATCH_SIZE)
+
+        self._buffers: dict[str, list[dict]] = {table: [] for table in EXPORT_TABLES}
+        self._writers: dict[str, Any] = {}
+        self._rows: dict[str, int] = {table: 0 for table in EXPORT_TABLES}
+        # items whose genres (and details) were already exported; keys only, ~100 bytes per movie
+        self._seen_items: set[str] = set()
+
+    def add_list_page(self, genre_id: int, page: int, items: list[dict]) -> list[dict]:
+        """
+        Buffers the items of a crawled filmList page
+
+        Returns:
+            list[dict]: Items seen for the first time in this export, each with its 'item_key'.
+        """
+        first_seen = []
+        for position, item in enumerate(items):
+            key = list_item_key(item)
+            self._buffers['list_items'].append({
+                'item_key': key, 'genre_id': genre_id, 'page': page, 'position': position,
+                **{name: item.get(name) for name in ('title', 'title_eng', 'year', 'duration', 'poster', 'url')},
+            })
+            if key in self._seen_items:
+                continue
+            self._seen_items.add(key)
+            self._buffers['list_item_genres'].extend({'item_key': key, 'genre': genre} for genre in item.get('genres') or [])
+            first_seen.append({**item, 'item_key': key})
+        return first_seen
+
+    def add_detail(self, detail: dict, item_key: str | None = None) -> None:
+        """Buffers a MovieDetail record, ratings and crew go to their child tables"""
+        url = detail['url']
+        self._buffers['details'].append({
+            'item_key': item_key,
+            **{name: detail.get(name) for name, _ in EXPORT_TABLES['details'] if name != 'item_key'},
+        })
+        self._buffers['detail_ratings'].extend(
+            {'url': url, 'platform': rating['platform'], 'rating': rating['rating']}
+            for rating in detail.get('ratings') or []
+        )
+        self._buffers['detail_crew'].extend(
+            {'url': url, 'role': group['role'], 'position': position, 'name': person['name'], 'image': person.get('image')}
+            for group in detail.get('crew') or []
+            for position, person in enumerate(group['people'])
+        )
+
+    async def flush(self, force: bool = False) -> None:
+        """Writes every table buffer holding a full batch (or any rows, with force)"""
+        for table, rows in self._buffers.items():
+            if rows and (force or len(rows) >= self.batch_size):
+                self._buffers[table] = []
+                await asyncio.to_thread(self._write, table, rows)
+                self._rows[table] += len(rows)
+
+    async def close(self) -> dict:
+        """
+        Writes the remaining rows and publishes the table files
+
+        Returns:
+            dict: {'table name': {'path', 'rows'}} of every table that received rows.
+        """
+        await self.flush(force=True)
+        return await asyncio.to_thread(self._publish)
+
+    async def abort(self) -> None:
+        """Closes and removes the partial table files"""
+        await asyncio.to_thread(self._discard)
+
+    # -- internals (worker thread) --
+
+    def _path(self, table: str) -> str:
+        return os.path.join(self.directory, f"{table}.{FILE_EXTENSIONS[self.export_format]}")
+
+    def _write(self, table: str, rows: list[dict]) -> None:
+        writer = self._writers.get(table)
+        if writer is None:
+            os.makedirs(self.directory, exist_ok=True)
+            writer = self._writers[table] = TABLE_WRITERS[self.export_format](self._path(table) + ".part", EXPORT_TABLES[table])
+        writer.write(rows)
+
+    def _publish(self) -> dict:
+        tables = {}
+        for table, writer in self._writers.items():
+            writer.close()
+            os.replace(self._path(table) + ".part", self._path(table))
+            tables[table] = {'path': self._path(table), 'rows': self._rows[table]}
+        self._writers.clear()
+        return tables
+
+    def _discard(self) -> None:
+        for table, writer in self._writers.items():
+            try:
+                writer.close()
+                os.unlink(self._path(table) + ".part")
+            except Exception as e:
+                logging.debug(f"Could not remove the partial export file of {table}: {e}")
+        self._writers.clear()
+
+
+def new_export_id() -> str:
+    """Timestamp plus a random suffix, sortable by creation time"""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+async def export_catalogue(
+        export: CatalogueExport,
+        genre_ids: list[int],
+        per_page: int,
+        first_page: int = 1,
+        last_page: int | None = None,
+        concurrency: int | None = None,
+        detail_loader: Callable[[str], Awaitable[MovieDetail | dict | None]] | None = None,
+        detail_concurrency: int | None = None
+) -> dict:
+    """
+    Crawls filmList pages into an export, optionally scraping the details of every movie
+
+    Pages are consumed as the crawl yields them. Detail scrapes run at most `detail_concurrency`
+    at a time; while that many are in flight the crawl is not read further, so neither the
+    crawled pages nor the pending scrapes pile up in memory.
+
+    Args:
+        export (CatalogueExport): Export the rows are written to.
+        genre_ids (list[int]): IDs of the genres to crawl.
+        per_page (int): Number of movies per page.
+        first_page (int): First page to fetch for every genre.
+        last_page (int | None): Last page to fetch; None crawls until a page comes back empty.
+        concurrency (int | None): Pages in flight, defaults to CRAWL_CONCURRENCY.
+        detail_loader (Callable | None): Scrapes a title into a MovieDetail or its dict (None when
+            not found); without it only list items are exported.
+        detail_concurrency (int | None): Detail scrapes in flight, defaults to EXPORT_DETAIL_CONCURRENCY.
+
+    Returns:
+        dict: {'export_id', 'format', 'directory', 'tables', 'pages', 'failed_pages', 'details', 'failed_details'}
+    """
+    limit = max(1, detail_concurrency or config.EXPORT_DETAIL_CONCURRENCY)
+    pending: set[asyncio.Task] = set()
+    summary = {'pages': 0, 'failed_pages': 0, 'details': 0, 'failed_details': 0}
+
+    async def load_detail(item: dict) -> None:
+        try:
+            detail = await detail_loader(item['title'])
+            if detail is not None:
+                # typed columns need the validated shape (e.g. year as int)
+                detail = MOVIE_DETAIL_ADAPTER.validate_python(detail).model_dump()
+        except Exception as e:
+            logging.warning(f"Export {export.id}: detail scrape of {item['title']} failed: {e}")
+            detail = None
+        if detail is None:
+            summary['failed_details'] += 1
+            return
+        export.add_detail(detail, item_key=item['item_key'])
+        summary['details'] += 1
+
+    async def settle(keep: int) -> None:
+        # waits until at most `keep` detail scrapes are in flight
+        while len(pending) > keep:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.difference_update(done)
+
+    crawl = KinoriumHTTPService().crawl(genre_ids, per_page, first_page=first_page, last_page=last_page,
+                                        concurrency=concurrency)
+    try:
+        async for result in crawl:
+            if 'error' in result:
+                summary['failed_pages'] += 1
+                logging.warning(f"Export {export.id}: genre {result['genre_id']} page {result['page']} failed: {result['error']}")
+                continue
+            summary['pages'] += 1
+            first_seen = export.add_list_page(result['genre_id'], result['page'], result['data'])
+
+            if detail_loader is not None:
+                for item in first_seen:
+                    if item.get('title'):
+                        await settle(limit - 1)
+                        await export.flush()  # details arrive between pages too
+                        pending.add(asyncio.create_task(load_detail(item)))
+            await export.flush()
+
+        await settle(0)
+        tables = await export.close()
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await export.abort()
+        raise
+    finally:
+        await crawl.aclose()
+
+    return {'export_id': export.id, 'format': export.export_format.value, 'directory': export.directory,
+            'tables': tables, **summary}
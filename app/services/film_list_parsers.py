@@ -0,0 +1,235 @@
+"""
+Parsers of the filmList handler HTML.
+
+Two interchangeable backends produce identical output:
+    - "bs4":  BeautifulSoup tree with CSS selectors (reference implementation)
+    - "lxml": lxml tree with precompiled XPath expressions (faster)
+
+The backend is chosen with the FILM_LIST_PARSER setting. The functions are
+module-level so they can be shipped to a process pool.
+"""
+from bs4 import BeautifulSoup
+from lxml import etree
+from app.core import config
+
+
+def parse_film_list_bs4(html: str) -> list:
+    """
+    Parses raw HTML content to extract movie information.
+
+    Params:
+        html (str): Accepts a html file to scrap in
+    Retuns:
+        list[dict]: A list of dictionaries containing movie details
+    """
+    soup = BeautifulSoup(html, "lxml")
+    movies = soup.select('div.item')
+    results = []
+
+    for movie in movies:
+        poster = movie.select_one('.movie-list-poster')
+        title = movie.select_one('.movie-title__text span')
+        title_eng = None
+        year = None
+        genres = []
+        duration = None
+        clean_poster = None
+
+
+        #raw
+        title_eng_and_year = movie.select_one('.filmList__small-text')
+        genres_duration = movie.select_one('.filmList__extra-info')
+
+        if title_eng_and_year:
+            #splits title_english variant and year of the movie
+            full_text = title_eng_and_year.get_text(strip=True).split('(')[0].split(',')
+            title_eng = full_text[0].strip()
+            year = full_text[-1].strip()
+
+        if genres_duration:
+            # split genres and duration
+            full_text = genres_duration.find(string=True)
+
+            if full_text:
+                full_text = full_text.split(',')
+                genres = [g.strip() for g in full_text[:-1]]
+                duration = " ".join(full_text[-1].split())
+
+        if poster:
+            # cleans the poster link
+            raw_poster = str(poster.get('src', ''))
+            clean_poster = raw_poster.split('?')[0]
+
+        # detail page link: the one wrapping the title, else the first link of the item (the poster)
+        links = movie.select('a[href]')
+        link = next((a for a in links if a.select_one('.movie-title__text')), links[0] if links else None)
+        url = str(link['href']) if link else None
+
+        results.append({
+            'title': title.get_text(strip=True) if title else None,
+            'title_eng': title_eng if title_eng else None,
+            'year': year if year else None,
+            'genres': genres if genres else [],
+            'duration': duration if duration else None,
+            'poster': clean_poster if clean_poster else None,
+            'url': url if url else None
+        })
+    return results
+
+
+# -- lxml backend --
+
+def _has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector `.name`"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Compiled once per process. `.//` searches descendants only, like select() on a bs4 Tag.
+_ITEMS = etree.XPath(f"//div[{_has_class('item')}]")
+_POSTER = etree.XPath(f"(.//*[{_has_class('movie-list-poster')}])[1]")
+_TITLE = etree.XPath(f"(.//*[{_has_class('movie-title__text')}]//span)[1]")
+_SMALL_TEXT = etree.XPath(f"(.//*[{_has_class('filmList__small-text')}])[1]")
+_EXTRA_INFO = etree.XPath(f"(.//*[{_has_class('filmList__extra-info')}])[1]")
+# the link wrapping the title, else the first link of the item (the poster)
+_TITLE_LINK = etree.XPath(f"(.//a[.//*[{_has_class('movie-title__text')}]]/@href)[1]", smart_strings=False)
+_ANY_LINK = etree.XPath("(.//a/@href)[1]", smart_strings=False)
+# bs4 get_text() skips comments and the contents of script/style/template
+_TEXT_NODES = etree.XPath(
+    ".//text()[not(ancestor::script) and not(ancestor::style) and not(ancestor::template)]",
+    smart_strings=False,
+)
+# bs4 find(string=True) returns the first string of any kind, comments included
+_FIRST_STRING = etree.XPath("(.//text() | .//comment())[1]", smart_strings=False)
+
+
+def _stripped_text(element) -> str:
+    """Equivalent of bs4 get_text(strip=True)"""
+    return "".join(text.strip() for text in _TEXT_NODES(element) if text.strip())
+
+
+def _first_string(element) -> str | None:
+    """Equivalent of bs4 find(string=True)"""
+    found = _FIRST_STRING(element)
+    if not found:
+        return None
+    node = found[0]
+    return node if isinstance(node, str) else node.text
+
+
+def parse_film_list_lxml(html: str) -> list:
+    """
+    Parses raw HTML content to extract movie information with precompiled XPath.
+
+    Produces exactly the same output as parse_film_list_bs4.
+
+    Params:
+        html (str): Accepts a html file to scrap in
+    Returns:
+        list[dict]: A list of dictionaries containing movie details
+    """
+    if not html:
+        return []
+    # etree.HTML uses lxml's per-thread default parser, so this is safe in a thread pool
+    root = etree.HTML(html)
+    if root is None:
+        return []
+
+    return [parse_film_list_item(movie) for movie in _ITEMS(root)]
+
+
+def is_film_list_item(element) -> bool:
+    """True for a `div.item` element"""
+    return element.tag == "div" and "item" in (element.get("class") or "").split()
+
+
+def parse_film_list_item(movie) -> dict:
+    """
+    Extracts one movie from a `div.item` lxml element
+
+    Params:
+        movie (lxml.etree._Element): The item element.
+    Returns:
+        dict: Movie details, same shape as the parse_film_list entries
+    """
+    poster = _POSTER(movie)
+    title = _TITLE(movie)
+    title_eng_and_year = _SMALL_TEXT(movie)
+    genres_duration = _EXTRA_INFO(movie)
+    title_eng = None
+    year = None
+    genres = []
+    duration = None
+    clean_poster = None
+
+    if title_eng_and_year:
+        full_text = _stripped_text(title_eng_and_year[0]).split('(')[0].split(',')
+        title_eng = full_text[0].strip()
+        year = full_text[-1].strip()
+
+    if genres_duration:
+        full_text = _first_string(genres_duration[0])
+
+        if full_text:
+            full_text = full_text.split(',')
+            genres = [g.strip() for g in full_text[:-1]]
+            duration = " ".join(full_text[-1].split())
+
+    if poster:
+        clean_poster = str(poster[0].get('src', '')).split('?')[0]
+
+    url = _TITLE_LINK(movie) or _ANY_LINK(movie)
+
+    return {
+        'title': _stripped_text(title[0]) if title else None,
+        'title_eng': title_eng if title_eng else None,
+        'year': year if year else None,
+        'genres': genres if genres else [],
+        'duration': duration if duration else None,
+        'poster': clean_poster if clean_poster else None,
+        'url': url[0] if url and url[0] else None
+    }
+
+
+def extract_title_links(html: str) -> list[dict]:
+    """
+    Extracts the detail page link of every filmList item, for the title index
+
+    Params:
+        html (str): filmList HTML.
+    Returns:
+        list[dict]: {'title', 'title_eng', 'url'} per item with a link; url is site-relative.
+    """
+    root = etree.HTML(html) if html else None
+    if root is None:
+        return []
+
+    links = []
+    for movie in _ITEMS(root):
+        item = parse_film_list_item(movie)
+        if item['url']:
+            links.append({'title': item['title'], 'title_eng': item['title_eng'], 'url': item['url']})
+    return links
+
+
+FILM_LIST_PARSERS = {
+    "bs4": parse_film_list_bs4,
+    "lxml": parse_film_list_lxml,
+}
+
+
+def parse_film_list(html: str, backend: str | None = None) -> list:
+    """
+    Parses filmList HTML with the configured backend
+
+    Params:
+        html (str): filmList HTML.
+        backend (str | None): "bs4" or "lxml", defaults to FILM_LIST_PARSER.
+    Returns:
+        list[dict]: A list of dictionaries containing movie details
+    """
+    name = backend or config.FILM_LIST_PARSER
+    try:
+        parser = FILM_LIST_PARSERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown filmList parser '{name}', expected one of {sorted(FILM_LIST_PARSERS)}")
+    return parser(html)
@@ -0,0 +1,212 @@
+"""
+Incremental parsing of filmList responses.
+
+The handler answers with JSON whose `result.html` string holds the item list. Instead of
+decoding the whole body, extracting the string and building a full tree, the response
+is consumed chunk by chunk:
+
+    bytes -> JSONStringExtractor (streams the decoded result.html) -> lxml HTMLPullParser
+          -> one dict per finished `div.item`, after which the element is dropped
+
+so memory stays flat regardless of the page size.
+"""
+import codecs
+from lxml import etree
+from app.services.film_list_parsers import is_film_list_item, parse_film_list_item
+
+_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+_WHITESPACE = " \t\r\n"
+
+
+class JSONStringExtractor:
+    """
+    Streams the decoded value of one string field out of a JSON document fed in pieces.
+
+    Only the structure around the target is tracked; every other value is skipped
+    without being stored.
+
+    Attributes:
+        path (tuple[str, ...]): Keys leading to the wanted string, e.g. ('result', 'html').
+        parent_is_object (bool): Whether the value holding the target key was a JSON object.
+    """
+
+    def __init__(self, path: tuple[str, ...]) -> None:
+        self.path = path
+        self.parent_is_object = False
+
+        self._stack: list[list] = []     # per open container: [kind, current key]
+        self._expect_key = False
+        self._in_string = False
+        self._string_is_key = False
+        self._string_is_target = False
+        self._key_parts: list[str] = []
+        self._escape = ""                # pending escape sequence, e.g. "\\u00"
+        self._high_surrogate = ""
+        self._in_literal = False
+
+    def feed(self, text: str) -> list[str]:
+        """
+        Consumes the next piece of the document
+
+        Returns:
+            list[str]: Decoded pieces of the target string found in this piece.
+        """
+        out: list[str] = []
+        i, length = 0, len(text)
+        while i < length:
+            if self._in_string:
+                i = self._read_string(text, i, out)
+                continue
+
+            char = text[i]
+            if self._in_literal:
+                # numbers, true, false, null: skip to the next delimiter
+                if char in ",}]" or char in _WHITESPACE:
+                    self._in_literal = False
+                else:
+                    i += 1
+                    continue
+
+            if char in _WHITESPACE or char == ":":
+                pass
+            elif char == '"':
+                self._in_string = True
+                self._string_is_key = self._expect_key
+                self._string_is_target = not self._expect_key and self._current_path() == self.path
+                self._key_parts = []
+            elif char == "{":
+                if self._current_path() == self.path[:-1]:
+                    self.parent_is_object = True
+                self._stack.append(["object", None])
+                self._expect_key = True
+            elif char == "[":
+                self._stack.append(["array", None])
+                self._expect_key = False
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+                self._expect_key = False
+            elif char == ",":
+                self._expect_key = bool(self._stack) and self._stack[-1][0] == "object"
+            else:
+                self._in_literal = True
+            i += 1
+        return out
+
+    def _current_path(self) -> tuple:
+        return tuple(frame[1] for frame in self._stack)
+
+    def _read_string(self, text: str, i: int, out: list[str]) -> int:
+        """Consumes string content from text[i:], returns the index after what was consumed"""
+        sink = out if self._string_is_target else (self._key_parts if self._string_is_key else None)
+
+        if self._escape:
+            # an escape may be split across pieces: "\" | "u00" | "e9"
+            while i < len(text) and len(self._escape) < (6 if self._escape[1:2] == "u" else 2):
+                self._escape += text[i]
+                i += 1
+            if len(self._escape) < (6 if self._escape[1:2] == "u" else 2):
+                return i
+            decoded = self._decode_escape(self._escape)
+            self._escape = ""
+            if sink is not None and decoded:
+                sink.append(decoded)
+            return i
+
+        quote = text.find('"', i)
+        backslash = text.find('\\', i)
+        stop = min(position for position in (quote, backslash, len(text)) if position != -1)
+
+        if stop > i and sink is not None:
+            sink.append(self._flush_surrogate() + text[i:stop])
+        if stop == len(text):
+            return stop
+        if stop == backslash:
+            self._escape = "\\"
+            return stop + 1
+
+        # closing quote
+        if sink is not None and self._high_surrogate:
+            sink.append(self._flush_surrogate())
+        self._in_string = False
+        if self._string_is_key:
+            self._stack[-1][1] = "".join(self._key_parts)
+            self._expect_key = False
+        return stop + 1
+
+    def _decode_escape(self, sequence: str) -> str:
+        if sequence[1] != "u":
+            return self._flush_surrogate() + _ESCAPES.get(sequence[1], sequence[1])
+        code = int(sequence[2:], 16)
+        if 0xD800 <= code <= 0xDBFF:
+            pending = self._flush_surrogate()
+            self._high_surrogate = chr(code)
+            return pending
+        if 0xDC00 <= code <= 0xDFFF and self._high_surrogate:
+            high, self._high_surrogate = self._high_surrogate, ""
+            return chr(0x10000 + ((ord(high) - 0xD800) << 10) + (code - 0xDC00))
+        return self._flush_surrogate() + chr(code)
+
+    def _flush_surrogate(self) -> str:
+        pending, self._high_surrogate = self._high_surrogate, ""
+        return pending
+
+
+class FilmListStream:
+    """
+    Turns the raw bytes of a filmList response into movie dicts as they arrive.
+
+    Every finished `div.item` is parsed with the lxml backend (same output as
+    parse_film_list) and then removed from the tree together with its already
+    processed siblings.
+
+    Attributes:
+        result_found (bool): Whether the response had a `result` object, i.e. the
+            session was accepted. Meaningful after close().
+        items (int): Items produced so far.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._json = JSONStringExtractor(("result", "html"))
+        self._html = etree.HTMLPullParser(events=("end",), tag="div")
+        self._started = False
+        self.items = 0
+
+    @property
+    def result_found(self) -> bool:
+        return self._json.parent_is_object
+
+    def feed(self, chunk: bytes) -> list[dict]:
+        """Consumes a piece of the response body, returns the items completed by it"""
+        for piece in self._json.feed(self._decoder.decode(chunk)):
+            self._started = True
+            self._html.feed(piece)
+        return self._collect()
+
+    def close(self) -> list[dict]:
+        """Finishes the response, returns the remaining items"""
+        for piece in self._json.feed(self._decoder.decode(b"", final=True)):
+            self._started = True
+            self._html.feed(piece)
+        if self._started:
+            try:
+                self._html.close()
+            except etree.XMLSyntaxError:
+                pass  # empty or truncated markup, nothing more to collect
+        return self._collect()
+
+    def _collect(self) -> list[dict]:
+        items = []
+        for _, element in self._html.read_events():
+            if not is_film_list_item(element):
+                continue
+            items.append(parse_film_list_item(element))
+            # drop the finished item and everything before it
+            element.clear(keep_tail=False)
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+        self.items += len(items)
+        return items
@@ -1,15 +1,26 @@
-from app.core.http_client import http_client
-from bs4 import BeautifulSoup
+from app.core import config
+from app.core.cache import TTLCache
+from app.core.credentials import credential_pool, Credential, CredentialsExhausted
+from app.core.http_client import http_client, THROTTLE_STATUSES, UpstreamBlocked
+from app.core.metrics import timed
+from app.core.upstream import upstream_breaker
+from app.core.workers import parse_pool
+from app.services.catalogue_store import catalogue_store, CatalogueStoreError, list_item_fingerprint, list_item_key
+from app.services.film_list_parsers import parse_film_list, extract_title_links
+from app.services.film_list_stream import FilmListStream
+from app.services.kinorium_urls import FILM_LIST_URL, CATALOGUE_URL, absolute_url
+from app.services.title_index import title_index
+from typing import AsyncIterator
+import asyncio
 import logging
-import os
-from dotenv import load_dotenv
 
-load_dotenv()
-
-SESSION=os.getenv("SESSION", "1u2j4mf7a3i0i3d9h83rfb8a44")
-X119=os.getenv("X119", "88513")
-PHPSESSID=os.getenv("PHPSESSID", "pj95efe3eommbikt25idka2osn")
-USER_AGENT=os.getenv("USER_AGENT", "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:146.0) Gecko/20100101 Firefox/146.0")
+# Shared cache of parsed filmList pages keyed by (genre_id, page, per_page)
+list_cache = TTLCache(
+    name="filmList",
+    ttl=config.LIST_CACHE_TTL,
+    stale_ttl=config.LIST_CACHE_STALE_TTL,
+    max_size=config.LIST_CACHE_MAX_SIZE,
+)
 
 
 class KinoriumHTTPService:
@@ -29,109 +40,348 @@ class KinoriumHTTPService:
     def __init__(self) -> None:
         self.http_client = http_client
 
-    async def start_scraper(self, genre_id: int, page: int, per_page: int) -> list:
+    async def start_scraper(self, genre_id: int, page: int, per_page: int, refresh: bool = False) -> list:
         """
         Main method to execute the HTTP scraping process for a movie details page
 
+        Results are served from list_cache; identical concurrent misses share one upstream fetch.
+
         Args:
             genre_id (int): ID of the genre to filter movies.
             page (int): Current page number for pagination. (Optional)
             per_page (int): Number of movies to display per page. (Optional)
+            refresh (bool): Fetch the page again even if it is cached.
 
         Returns:
             list[dict]: A list of dictionaries containing movie details
         """
+        return await list_cache.get_or_load(
+            (genre_id, page, per_page),
+            lambda: self._scrape_page(genre_id, page, per_page),
+            force=refresh
+        )
+
+    async def stream_scraper(self, genre_id: int, page: int, per_page: int) -> AsyncIterator[dict]:
+        """
+        Streams the movies of one filmList page while the response is still downloading
+
+        The body is decoded and parsed incrementally (see film_list_stream), so memory
+        does not grow with `per_page`. Streamed pages bypass list_cache and the catalogue
+        store, both of which need the complete page.
+
+        Args:
+            genre_id (int): ID of the genre to filter movies.
+            page (int): Current page number for pagination.
+            per_page (int): Number of movies to display per page.
+
+        Yields:
+            dict: Movie details, in page order.
+        """
+        for _ in range(max(1, config.CREDENTIAL_ATTEMPTS)):
+            credential = credential_pool.acquire()
+            stream = FilmListStream()
+
+            try:
+                async with self.http_client.get(
+                    FILM_LIST_URL, breaker=upstream_breaker, **self._list_request(credential, genre_id, page, per_page)
+                ) as response:
+                    if response.status in THROTTLE_STATUSES:
+                        continue
+                    if response.status != 200:
+                        credential_pool.report_failure(credential, f"filmList returned status {response.status}")
+                        continue
+                    with timed("http_list", "stream"):
+                        async for chunk in response.content.iter_chunked(config.STREAM_CHUNK_SIZE):
+                            for item in stream.feed(chunk):
+                                yield item
+                        for item in stream.close():
+                            yield item
+                    if not stream.result_found:
+                        # nothing was yielded: without a result object there are no items
+                        raise UpstreamBlocked("filmList returned no result")
+            except UpstreamBlocked as e:
+                credential_pool.report_failure(credential, str(e))
+                continue
+
+            credential_pool.report_success(credential)
+            return
+
+        logging.warning('The HTML response is empty.')
+
+    async def _scrape_page(self, genre_id: int, page: int, per_page: int) -> list:
+        """
+        Help Method: Fetches and parses one filmList page, bypassing the cache, and stores it
+        """
         #Fething Data by genre, per_page and page number
-        html_result = await self._fetch_data(genre_id, page, per_page)
+        with timed("http_list", "fetch"):
+            html_result = await self._fetch_data(genre_id, page, per_page)
+        with timed("http_list", "parse"):
+            results = await self._parse(html_result)
+        if results:
+            with timed("http_list", "store"):
+                await catalogue_store.save_list_page(genre_id, page, per_page, results)
+            if title_index.enabled:
+                await self._index_titles(html_result)
         #returns scraped movie details
-        return self._scrap_movie_details(html_result)
+        return results
+
+    async def crawl(
+            self,
+            genre_ids: list[int],
+            per_page: int,
+            first_page: int = 1,
+            last_page: int | None = None,
+            concurrency: int | None = None,
+            start_pages: dict[int, int] | None = None
+    ) -> AsyncIterator[dict]:
+        """
+        Crawls several filmList pages of several genres with bounded fan-out
 
+        Pages are fetched concurrently (at most `concurrency` in flight) and yielded
+        as soon as each one completes, so results arrive out of page order.
 
+        Args:
+            genre_ids (list[int]): IDs of the genres to crawl.
+            per_page (int): Number of movies per page.
+            first_page (int): First page to fetch for every genre.
+            last_page (int | None): Last page to fetch; None crawls until a page comes back empty.
+            concurrency (int | None): Pages in flight, defaults to CRAWL_CONCURRENCY.
+            start_pages (dict[int, int] | None): Per-genre overrides of `first_page`.
 
-    def _scrap_movie_details(self, html: str) -> list:
+        Yields:
+            dict: {'genre_id', 'page', 'data': list[dict]} per non-empty page,
+                  or {'genre_id', 'page', 'error': str} when a page failed.
         """
-        Parses raw HTML content to extract movie information.
-        
-        Params: 
-            html (str): Accepts a html file to scrap in
-        Retuns:
-            list[dict]: A list of dictionaries containing movie details
+        limit = max(1, concurrency or config.CRAWL_CONCURRENCY)
+        next_page = {genre_id: (start_pages or {}).get(genre_id, first_page) for genre_id in dict.fromkeys(genre_ids)}
+        stop_page = {
+            genre_id: last_page if last_page is not None else page + config.CRAWL_MAX_PAGES - 1
+            for genre_id, page in next_page.items()
+        }
+        exhausted: set[int] = set()
+        pending: set[asyncio.Task] = set()
+
+        def schedule() -> None:
+            # round-robin over the genres that still have pages left
+            while len(pending) < limit:
+                candidates = [g for g, p in next_page.items() if g not in exhausted and p <= stop_page[g]]
+                if not candidates:
+                    return
+                genre_id = min(candidates, key=lambda g: next_page[g])
+                pending.add(asyncio.create_task(self._crawl_page(genre_id, next_page[genre_id], per_page)))
+                next_page[genre_id] += 1
+
+        schedule()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    result = task.result()
+
+                    if 'error' in result:
+                        if last_page is None:
+                            # an open-ended crawl cannot tell a failing page from the end of the genre
+                            exhausted.add(result['genre_id'])
+                        yield result
+                    elif not result['data']:
+                        exhausted.add(result['genre_id'])
+                    else:
+                        yield result
+                schedule()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def incremental_crawl(
+            self,
+            genre_ids: list[int],
+            per_page: int,
+            last_page: int | None = None,
+            concurrency: int | None = None,
+            resume: bool = True
+    ) -> AsyncIterator[dict]:
         """
-        soup = BeautifulSoup(html, "lxml")
-        movies = soup.select('div.item')
-        results = []
-
-        for movie in movies:
-            poster = movie.select_one('.movie-list-poster')
-            title = movie.select_one('.movie-title__text span')
-            title_eng = None
-            year = None
-            genres = []
-            duration = None
-            clean_poster = None
-
-
-            #raw
-            title_eng_and_year = movie.select_one('.filmList__small-text')
-            genres_duration = movie.select_one('.filmList__extra-info')
-
-            if title_eng_and_year:
-                #splits title_english variant and year of the movie
-                full_text = title_eng_and_year.get_text(strip=True).split('(')[0].split(',')
-                title_eng = full_text[0].strip()
-                year = full_text[-1].strip()
-
-            if genres_duration:
-                # split genres and duration
-                full_text = genres_duration.find(string=True)
-
-                if full_text:
-                    full_text = full_text.split(',')
-                    genres = [g.strip() for g in full_text[:-1]]
-                    duration = " ".join(full_text[-1].split())
-
-            if poster:
-                # cleans the poster link
-                raw_poster = str(poster.get('src', ''))
-                clean_poster = raw_poster.split('?')[0]
-
-            results.append({
-                'title': title.get_text(strip=True) if title else None,
-                'title_eng': title_eng if title_eng else None,
-                'year': year if year else None,
-                'genres': genres if genres else [],
-                'duration': duration if duration else None,
-                'poster': clean_poster if clean_poster else None
-            })
-        return results
+        Crawls genres from page 1 and yields only the items that are new or changed since the last crawl
 
+        Every item is fingerprinted (see list_item_fingerprint) and compared with the fingerprint
+        the previous incremental crawl stored. A page's fingerprints and the genre checkpoint (last
+        page completed without gaps) are saved only after its changes were consumed, so an interrupted
+        crawl resumes after the checkpoint and never loses a change; at worst it reports one again.
+        A genre crawled to its end resets its checkpoint, the next run starts from page 1.
+
+        Needs the catalogue store (CATALOGUE_ENABLED).
+
+        Args:
+            genre_ids (list[int]): IDs of the genres to crawl.
+            per_page (int): Number of movies per page.
+            last_page (int | None): Last page to fetch; None crawls until a page comes back empty.
+            concurrency (int | None): Pages in flight, defaults to CRAWL_CONCURRENCY.
+            resume (bool): Continue unfinished crawls from their checkpoint instead of page 1.
+
+        Yields:
+            dict: {'genre_id', 'page', 'data': list[dict]} per page with changes, every item
+                  carrying 'change': 'new' | 'changed'; {'genre_id', 'page', 'error'} per failed
+                  page; finally {'summary': dict} with page and item counts. When the catalogue
+                  store fails the crawl stops and the summary line also carries 'error'.
+        """
+        genre_ids = list(dict.fromkeys(genre_ids))
+        summary = {
+            'pages': 0, 'items': 0, 'new': 0, 'changed': 0, 'unchanged': 0, 'failed_pages': 0, 'resumed': {},
+        }
+        try:
+            checkpoints = await catalogue_store.get_crawl_checkpoints(genre_ids, per_page) if resume else {}
+            summary['resumed'] = {genre_id: page + 1 for genre_id, page in checkpoints.items()}
+            completed = {genre_id: checkpoints.get(genre_id, 0) for genre_id in genre_ids}
+            finished_pages: dict[int, set[int]] = {genre_id: set() for genre_id in genre_ids}
+            failed: set[int] = set()
+
+            pages = self.crawl(
+                genre_ids, per_page, last_page=last_page, concurrency=concurrency,
+                start_pages={genre_id: page + 1 for genre_id, page in completed.items()}
+            )
+            try:
+                async for result in pages:
+                    genre_id, page = result['genre_id'], result['page']
+                    if 'error' in result:
+                        failed.add(genre_id)
+                        summary['failed_pages'] += 1
+                        yield result
+                        continue
+
+                    fingerprints = {}
+                    changes = []
+                    keys = [list_item_key(item) for item in result['data']]
+                    known = await catalogue_store.get_crawl_fingerprints(keys)
+                    for key, item in zip(keys, result['data']):
+                        fingerprint = list_item_fingerprint(item)
+                        fingerprints[key] = fingerprint
+                        if key not in known:
+                            changes.append({**item, 'change': 'new'})
+                        elif known[key] != fingerprint:
+                            changes.append({**item, 'change': 'changed'})
+
+                    summary['pages'] += 1
+                    summary['items'] += len(keys)
+                    summary['new'] += sum(1 for item in changes if item['change'] == 'new')
+                    summary['changed'] += sum(1 for item in changes if item['change'] == 'changed')
+                    summary['unchanged'] += len(keys) - len(changes)
+                    if changes:
+                        yield {'genre_id': genre_id, 'page': page, 'data': changes}
+
+                    # the consumer has the changes: remember the page and move the checkpoint over finished pages
+                    finished_pages[genre_id].add(page)
+                    while completed[genre_id] + 1 in finished_pages[genre_id]:
+                        completed[genre_id] += 1
+                        finished_pages[genre_id].discard(completed[genre_id])
+                    await catalogue_store.save_crawl_progress(genre_id, per_page, fingerprints, completed[genre_id])
+            finally:
+                await pages.aclose()
+
+            for genre_id in genre_ids:
+                if genre_id not in failed:
+                    await catalogue_store.save_crawl_progress(genre_id, per_page, {}, 0)
+        except CatalogueStoreError as e:
+            # without the stored fingerprints every item would look new, so the crawl stops here
+            logging.error(f"Incremental crawl of genres {genre_ids} stopped: {e}")
+            yield {'summary': summary, 'error': str(e)}
+            return
+        yield {'summary': summary}
+
+    async def _crawl_page(self, genre_id: int, page: int, per_page: int) -> dict:
+        """
+        Help Method: Fetches and parses one filmList page for the crawl
+
+        Returns:
+            dict: Page result with 'data', or with 'error' if the request failed.
+        """
+        try:
+            results = await self._scrape_page(genre_id, page, per_page)
+            return {'genre_id': genre_id, 'page': page, 'data': results}
+        except Exception as e:
+            logging.warning(f"Crawl of genre {genre_id} page {page} failed: {e}")
+            return {'genre_id': genre_id, 'page': page, 'error': str(e)}
+
+    async def _parse(self, html: str) -> list:
+        """
+        Help Method: Parses filmList HTML in the parse worker pool, keeping the event loop free
+
+        Small payloads are parsed inline (see PARSE_INLINE_THRESHOLD).
+        """
+        return await parse_pool.run(parse_film_list, html, config.FILM_LIST_PARSER)
+
+    async def _index_titles(self, html: str) -> None:
+        """Help Method: Adds the detail links of a filmList page to the title index"""
+        links = await parse_pool.run(extract_title_links, html)
+        title_index.add_list_items([{**link, 'url': absolute_url(link['url'])} for link in links])
 
     async def _fetch_data(self, genre_id: int, page: int, per_page: int) -> str:
         """
         Sends an asynchronous GET request to the Kinorium handler
-        
+
+        The session cookies are taken from the credential pool. A response without the
+        expected JSON result means the session was rejected: the set is reported and
+        the request is repeated with the next one, up to CREDENTIAL_ATTEMPTS times.
+
         Args:
             genre_id (int): ID of the genre to filter movies.
             page (int): Current page number for pagination. (Optional)
             per_page (int): Number of movies to display per page. (Optional)
 
         Returns:
-            str: The HTML content extracted from the JSON response or an empty string.    
+            str: The HTML content extracted from the JSON response ("" past the last page).
+
+        Raises:
+            CredentialsExhausted: If no attempt got a result, so an empty page is never
+                mistaken for the end of the genre.
         """
-        url = "https://ua.kinorium.com/handlers/filmList/"
+        attempts = max(1, config.CREDENTIAL_ATTEMPTS)
+        for _ in range(attempts):
+            credential = credential_pool.acquire()
+            html = await self._request_list(credential, genre_id, page, per_page)
+            if html is not None:
+                credential_pool.report_success(credential)
+                return html
 
-        #(обязательно проверь актуальность 'session')
-        cookies = {
-            "session": SESSION,
-            "x119": X119,
-            "PHPSESSID": PHPSESSID
-        }
+        raise CredentialsExhausted(f"filmList of genre {genre_id} page {page} got no result in {attempts} attempts")
+
+    async def _request_list(self, credential: Credential, genre_id: int, page: int, per_page: int) -> str | None:
+        """
+        Help Method: One filmList request with the given credential set
+
+        Returns:
+            str | None: result.html ("" past the last page), or None when the session was not accepted.
+        """
+        try:
+            async with self.http_client.get(
+                FILM_LIST_URL, breaker=upstream_breaker, **self._list_request(credential, genre_id, page, per_page)
+            ) as response:
+                if response.status in THROTTLE_STATUSES:
+                    return None  # throttling, not the session's fault; the rate limiter backs off
+                if response.status != 200:
+                    credential_pool.report_failure(credential, f"filmList returned status {response.status}")
+                    return None
+                try:
+                    data = await response.json(content_type=None)
+                except ValueError:
+                    raise UpstreamBlocked("filmList returned no JSON")
+
+                result = data.get("result") if isinstance(data, dict) else None
+                if not isinstance(result, dict):
+                    raise UpstreamBlocked("filmList returned no result")
+        except UpstreamBlocked as e:
+            credential_pool.report_failure(credential, str(e))
+            return None
+        return result.get("html", "")
+
+    def _list_request(self, credential: Credential, genre_id: int, page: int, per_page: int) -> dict:
+        """Help Method: Query parameters, headers and cookies of a filmList request"""
 
         # 3. Заголовки, чтобы запрос выглядел как от твоего браузера
         headers = {
-            "User-Agent": USER_AGENT,
+            "User-Agent": credential.user_agent,
             "X-Requested-With": "XMLHttpRequest",
-            "Referer": "https://ua.kinorium.com/R2D2/"
+            "Referer": CATALOGUE_URL
         }
 
         # 4. query params
@@ -145,17 +395,4 @@ class KinoriumHTTPService:
             "ajax": "list"
         }
 
-        
-        async with self.http_client.get(
-            url, 
-            params=params, 
-            headers=headers, 
-            cookies=cookies
-        ) as response:
-            if response.status == 200:
-                data = await response.json()
-                result = data.get("result", {})
-                if isinstance(result, dict):
-                    return result.get("html", "")
-            logging.warning('The HTML response is empty.')
-            return ""
+        return {"params": params, "headers": headers, "cookies": credential.cookies}
@@ -0,0 +1,323 @@
+from app.core.credentials import credential_pool
+from app.core.tasks import gather_or_cancel
+from app.core.http_client import http_client, THROTTLE_STATUSES, UpstreamBlocked
+from app.core.metrics import FALLBACKS, timed
+from app.core.upstream import upstream_breaker
+from app.core.workers import parse_pool
+from app.services.kinorium_urls import BASE_URL, search_url, absolute_url, cast_url
+from app.services.title_index import title_index, GONE_STATUSES
+from bs4 import BeautifulSoup, NavigableString, Tag
+import logging
+import re
+
+# Markers of captcha / anti-bot interstitials served instead of the real page
+ANTI_BOT_MARKERS = (
+    "captcha",
+    "challenge-platform",
+    "cf-chl",
+    "ddos-guard",
+    "Checking your browser",
+)
+# Every regular kinorium page renders the top menu logo server-side
+PAGE_MARKER = "topMenu__logo"
+
+# -- innerText approximation (see _inner_text) --
+# Elements rendered as blocks by the default stylesheet: they start and end a line
+BLOCK_TAGS = frozenset((
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset", "figcaption", "figure",
+    "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "pre",
+    "section", "table", "tbody", "thead", "tfoot", "tr", "ul",
+))
+# Elements whose text is never rendered
+SKIPPED_TAGS = frozenset(("script", "style", "noscript", "template", "head", "title"))
+# Placeholders of line breaks while whitespace is collapsed
+LINE_BREAK, BLOCK_BREAK, PARAGRAPH_BREAK = "\x00", "\x01", "\x02"
+_COLLAPSIBLE = re.compile(r"[ \t\n\r\f]+")
+
+
+class DetailEngineFallback(Exception):
+    """
+    Raised when a page cannot be read without a browser (JS required or anti-bot wall)
+
+    Attributes:
+        status (int | None): HTTP status of the response, when that was the reason.
+    """
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class KinoriumHTTPDetailService:
+    """
+    Browserless scraper for movie detail and /cast/ pages.
+
+    Produces the same dictionary as KinoriumPlaywrightService from server-rendered HTML:
+        1. Finds a movie by title on the search page.
+        2. Downloads the movie detail page and its /cast/ page concurrently.
+        3. Parses both with BeautifulSoup in the parse worker pool.
+
+    Attributes:
+        http_client: Instance of the HTTPClient
+
+    Raises:
+        DetailEngineFallback: When the response looks like an anti-bot wall or
+            lacks content that is only rendered by JS.
+    """
+    def __init__(self) -> None:
+        self.http_client = http_client
+
+    async def movie_detail_executor(self, movie_title: str) -> dict | None:
+        """
+        Main method to execute the HTTP scraping process for a movie detail page
+
+        The search page is skipped when the title index knows the detail URL; if that
+        URL is gone the entry is dropped and the search runs as usual.
+
+        Args:
+            movie_title (str): The name of the movie to search for.
+
+        Returns:
+            dict: Movie details in the MovieDetail shape.
+            None: If the search returned no movie.
+        """
+        detail_url = title_index.get(movie_title)
+        if detail_url is not None:
+            try:
+                return await self._scrape_detail(detail_url)
+            except DetailEngineFallback as e:
+                if e.status not in GONE_STATUSES:
+                    raise
+                logging.info(f"Indexed URL of {movie_title} is gone, searching again: {e}")
+                title_index.discard(movie_title)
+                FALLBACKS.inc(kind="title_index_stale")
+
+        with timed("http_detail", "search"):
+            search_html = await self._fetch_page(search_url(movie_title))
+            detail_url = await parse_pool.run(parse_search_page, search_html)
+
+        if detail_url is None:
+            logging.info(f"Movie {movie_title} is not found.")
+            return None
+
+        title_index.put(movie_title, detail_url)
+        return await self._scrape_detail(detail_url)
+
+    async def _scrape_detail(self, detail_url: str) -> dict:
+        """Help Method: Loads the detail and /cast/ pages of a movie"""
+
+        # The /cast/ URL is derived from the detail URL, so both pages are fetched side by side
+        details, crew = await gather_or_cancel(
+            self._load_details(detail_url),
+            self._load_crew(cast_url(detail_url)),
+        )
+        details['crew'] = crew
+        return details
+
+    async def _load_details(self, url: str) -> dict:
+        """Help Method: Downloads and parses the movie detail page"""
+        with timed("http_detail", "detail_fetch"):
+            html = await self._fetch_page(url)
+        with timed("http_detail", "detail_parse"):
+            return await parse_pool.run(parse_detail_page, html, url)
+
+    async def _load_crew(self, url: str) -> list[dict]:
+        """Help Method: Downloads and parses the movie /cast/ page"""
+        with timed("http_detail", "cast_fetch"):
+            html = await self._fetch_page(url)
+        with timed("http_detail", "cast_parse"):
+            return await parse_pool.run(parse_cast_page, html)
+
+    async def _fetch_page(self, url: str) -> str:
+        """
+        Downloads a kinorium page with session cookies from the credential pool
+
+        A blocking status or an anti-bot page is reported against the credential set, and
+        counts as an upstream failure for the circuit breaker.
+
+        Raises:
+            DetailEngineFallback: On a blocking status code or an anti-bot page.
+        """
+        credential = credential_pool.acquire()
+        headers = {
+            "User-Agent": credential.user_agent,
+            "Accept": "text/html,application/xhtml+xml",
+            "Referer": f"{BASE_URL}/"
+        }
+
+        try:
+            async with self.http_client.get(
+                url, headers=headers, cookies=credential.cookies, breaker=upstream_breaker
+            ) as response:
+                if response.status != 200:
+                    if response.status not in THROTTLE_STATUSES and response.status != 404:
+                        credential_pool.report_failure(credential, f"{url} returned status {response.status}")
+                    raise DetailEngineFallback(f"{url} returned status {response.status}", status=response.status)
+                html = await response.text()
+
+                if PAGE_MARKER not in html:
+                    lowered = html.lower()
+                    if any(marker.lower() in lowered for marker in ANTI_BOT_MARKERS):
+                        raise UpstreamBlocked(f"{url} returned an anti-bot page")
+                    raise DetailEngineFallback(f"{url} is not a server-rendered kinorium page")
+        except UpstreamBlocked as e:
+            credential_pool.report_failure(credential, str(e))
+            raise DetailEngineFallback(str(e)) from e
+        credential_pool.report_success(credential)
+        return html
+
+
+def parse_search_page(html: str) -> str | None:
+    """
+    Returns the absolute URL of the first search result
+
+    Params:
+        html (str): Search page HTML.
+    Returns:
+        str | None: Detail page URL or None when nothing was found.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    movie = soup.select_one(".movieList .item")
+    if movie is None:
+        return None
+
+    link = movie.select_one(".search-page__title-link")
+    if link is None or not link.get('href'):
+        raise DetailEngineFallback("search result has no detail link")
+    return absolute_url(str(link['href']))
+
+def parse_detail_page(html: str, url: str) -> dict:
+    """
+    Parses the movie detail page
+
+    Params:
+        html (str): Detail page HTML.
+        url (str): URL the page was downloaded from.
+    Returns:
+        dict: Movie details without the 'crew' key.
+    """
+    soup = BeautifulSoup(html, "lxml")
+
+    title = soup.select_one(".film-page__title-text")
+    description = soup.select_one('section[itemprop="description"]')
+    year = soup.select_one('.film-page__date a')
+    rows = soup.select('.infotable tbody tr')
+    duration = rows[2].select_one('td.data') if len(rows) > 2 else None
+    budget = soup.select_one('.box-budget-tooltip')
+    poster = soup.select_one('.movie_gallery_poster')
+    slogan = soup.select('.film-page__slogan span')
+    logline = slogan[1] if len(slogan) > 1 else None
+    age_icon = soup.select_one('.film-page__mkrf-box-icon')
+    age_restriction = " ".join(age_icon.get('class', [])) if age_icon else None
+
+    required = {
+        'title': title, 'description': description, 'year': year, 'duration': duration,
+        'budget': budget, 'poster': poster, 'logline': logline,
+    }
+    missing = [field for field, element in required.items() if element is None]
+    if missing:
+        # the browser path cannot do without these either; maybe they are rendered by JS
+        raise DetailEngineFallback(f"{url} has no server-rendered {missing}")
+
+    # -- Getting ratings of the movie --
+    ratings_list = [] #list of platform ratings
+    for item in soup.select('ul.ratingsBlock li'):
+        link = item.select_one('a')
+        value = item.select_one('a span.value')
+        if link is None or not link.contents or value is None:
+            raise DetailEngineFallback(f"{url} has an incomplete ratings block")
+        first_node = link.contents[0]
+        platform = first_node.get_text() if isinstance(first_node, Tag) else str(first_node)
+        rating = _inner_text(value)
+        ratings_list.append({'platform': platform.strip(), 'rating': rating if rating else None})
+
+    return {
+        'url': url,
+        'title': _inner_text(title),
+        'description': _inner_text(description),
+        'year': _inner_text(year),
+        'country': [_inner_text(el) for el in soup.select('a[itemprop="countryOfOrigin"]')],
+        'duration': _inner_text(duration),
+        'budget': _inner_text(budget),
+        'poster': str(poster.get('src', '')).split('?')[0],
+        'age_restriction': age_restriction.split('-')[-1] if age_restriction else 'N/A',
+        'logline': logline.get_text(),
+        'production_companies': [_inner_text(el) for el in soup.select('.film-page__company a')],
+        'genres': [el.get_text() for el in soup.select('li[itemprop="genre"]')],
+        'ratings': ratings_list,
+    }
+
+def parse_cast_page(html: str) -> list[dict]:
+    """
+    Parses the /cast/ page into role groups
+
+    Params:
+        html (str): /cast/ page HTML.
+    Returns:
+        list[dict]: Crew grouped by role.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    crew = [] #list of role groups
+
+    for role_table in soup.select('.personList > div'):
+        role_title = role_table.select_one('.cast-page__title')
+        if role_title is None:
+            continue
+
+        people_in_this_role = [] #people belonging to role group
+        for person_table in role_table.select('.crew-wrap div.filterData'):
+            name = person_table.select_one('.cast-page__item-name')
+            if name is None:
+                continue
+
+            #Image
+            img_element = person_table.select_one('img.cast-page__item-img_person, img.cast-page__item-img')
+            image = img_element.get('src') if img_element else None
+            if not image:
+                link = person_table.select_one('link[itemprop="image"]')
+                image = link.get('content') if link else None
+
+            people_in_this_role.append({
+                'name': _inner_text(name),
+                'image': str(image).split('?')[0] if image else None
+            })
+
+        crew.append({
+            'role': _inner_text(role_title),
+            'people': people_in_this_role
+        })
+    return crew
+
+
+def _inner_text(element: Tag) -> str:
+    """
+    Approximates the browser's innerText of an element without a stylesheet
+
+    Whitespace inside text collapses to single spaces as with `white-space: normal`, <br> is
+    a line break, block elements are separated by one line break and paragraphs by a blank
+    line, and spaces around line breaks and at both ends are dropped.
+    """
+    parts: list[str] = []
+
+    def walk(node: Tag) -> None:
+        for child in node.children:
+            if isinstance(child, Tag):
+                if child.name in SKIPPED_TAGS:
+                    continue
+                if child.name == "br":
+                    parts.append(LINE_BREAK)
+                    continue
+                boundary = PARAGRAPH_BREAK if child.name == "p" else BLOCK_BREAK if child.name in BLOCK_TAGS else ""
+                parts.append(boundary)
+                walk(child)
+                parts.append(boundary)
+            elif type(child) is NavigableString:  # comments, CDATA and doctypes are subclasses
+                parts.append(_COLLAPSIBLE.sub(" ", child))
+
+    walk(element)
+    text = re.sub(" +", " ", "".join(parts))
+    text = re.sub(f" *([{LINE_BREAK}{BLOCK_BREAK}{PARAGRAPH_BREAK}]) *", r"\1", text)
+    text = text.strip(f" {BLOCK_BREAK}{PARAGRAPH_BREAK}")
+    # a run of block boundaries is as many line breaks as the largest of them asks for
+    text = re.sub(f"[{BLOCK_BREAK}{PARAGRAPH_BREAK}]+", lambda m: "\n\n" if PARAGRAPH_BREAK in m.group() else "\n", text)
+    return text.replace(LINE_BREAK, "\n")
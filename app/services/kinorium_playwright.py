@@ -1,7 +1,103 @@
 import asyncio
 import logging
-from app.core.browser import browser_manager
-from playwright.async_api import Page
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from app.core import config
+from app.core.browser import browser_manager, BrowserPoolBusy, ContextLease
+from app.core.cache import TTLCache
+from app.core.tasks import gather_or_cancel
+from app.core.metrics import FALLBACKS, timed
+from app.core.upstream import upstream_breaker
+from app.core.routing import apply_route_policy, get_route_policy
+from app.core.readiness import ReadinessPolicy, wait_until_ready
+from app.core.profiling import current_profile
+from app.services.kinorium_urls import search_url, absolute_url, cast_url
+from app.services.title_index import title_index, GONE_STATUSES
+from playwright.async_api import Error as PlaywrightError, Page
+
+# Shared cache of detail endpoint results keyed by normalized title. Identical concurrent
+# requests join the scrape in flight; only successful results are kept.
+detail_cache = TTLCache(
+    name="movieDetail",
+    ttl=config.DETAIL_CACHE_TTL,
+    stale_ttl=config.DETAIL_CACHE_STALE_TTL,
+    max_size=config.DETAIL_CACHE_MAX_SIZE,
+    cache_if=lambda result: isinstance(result, dict) and 'data' in result,
+)
+
+# What each stage needs from its page. Navigation waits for DOMContentLoaded only (NAVIGATION_WAIT_UNTIL);
+# a stage is read as soon as its selectors are attached. A search without results never gets
+# an item, so it is not required and costs READY_TIMEOUT_SEARCH; an empty /cast/ page is valid too.
+SEARCH_READY = ReadinessPolicy("search", (".movieList .item",), config.READY_TIMEOUT_SEARCH, required=False)
+DETAIL_READY = ReadinessPolicy("detail", (".film-page__title-text", ".infotable"), config.READY_TIMEOUT_DETAIL)
+CAST_READY = ReadinessPolicy("cast", (".personList > div",), config.READY_TIMEOUT_CAST, required=False)
+
+# Fields the per-locator path cannot do without; a bulk result missing any of them
+# is treated as a failed extraction so the locator fallback keeps the old behaviour.
+REQUIRED_DETAIL_FIELDS = ('title', 'description', 'year', 'duration', 'budget', 'poster', 'logline')
+
+# Collects every detail page field in a single page.evaluate round trip.
+# Mirrors the locator path: innerText where it used inner_text(), textContent where it used text_content().
+DETAIL_EXTRACT_JS = """
+() => {
+    const one = (selector) => document.querySelector(selector);
+    const all = (selector) => Array.from(document.querySelectorAll(selector));
+    const text = (el) => el ? el.innerText : null;
+
+    const durationRow = all('.infotable tbody tr')[2];
+    const slogan = all('.film-page__slogan span')[1];
+    const poster = one('.movie_gallery_poster');
+    const ageIcon = one('.film-page__mkrf-box-icon');
+
+    return {
+        url: location.href,
+        title: text(one('.film-page__title-text')),
+        description: text(one('section[itemprop="description"]')),
+        year: text(one('.film-page__date a')),
+        duration: text(durationRow ? durationRow.querySelector('td.data') : null),
+        budget: text(one('.box-budget-tooltip')),
+        poster: poster ? poster.getAttribute('src') : null,
+        age_restriction: ageIcon ? ageIcon.getAttribute('class') : null,
+        logline: slogan ? slogan.textContent : null,
+        production_companies: all('.film-page__company a').map((el) => el.innerText),
+        genres: all('li[itemprop="genre"]').map((el) => el.textContent),
+        country: all('a[itemprop="countryOfOrigin"]').map((el) => el.innerText),
+        ratings: all('ul.ratingsBlock li').map((li) => {
+            const link = li.querySelector('a');
+            const value = li.querySelector('a span.value');
+            return {
+                platform: link && link.childNodes[0] ? link.childNodes[0].textContent.trim() : null,
+                rating: text(value),
+            };
+        }),
+    };
+}
+"""
+
+# Collects the whole /cast/ page (every role group and person) in a single page.evaluate round trip.
+CAST_EXTRACT_JS = """
+() => {
+    return Array.from(document.querySelectorAll('.personList > div')).map((group) => {
+        const title = group.querySelector('.cast-page__title');
+        const people = Array.from(group.querySelectorAll('.crew-wrap div.filterData')).map((person) => {
+            const name = person.querySelector('.cast-page__item-name');
+            const img = person.querySelector('img.cast-page__item-img_person, img.cast-page__item-img');
+            let image = img ? img.getAttribute('src') : null;
+            if (!image) {
+                const link = person.querySelector('link[itemprop="image"]');
+                image = link ? link.getAttribute('content') : null;
+            }
+            return { name: name ? name.innerText : null, image: image };
+        });
+        return { role: title ? title.innerText : null, people: people };
+    });
+}
+"""
+
+
+class DetailPageGone(Exception):
+    """Raised when a movie detail URL answers 404/410"""
+
 
 class KinoriumPlaywrightService:
     """
@@ -9,19 +105,21 @@ class KinoriumPlaywrightService:
 
     This service handles the complete scraping workflow:
     1. Finds a movie by title.
-    2. Navigates to the movie detail page.
+    2. Opens the movie detail page and its /cast/ page side by side.
     3. Scrapes comprehensive movie details.
 
     Attributes:
         headless (bool): Whether to run the browser in headless mode.
         should_scrape (bool): Whether to scrape details or just return the URL.
-        _manager: Instance of the browser manager for context and page handling.
+        route_policy (RoutePolicy): Which resources are blocked while the pages load.
+        _manager: Instance of the browser manager lending pooled contexts.
 
     """
 
-    def __init__(self, headless: bool = True, should_scrape: bool = True) -> None:
+    def __init__(self, headless: bool = True, should_scrape: bool = True, route_policy: str | None = None) -> None:
         self.headless = headless
         self.should_scrape = should_scrape
+        self.route_policy = get_route_policy(route_policy or config.ROUTE_POLICY)
         self._manager = browser_manager
 
     async def movie_detail_executor(self, movie_title: str) -> dict | str | None:
@@ -35,39 +133,107 @@ class KinoriumPlaywrightService:
             dict: Movie details if should_scrape is True.
             str: URL of the movie detail page if should_scrape is False.
             None: If the movie is not found or an error occurs.
-        """
-
-        browser = await self._manager.get_browser(headless=self.headless)
-        # Set up browser context with Ukrainian locale and Kyiv timezone
-        context = await browser.new_context(
-            locale="uk-UA",
-            timezone_id="Europe/Kyiv",
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={'width': 1920, 'height': 1080}
-            )
-        page = await context.new_page()
-
-        try:
-            #Method to find and navigate to movie detail page
-            page = await self._find_and_navigate(movie_title=movie_title, page=page)
-
-            if not page:
-                return None
-            if not self.should_scrape:
-                return page.url
 
-            #Method to scrape movie details from the detail page
+        Raises:
+            BrowserPoolBusy: If no pooled browser context is available.
+            UpstreamUnavailable: While the upstream circuit breaker is open.
+        """
 
-            return await self._scrape_movie_details(page=page)
+        # Fail fast while kinorium is unavailable instead of opening a context; navigations report their outcome
+        with upstream_breaker.gate():
+            try:
+                # Lease a warm context (uk-UA locale, Kyiv timezone) from the browser pool
+                async with self._open_context() as lease:
+                    page = await self._new_page(lease)
+                    try:
+                        if not self.should_scrape:
+                            #Known URL first, then find and navigate to movie detail page
+                            if await self._open_indexed(movie_title=movie_title, page=page):
+                                return page.url
+                            page = await self._find_and_navigate(movie_title=movie_title, page=page)
+                            return page.url if page else None
+
+                        # The /cast/ page is loaded in a second page of the same context
+                        cast_page = await self._new_page(lease)
+
+                        #Known URL from the title index, skipping the search page
+                        detail_url = title_index.get(movie_title)
+                        if detail_url:
+                            try:
+                                return await self._scrape_movie_details(page=page, cast_page=cast_page, detail_url=detail_url)
+                            except DetailPageGone as e:
+                                logging.info(f"Indexed URL of {movie_title} is gone, searching again: {e}")
+                                title_index.discard(movie_title)
+                                FALLBACKS.inc(kind="title_index_stale")
+
+                        #Method to find the movie detail page URL from the search results
+                        detail_url = await self._find_movie_url(movie_title=movie_title, page=page)
+                        if not detail_url:
+                            return None
+                        title_index.put(movie_title, detail_url)
+
+                        #Method to scrape movie details from the detail and /cast/ pages
+                        return await self._scrape_movie_details(page=page, cast_page=cast_page, detail_url=detail_url)
+
+                    finally:
+                        if not self.headless and config.DEBUG_HOLD_SECONDS > 0:
+                            await asyncio.sleep(config.DEBUG_HOLD_SECONDS)  # Pause to observe the browser in non-headless mode
+
+            except BrowserPoolBusy:
+                raise
+
+            except Exception as e:
+                logging.error(f"Error during Playwright scraping: {e}")
+
+    @asynccontextmanager
+    async def _open_context(self) -> AsyncIterator[ContextLease]:
+        """
+        Help Method: Leases a pooled context, or opens a dedicated one when a profiled scrape records a trace
 
+        The dedicated context records a HAR and a Playwright trace into the profile directory.
+        """
+        profile = current_profile()
+        if profile is None or not profile.capture_trace:
+            async with self._manager.lease(headless=self.headless) as lease:
+                yield lease
+            return
+
+        har_path = profile.artifact_path("network.har")
+        async with self._manager.dedicated(headless=self.headless, record_har_path=har_path) as lease:
+            await lease.context.tracing.start(screenshots=True, snapshots=True, sources=False)
+            try:
+                yield lease
+            finally:
+                await lease.context.tracing.stop(path=profile.artifact_path("trace.zip"))
+
+    async def _new_page(self, lease: ContextLease) -> Page:
+        """Help Method: Opens a page with the route policy applied; its browser calls are counted when profiled"""
+        page = await lease.new_page()
+        profile = current_profile()
+        if profile is not None:
+            page = profile.wrap_page(page)
+        await apply_route_policy(page, self.route_policy)
+        return page
 
-        except Exception as e:
-            logging.error(f"Error during Playwright scraping: {e}")
+    async def _open_indexed(self, movie_title: str, page) -> bool:
+        """
+        Help Method: Opens the detail page known from the title index
 
-        finally:
-            if not self.headless:
-                await asyncio.sleep(5)  # Pause to observe the browser in non-headless mode
-            await context.close()
+        Returns:
+            bool: False when the title is not indexed or its URL is gone (the entry is then dropped).
+        """
+        detail_url = title_index.get(movie_title)
+        if not detail_url:
+            return False
+
+        with timed("playwright", "navigate"):
+            response = await self._goto(page, detail_url)
+            if response is not None and response.status in GONE_STATUSES:
+                title_index.discard(movie_title)
+                FALLBACKS.inc(kind="title_index_stale")
+                return False
+            await wait_until_ready(page, DETAIL_READY)
+        return True
 
     async def _find_and_navigate(self, movie_title: str, page) -> Page | None:
         """
@@ -82,26 +248,61 @@ class KinoriumPlaywrightService:
             None: If the movie is not found.
         """
 
-        await page.goto(f"https://ua.kinorium.com/search/?q={movie_title}", wait_until="load")
-        movie_locator = page.locator(".movieList .item").first
-        
-        if await movie_locator.count() == 0:
-            logging.info(f"Movie {movie_title} is not found.")
-            return None
-        
-        await movie_locator.locator(".search-page__title-link").click()
-        await page.wait_for_load_state("load", timeout=1000)
+        with timed("playwright", "search"):
+            await self._goto(page, search_url(movie_title))
+            if not await wait_until_ready(page, SEARCH_READY):
+                logging.info(f"Movie {movie_title} is not found.")
+                return None
+            movie_locator = page.locator(".movieList .item").first
+
+        link = movie_locator.locator(".search-page__title-link")
+        href = await link.get_attribute('href')
+        if href:
+            title_index.put(movie_title, absolute_url(href))
+
+        with timed("playwright", "navigate"):
+            async with page.expect_navigation(wait_until=config.NAVIGATION_WAIT_UNTIL,
+                                              timeout=config.NAVIGATION_TIMEOUT * 1000):
+                await link.click()
+            await wait_until_ready(page, DETAIL_READY)
         return page
+
+    async def _find_movie_url(self, movie_title: str, page) -> str | None:
+        """
+        Help Method: Finds the movie by title and returns its detail page URL without opening it
+
+        Args:
+            movie_title (str): The name of the movie to search for.
+            page: Playwright page object.
+
+        Returns:
+            str: Absolute URL of the movie detail page.
+            None: If the movie is not found.
+        """
+
+        with timed("playwright", "search"):
+            await self._goto(page, search_url(movie_title))
+            if not await wait_until_ready(page, SEARCH_READY):
+                logging.info(f"Movie {movie_title} is not found.")
+                return None
+            movie_locator = page.locator(".movieList .item").first
+            href = await movie_locator.locator(".search-page__title-link").get_attribute('href')
+        return absolute_url(href) if href else None
     
-    async def _scrape_movie_details(self, page) -> dict:
+    async def _scrape_movie_details(self, page, cast_page, detail_url: str) -> dict:
         """
         Scrapes comprehensive movie details.
 
         Extracts basic info (title, year, etc.), production details, 
         ratings from multiple platforms, and the full production crew list from /cast/.
+        The detail and /cast/ pages are loaded and extracted concurrently. Each page is
+        read with a single bulk script; the per-locator path is used as a fallback
+        when the bulk script fails.
 
         Args:
-            page: Playwright page object of the movie detail page.
+            page: Playwright page object used for the movie detail page.
+            cast_page: Playwright page object used for the movie /cast/ page.
+            detail_url (str): URL of the movie detail page.
 
         Returns:
                 dict: A structured dictionary containing:
@@ -120,6 +321,164 @@ class KinoriumPlaywrightService:
                         - ratings (list[dict]): Platform ratings (platform name and value).
                         - crew (list[dict]): All production crew grouped by role.
         """
+        details, crew = await gather_or_cancel(
+            self._load_details(page, detail_url),
+            self._load_crew(cast_page, cast_url(detail_url)),
+        )
+        details['crew'] = crew
+
+        return details
+
+    async def _load_details(self, page, detail_url: str) -> dict:
+        """
+        Help Method: Opens the movie detail page and extracts it
+
+        Raises:
+            DetailPageGone: If the page answers 404/410 (e.g. a stale title index entry).
+        """
+        with timed("playwright", "detail_load"):
+            response = await self._goto(page, detail_url)
+            if response is not None and response.status in GONE_STATUSES:
+                raise DetailPageGone(f"{detail_url} returned status {response.status}")
+            await wait_until_ready(page, DETAIL_READY)
+        with timed("playwright", "detail_extract"):
+            return await self._extract_details(page)
+
+    async def _load_crew(self, page, url: str) -> list[dict]:
+        """Help Method: Opens the movie /cast/ page and extracts the crew"""
+        with timed("playwright", "cast_load"):
+            await self._goto(page, url)
+            await wait_until_ready(page, CAST_READY)
+        with timed("playwright", "cast_extract"):
+            return await self._extract_crew(page)
+
+    async def _goto(self, page, url: str):
+        """
+        Help Method: Navigates without waiting for images, fonts and late scripts (see the *_READY policies)
+
+        The response status, or the navigation error, is fed to the upstream circuit breaker.
+        """
+        try:
+            response = await page.goto(url, wait_until=config.NAVIGATION_WAIT_UNTIL,
+                                       timeout=config.NAVIGATION_TIMEOUT * 1000)
+        except PlaywrightError as e:
+            upstream_breaker.record_failure(f"{url}: {e.__class__.__name__}")
+            raise
+        if response is not None:
+            upstream_breaker.record_status(response.status)
+        return response
+
+    async def _extract_details(self, page) -> dict:
+        """
+        Help Method: Extracts detail page fields, bulk script first, locators as fallback
+
+        Args:
+            page: Playwright page object of the movie detail page.
+
+        Returns:
+            dict: Movie details without the 'crew' key.
+        """
+        try:
+            return await self._extract_details_bulk(page)
+        except Exception as e:
+            logging.warning(f"Bulk detail extraction failed, falling back to locators: {e}")
+            FALLBACKS.inc(kind="detail_locators")
+            return await self._extract_details_locators(page)
+
+    async def _extract_crew(self, page) -> list[dict]:
+        """
+        Help Method: Extracts the /cast/ page crew, bulk script first, locators as fallback
+
+        Args:
+            page: Playwright page object of the movie /cast/ page.
+
+        Returns:
+            list[dict]: Crew grouped by role.
+        """
+        try:
+            return await self._extract_crew_bulk(page)
+        except Exception as e:
+            logging.warning(f"Bulk crew extraction failed, falling back to locators: {e}")
+            FALLBACKS.inc(kind="cast_locators")
+            return await self._extract_crew_locators(page)
+
+    async def _extract_details_bulk(self, page) -> dict:
+        """
+        Help Method: Reads the whole detail page in one page.evaluate round trip
+
+        Raises:
+            ValueError: If a field the per-locator path requires is missing.
+        """
+        raw = await page.evaluate(DETAIL_EXTRACT_JS)
+
+        missing = [field for field in REQUIRED_DETAIL_FIELDS if raw.get(field) is None]
+        if missing:
+            raise ValueError(f"missing fields {missing}")
+
+        ratings_list = []
+        for rating in raw['ratings']:
+            if rating['platform'] is None or rating['rating'] is None:
+                raise ValueError("incomplete rating entry")
+            ratings_list.append({'platform': rating['platform'], 'rating': rating['rating'] if rating['rating'] else None})
+
+        age_restriction = raw['age_restriction']
+
+        return {
+            'url': raw['url'],
+            'title': raw['title'],
+            'description': raw['description'],
+            'year': raw['year'],
+            'country': raw['country'],
+            'duration': raw['duration'],
+            'budget': raw['budget'],
+            'poster': raw['poster'].split('?')[0],
+            'age_restriction': age_restriction.split('-')[-1] if age_restriction else 'N/A',
+            'logline': raw['logline'],
+            'production_companies': raw['production_companies'],
+            'genres': raw['genres'],
+            'ratings': ratings_list,
+        }
+
+    async def _extract_crew_bulk(self, page) -> list[dict]:
+        """
+        Help Method: Reads the whole /cast/ page in one page.evaluate round trip
+
+        Raises:
+            ValueError: If a role title or a person name is missing.
+        """
+        raw = await page.evaluate(CAST_EXTRACT_JS)
+
+        crew = [] #list of role groups
+        for group in raw:
+            if group['role'] is None:
+                raise ValueError("missing role title")
+
+            people_in_this_role = [] #people belonging to role group
+            for person in group['people']:
+                if person['name'] is None:
+                    raise ValueError("missing person name")
+                image = person['image']
+                people_in_this_role.append({
+                    'name': person['name'],
+                    'image': image.split('?')[0] if image else None
+                })
+
+            crew.append({
+                'role': group['role'],
+                'people': people_in_this_role
+            })
+        return crew
+
+    async def _extract_details_locators(self, page) -> dict:
+        """
+        Help Method: Reads the detail page field by field with Playwright locators
+
+        Args:
+            page: Playwright page object of the movie detail page.
+
+        Returns:
+            dict: Movie details without the 'crew' key.
+        """
 
         # -- Helper locators and counts --
         age_restriction = await page.locator('.film-page__mkrf-box-icon').get_attribute('class')
@@ -160,11 +519,32 @@ class KinoriumPlaywrightService:
             rating = await ratings_elements.nth(i).locator('a span.value').inner_text()
             ratings_list.append({'platform': platform, 'rating': rating if rating else None})
 
+        return {
+        'url': page_detail_url,
+        'title': title,
+        'description': description,
+        'year': year,
+        'country': country,
+        'duration': duration,
+        'budget': budget,
+        'poster': poster,
+        'age_restriction': age_restriction,
+        'logline': logline,
+        'production_companies': production_companies,
+        'genres': genres,
+        'ratings': ratings_list,
+    }
 
-        # -- Getting crew information --
-        await page.locator('h2.headlines-slide_crew a[href*="/cast/"]').first.click() #goes to /cast/ page of movie
-        await page.wait_for_load_state("load", timeout=10000)
-        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+    async def _extract_crew_locators(self, page) -> list[dict]:
+        """
+        Help Method: Reads the /cast/ page person by person with Playwright locators
+
+        Args:
+            page: Playwright page object of the movie /cast/ page.
+
+        Returns:
+            list[dict]: Crew grouped by role.
+        """
         crew_table = page.locator('.personList > div')
         count_crew_table = await crew_table.count()
 
@@ -198,22 +578,4 @@ class KinoriumPlaywrightService:
                 'people': people_in_this_role
             })
 
-        return {
-        'url': page_detail_url,
-        'title': title,
-        'description': description,
-        'year': year,
-        'country': country,
-        'duration': duration,
-        'budget': budget,
-        'poster': poster,
-        'age_restriction': age_restriction,
-        'logline': logline,
-        'production_companies': production_companies,
-        'genres': genres,
-        'ratings': ratings_list,
-        'crew': crew
-    }    
-
-
-   
\ No newline at end of file
+        return crew
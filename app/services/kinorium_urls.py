@@ -0,0 +1,25 @@
+from urllib.parse import quote, urljoin
+from app.core import config
+
+BASE_URL = config.KINORIUM_BASE_URL
+# AJAX handler behind the /R2D2/ catalogue page
+FILM_LIST_URL = f"{BASE_URL}/handlers/filmList/"
+CATALOGUE_URL = f"{BASE_URL}/R2D2/"
+
+
+def search_url(movie_title: str) -> str:
+    """Returns the kinorium search page URL for a movie title"""
+    return f"{BASE_URL}/search/?q={quote(movie_title)}"
+
+
+def absolute_url(href: str) -> str:
+    """Resolves a site-relative link against the kinorium base URL"""
+    return urljoin(f"{BASE_URL}/", href)
+
+
+def cast_url(detail_url: str) -> str:
+    """Derives the /cast/ page URL from a movie detail page URL"""
+    path = detail_url.split('?')[0].split('#')[0]
+    if not path.endswith('/'):
+        path += '/'
+    return urljoin(path, "cast/")
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from app.core import config
+from app.services.catalogue_store import normalize_title
+
+# Statuses meaning an indexed detail URL no longer resolves (the entry is dropped)
+GONE_STATUSES = (404, 410)
+
+
+class TitleIndex:
+    """
+    Persistent map of normalized movie titles to detail page URLs.
+
+    Lets detail scrapes skip the search page. Entries come from searches (which win)
+    and from filmList crawls (which only fill gaps, since a title can match several
+    movies and the search ranking decides which one a scrape returns).
+
+    The map lives in memory, is loaded from TITLE_INDEX_PATH at startup and written back
+    atomically in the background at most every TITLE_INDEX_FLUSH_INTERVAL seconds.
+
+    Attributes:
+        enabled (bool): When False every lookup misses and nothing is recorded.
+        path (str): JSON file the index is persisted to.
+        max_size (int): Entries kept; the least recently written are dropped first.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = config.TITLE_INDEX_ENABLED
+        self.path = config.TITLE_INDEX_PATH
+        self.max_size = config.TITLE_INDEX_MAX_SIZE
+        self.flush_interval = config.TITLE_INDEX_FLUSH_INTERVAL
+
+        self._urls: OrderedDict[str, str] = OrderedDict()
+        self._dirty = False
+        self._flush_task: asyncio.Task | None = None
+
+        # -- counters --
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+
+    async def load(self) -> None:
+        """Reads the index file, if there is one"""
+        if not self.enabled or not os.path.exists(self.path):
+            return
+        try:
+            entries = await asyncio.to_thread(self._read)
+        except (OSError, ValueError) as e:
+            logging.error(f"Could not load the title index from {self.path}: {e}")
+            return
+        self._urls = OrderedDict(entries)
+        logging.info(f"Loaded {len(self._urls)} titles from {self.path}.")
+
+    async def stop(self) -> None:
+        """Cancels the pending background write and flushes the index"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+
+    def get(self, title: str) -> str | None:
+        """Returns the detail URL known for the title"""
+        if not self.enabled:
+            return None
+        url = self._urls.get(normalize_title(title))
+        if url is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return url
+
+    def put(self, title: str, url: str) -> None:
+        """Records the detail URL a search for `title` resolved to"""
+        self._set(normalize_title(title), url, overwrite=True)
+
+    def add_list_items(self, links: list[dict]) -> None:
+        """
+        Records the links of crawled filmList items without overriding search results
+
+        Args:
+            links (list[dict]): {'title', 'title_eng', 'url'} per item, see extract_title_links.
+        """
+        for link in links:
+            for title in (link['title'], link['title_eng']):
+                if title:
+                    self._set(normalize_title(title), link['url'], overwrite=False)
+
+    def discard(self, title: str) -> None:
+        """Drops an entry whose URL no longer resolves"""
+        if self._urls.pop(normalize_title(title), None) is not None:
+            self._stale += 1
+            self._schedule_flush()
+
+    def stats(self) -> dict:
+        """Returns size and lookup counters"""
+        return {
+            'enabled': self.enabled,
+            'size': len(self._urls),
+            'max_size': self.max_size,
+            'hits': self._hits,
+            'misses': self._misses,
+            'stale': self._stale,
+        }
+
+    async def flush(self) -> None:
+        """Writes the index to disk if it changed"""
+        if not self.enabled or not self._dirty:
+            return
+        self._dirty = False
+        try:
+            await asyncio.to_thread(self._write, dict(self._urls))
+        except OSError as e:
+            self._dirty = True
+            logging.error(f"Could not save the title index to {self.path}: {e}")
+
+    # -- internals --
+
+    def _set(self, key: str, url: str, overwrite: bool) -> None:
+        if not self.enabled or not key:
+            return
+        if key in self._urls:
+            if not overwrite or self._urls[key] == url:
+                return
+            del self._urls[key]
+        self._urls[key] = url
+        while len(self._urls) > self.max_size:
+            self._urls.popitem(last=False)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    def _read(self) -> dict[str, str]:
+        with open(self.path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def _write(self, entries: dict[str, str]) -> None:
+        # write to a temporary file and rename, so a crash never leaves a truncated index
+        directory = os.path.dirname(os.path.abspath(self.path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".title_index.", suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                json.dump(entries, file, ensure_ascii=False)
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+title_index = TitleIndex()
@@ -0,0 +1,75 @@
+"""
+Before/after timing of detail and /cast/ extraction on saved fixture pages.
+
+Compares the per-locator path with the single page.evaluate bulk path of
+KinoriumPlaywrightService. Fixtures are served through Playwright routing, so no
+network access is needed.
+
+Usage:
+    python -m benchmarks.bench_extraction --crew 20 100 300 --repeat 5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.core.browser import browser_manager, CONTEXT_OPTIONS
+from app.services.kinorium_playwright import KinoriumPlaywrightService
+from benchmarks.fixtures import FILM_ID, detail_page_html, cast_page_html
+
+DETAIL_URL = f"https://ua.kinorium.com/{FILM_ID}/"
+CAST_URL = f"https://ua.kinorium.com/{FILM_ID}/cast/"
+
+
+async def _time(coro_factory, repeat: int) -> tuple[float, object]:
+    """Runs the coroutine `repeat` times, returns the median duration in ms and the last result"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await coro_factory()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+async def main(crew_sizes: list[int], repeat: int) -> None:
+    service = KinoriumPlaywrightService()
+    browser = await browser_manager.get_browser(headless=True)
+    context = await browser.new_context(**CONTEXT_OPTIONS)
+    page = await context.new_page()
+
+    print(f"{'crew':>6} | {'stage':<7} | {'locators ms':>12} | {'bulk ms':>9} | {'speedup':>7}")
+    print("-" * 55)
+    try:
+        for crew_size in crew_sizes:
+            pages = {DETAIL_URL: detail_page_html(), CAST_URL: cast_page_html(crew_size)}
+
+            async def fulfill(route):
+                await route.fulfill(body=pages.get(route.request.url, ""), content_type="text/html; charset=utf-8")
+
+            await page.route("https://ua.kinorium.com/**", fulfill)
+
+            await page.goto(DETAIL_URL)
+            before, legacy_details = await _time(lambda: service._extract_details_locators(page), repeat)
+            after, bulk_details = await _time(lambda: service._extract_details_bulk(page), repeat)
+            assert legacy_details == bulk_details, "bulk detail extraction differs from locator extraction"
+            print(f"{crew_size:>6} | {'detail':<7} | {before:>12.1f} | {after:>9.1f} | {before / after:>6.1f}x")
+
+            await page.goto(CAST_URL)
+            before, legacy_crew = await _time(lambda: service._extract_crew_locators(page), repeat)
+            after, bulk_crew = await _time(lambda: service._extract_crew_bulk(page), repeat)
+            assert legacy_crew == bulk_crew, "bulk crew extraction differs from locator extraction"
+            print(f"{crew_size:>6} | {'cast':<7} | {before:>12.1f} | {after:>9.1f} | {before / after:>6.1f}x")
+
+            await page.unroute("https://ua.kinorium.com/**")
+    finally:
+        await context.close()
+        await browser_manager.stop_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--crew", type=int, nargs="+", default=[20, 100, 300], help="crew sizes of the /cast/ fixture")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (median is reported)")
+    args = parser.parse_args()
+    asyncio.run(main(args.crew, args.repeat))
@@ -0,0 +1,109 @@
+"""
+filmList parser benchmark: bs4 (BeautifulSoup) vs lxml (precompiled XPath).
+
+First checks that both backends produce byte-identical JSON on every fixture
+page, then reports items/second, Python heap peak (tracemalloc) and peak RSS
+growth per backend. Each backend is measured in its own subprocess so RSS
+figures do not leak between them.
+
+Usage:
+    python -m benchmarks.bench_parsers --items 200 --repeat 20
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from app.services.film_list_parsers import FILM_LIST_PARSERS
+from benchmarks.fixtures import film_list_corpus, film_list_html
+
+
+def _max_rss_kb() -> int:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss  # bytes on macOS, KiB elsewhere
+
+
+def check_identical() -> bool:
+    """Compares the JSON output of every backend on the fixture corpus"""
+    identical = True
+    for name, html in film_list_corpus().items():
+        outputs = {
+            backend: json.dumps(parser(html), ensure_ascii=False).encode("utf-8")
+            for backend, parser in FILM_LIST_PARSERS.items()
+        }
+        same = len(set(outputs.values())) == 1
+        identical &= same
+        print(f"  {name:<9} {'identical' if same else 'DIFFERENT'} ({len(outputs['bs4'])} bytes)")
+    return identical
+
+
+def measure(backend: str, items: int, repeat: int) -> dict:
+    """Parses the same page `repeat` times with one backend"""
+    parser = FILM_LIST_PARSERS[backend]
+    html = film_list_html(count=items)
+    parser(html)  # warm-up: imports, XPath compilation
+    rss_before = _max_rss_kb()
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parsed = parser(html)
+    elapsed = time.perf_counter() - started
+    rss_after = _max_rss_kb()
+
+    tracemalloc.start()
+    parser(html)
+    _, heap_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'backend': backend,
+        'items': len(parsed),
+        'repeat': repeat,
+        'items_per_second': round(len(parsed) * repeat / elapsed, 1),
+        'ms_per_page': round(elapsed / repeat * 1000, 3),
+        'heap_peak_kb': round(heap_peak / 1024, 1),
+        'rss_growth_kb': rss_after - rss_before,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200, help="div.item entries per page")
+    parser.add_argument("--repeat", type=int, default=20, help="pages parsed per backend")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure(args.worker, args.items, args.repeat)))
+        return
+
+    print("Output check:")
+    if not check_identical():
+        sys.exit("Parser backends disagree, benchmark aborted.")
+
+    results = []
+    for backend in FILM_LIST_PARSERS:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_parsers", "--worker", backend,
+             "--items", str(args.items), "--repeat", str(args.repeat)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results.append(json.loads(output))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"\n{'backend':<8} | {'items/s':>10} | {'ms/page':>8} | {'heap peak KiB':>13} | {'RSS growth KiB':>14}")
+    print("-" * 66)
+    for row in results:
+        print(f"{row['backend']:<8} | {row['items_per_second']:>10} | {row['ms_per_page']:>8} | "
+              f"{row['heap_peak_kb']:>13} | {row['rss_growth_kb']:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Response validation + serialization benchmark: FastAPI default path vs cached TypeAdapter + FastJSONResponse.
+
+Payloads are built by running the HTTP engine's parsers over the fixture pages:
+movie details with a growing /cast/ page and filmList pages with a growing item count.
+
+    before  MovieDetail(**data) (detail) / untyped dicts (list), then jsonable_encoder + json.dumps
+            as FastAPI does for a plain dict returned from an endpoint
+    after   MOVIE_DETAIL_ADAPTER / MOVIE_LIST_ADAPTER validation, then FastJSONResponse (pydantic-core)
+
+Both paths must produce the same JSON document; the benchmark aborts otherwise.
+
+Usage:
+    python -m benchmarks.bench_serialization --crew 20 100 300 1000 --items 50 100 200 --repeat 200
+"""
+import argparse
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.responses import FastJSONResponse
+from app.schemas.movies import MOVIE_DETAIL_ADAPTER, MOVIE_LIST_ADAPTER, MovieDetail
+from app.services.film_list_parsers import parse_film_list_lxml
+from app.services.kinorium_http_detail import parse_cast_page, parse_detail_page
+from benchmarks.fixtures import FILM_ID, cast_page_html, detail_page_html, film_list_html
+
+DETAIL_URL = f"https://ua.kinorium.com/{FILM_ID}/"
+
+
+def detail_payload(crew_size: int) -> dict:
+    """A scraped movie detail dict with `crew_size` people"""
+    details = parse_detail_page(detail_page_html(), DETAIL_URL)
+    details['crew'] = parse_cast_page(cast_page_html(crew_size))
+    return details
+
+
+# -- the two response paths --
+
+def detail_before(data: dict) -> bytes:
+    content = {'status': 'OK', 'data': MovieDetail(**data), 'engine': 'http'}
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def detail_after(data: dict) -> bytes:
+    content = {'status': 'OK', 'data': MOVIE_DETAIL_ADAPTER.validate_python(data), 'engine': 'http'}
+    return FastJSONResponse(content).body
+
+
+def list_before(items: list[dict]) -> bytes:
+    return JSONResponse(jsonable_encoder({'status': 'OK', 'data': items})).body
+
+
+def list_after(items: list[dict]) -> bytes:
+    return FastJSONResponse({'status': 'OK', 'data': MOVIE_LIST_ADAPTER.validate_python(items)}).body
+
+
+def _ms_per_call(func, payload, repeat: int) -> float:
+    func(payload)  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(payload)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def measure(kind: str, size: int, payload, before, after, repeat: int) -> dict:
+    """Times both paths on one payload after checking they agree"""
+    before_body, after_body = before(payload), after(payload)
+    if json.loads(before_body) != json.loads(after_body):
+        raise SystemExit(f"{kind} {size}: the two paths produce different JSON, benchmark aborted.")
+
+    before_ms = _ms_per_call(before, payload, repeat)
+    after_ms = _ms_per_call(after, payload, repeat)
+    return {
+        'payload': kind,
+        'size': size,
+        'bytes': len(after_body),
+        'before_ms': round(before_ms, 4),
+        'after_ms': round(after_ms, 4),
+        'speedup': round(before_ms / after_ms, 2) if after_ms else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--crew", type=int, nargs="+", default=[20, 100, 300, 1000], help="people per detail payload")
+    parser.add_argument("--items", type=int, nargs="+", default=[50, 100, 200], help="movies per list payload")
+    parser.add_argument("--repeat", type=int, default=200, help="calls timed per path and payload")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    results = []
+    for crew_size in args.crew:
+        results.append(measure("detail", crew_size, detail_payload(crew_size), detail_before, detail_after, args.repeat))
+    for items in args.items:
+        payload = parse_film_list_lxml(film_list_html(count=items))
+        results.append(measure("list", items, payload, list_before, list_after, args.repeat))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'payload':<7} | {'size':>5} | {'KiB':>7} | {'before ms':>9} | {'after ms':>9} | {'speedup':>7}")
+    print("-" * 61)
+    for row in results:
+        print(f"{row['payload']:<7} | {row['size']:>5} | {row['bytes'] / 1024:>7.1f} | {row['before_ms']:>9} | "
+              f"{row['after_ms']:>9} | {row['speedup']:>6}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Saved kinorium page fixtures for offline benchmarks.
+
+Pages are rebuilt deterministically from templates that reproduce the markup
+the scrapers select on, so crew and list sizes can be scaled without
+hitting ua.kinorium.com.
+"""
+
+FILM_ID = 123456
+
+ROLES = ("Режисер", "Сценарист", "Продюсер", "Оператор", "Композитор", "Художник", "Монтаж", "Актори")
+
+
+def detail_page_html(film_id: int = FILM_ID, ratings: int = 4) -> str:
+    """Returns a movie detail page with the same selectors as ua.kinorium.com/<id>/"""
+    ratings_html = "".join(
+        f'<li><a href="#rating-{i}">Platform {i} <span class="value">{7 + i / 10:.1f}</span></a></li>'
+        for i in range(ratings)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="uk"><head><meta charset="utf-8"><title>Фільм {film_id}</title></head>
+<body>
+<div class="topMenu__logo"></div>
+<div class="film-page">
+  <h1 class="film-page__title"><span class="film-page__title-text">Інтерстеллар</span></h1>
+  <div class="film-page__date"><a href="/R2D2/?years=2014">2014</a></div>
+  <i class="film-page__mkrf-box-icon film-page__mkrf-box-icon-16"></i>
+  <img class="movie_gallery_poster" src="https://images.kinorium.com/movie/poster/{film_id}/w300.jpg?1700000000">
+  <div class="film-page__slogan"><span>Слоган</span><span>«Людство народилося на Землі. Йому не судилося тут померти»</span></div>
+  <table class="infotable"><tbody>
+    <tr><td class="title">Країна</td><td class="data">
+      <a itemprop="countryOfOrigin" href="/R2D2/?countries=1">США</a>,
+      <a itemprop="countryOfOrigin" href="/R2D2/?countries=2">Велика Британія</a>
+    </td></tr>
+    <tr><td class="title">Жанр</td><td class="data"><ul>
+      <li itemprop="genre">фантастика</li><li itemprop="genre">драма</li><li itemprop="genre">пригоди</li>
+    </ul></td></tr>
+    <tr><td class="title">Тривалість</td><td class="data">2 год. 49 хв.</td></tr>
+    <tr><td class="title">Бюджет</td><td class="data"><span class="box-budget-tooltip">$165 000 000</span></td></tr>
+  </tbody></table>
+  <div class="film-page__company"><a href="/company/1/">Paramount Pictures</a></div>
+  <div class="film-page__company"><a href="/company/2/">Warner Bros.</a></div>
+  <div class="film-page__company"><a href="/company/3/">Legendary Pictures</a></div>
+  <section itemprop="description">Коли посуха призводить людство до продовольчої кризи, група дослідників вирушає крізь червоточину.</section>
+  <ul class="ratingsBlock">{ratings_html}</ul>
+  <h2 class="headlines-slide_crew"><a href="/{film_id}/cast/">Актори та знімальна група</a></h2>
+</div>
+</body></html>"""
+
+
+def cast_page_html(crew_size: int = 300) -> str:
+    """Returns a /cast/ page with `crew_size` people spread across the role groups"""
+    groups = {role: [] for role in ROLES}
+    for i in range(crew_size):
+        role = ROLES[i % len(ROLES)]
+        if i % 5 == 0:
+            # some people have no <img src>, only the itemprop link
+            image = f'<img class="cast-page__item-img"><link itemprop="image" content="https://images.kinorium.com/persona/{i}.jpg?2">'
+        else:
+            image = f'<img class="cast-page__item-img_person" src="https://images.kinorium.com/persona/{i}.jpg?1">'
+        groups[role].append(
+            f'<div class="filterData">{image}<a class="cast-page__item-name" href="/name/{i}/"> Person {i} </a></div>'
+        )
+
+    body = "".join(
+        f'<div><h3 class="cast-page__title">{role}</h3><div class="crew-wrap">{"".join(people)}</div></div>'
+        for role, people in groups.items() if people
+    )
+    return f"""<!DOCTYPE html>
+<html lang="uk"><head><meta charset="utf-8"><title>Актори та знімальна група</title></head>
+<body><div class="topMenu__logo"></div><div class="personList">{body}</div></body></html>"""
+
+
+def search_page_html(film_id: int = FILM_ID, results: int = 5) -> str:
+    """Returns a /search/?q= page whose first result links to the detail fixture"""
+    items = "".join(
+        f'<div class="item"><a class="search-page__title-link" href="/{film_id + i}/">Інтерстеллар {i}</a></div>'
+        for i in range(results)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="uk"><head><meta charset="utf-8"><title>Пошук</title></head>
+<body><div class="topMenu__logo"></div><div class="movieList">{items}</div></body></html>"""
+
+
+def film_list_item_html(i: int) -> str:
+    """Returns one filmList `div.item`; every few items drop or vary a field to cover edge cases"""
+    variant = i % 7
+    poster = f'<img class="movie-list-poster" src="https://images.kinorium.com/movie/300/{i}.jpg?{i}">'
+    small_text = f'<span class="filmList__small-text">Movie {i} &amp; Co., {1950 + i % 70}&nbsp;(16+)</span>'
+    extra_info = f'<div class="filmList__extra-info">драма, комедія, {1 + i % 3} год. {i % 60} хв. <span class="rating">7.{i % 10}</span></div>'
+
+    if variant == 1:
+        poster = ""
+    elif variant == 2:
+        small_text = f'<span class="filmList__small-text"><b>Only title {i}</b></span>'
+    elif variant == 3:
+        extra_info = '<div class="filmList__extra-info"><!-- genres -->\n   фантастика,\n   1 год.  30 хв.</div>'
+    elif variant == 4:
+        extra_info = '<div class="filmList__extra-info"><span>аніме</span>, 24 хв.</div>'
+    elif variant == 5:
+        small_text = ""
+        poster = '<img class="movie-list-poster lazy">'
+    elif variant == 6:
+        extra_info = ""
+
+    return (
+        f'<div class="item filmList__item" data-id="{1000 + i}">'
+        f'<div class="filmList__item-wrap-poster"><a href="/{1000 + i}/">{poster}</a></div>'
+        f'<div class="filmList__item-wrap-info">'
+        f'<a class="filmList__item-title-link" href="/{1000 + i}/">'
+        f'<i class="movie-title__text"><span> Фільм <em>№{i}</em> </span></i></a>'
+        f'{small_text}{extra_info}'
+        f'</div></div>\n'
+    )
+
+
+def film_list_html(count: int = 200, offset: int = 0) -> str:
+    """Returns the `result.html` payload of handlers/filmList/ with `count` items"""
+    items = "".join(film_list_item_html(offset + i) for i in range(count))
+    return f'<div class="filmList">{items}</div>'
+
+
+def film_list_corpus() -> dict[str, str]:
+    """Named filmList payloads used to compare parser backends"""
+    return {
+        "empty": "",
+        "no-items": '<div class="filmList"><p>Нічого не знайдено</p></div>',
+        "small": film_list_html(count=50),
+        "medium": film_list_html(count=100, offset=50),
+        "large": film_list_html(count=200, offset=150),
+    }
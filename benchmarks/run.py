@@ -0,0 +1,315 @@
+"""
+End-to-end scraper benchmark against the local stand-in server.
+
+Starts benchmarks/standin_server.py in a subprocess, points the app at it through
+KINORIUM_BASE_URL and drives the scrapers at each concurrency level:
+
+    http_list    KinoriumHTTPService filmList fetch + parse (cache bypassed)
+    http_detail  KinoriumHTTPDetailService search + detail + /cast/
+    playwright   KinoriumPlaywrightService search + detail + /cast/ (needs `playwright install chromium`)
+
+Reports requests/second, p50/p95/p99 latency and peak RSS of this process and its
+children (the browser included) per scenario and level. The JSON output carries the
+git revision, so runs of two commits can be compared:
+
+Usage:
+    python -m benchmarks.run --concurrency 1 4 16 --requests 200 --latency 50 --output before.json
+    python -m benchmarks.run --concurrency 1 4 16 --requests 200 --latency 50 --output after.json
+    python -m benchmarks.run --compare before.json after.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import socket
+import subprocess
+import sys
+import time
+
+SCENARIOS = ("http_list", "http_detail", "playwright")
+
+
+# -- measurement helpers --
+
+def _percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, round(q / 100 * len(values) + 0.5) - 1))
+    return values[rank]
+
+
+def _tree_rss_kb(pid: int) -> int:
+    """RSS of a process and all its descendants in KiB (Linux /proc), 0 when unavailable"""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status") as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+                        break
+            with open(f"/proc/{current}/task/{current}/children") as children:
+                pending.extend(int(child) for child in children.read().split())
+        except (OSError, ValueError):
+            continue
+    return total
+
+
+class RSSSampler:
+    """Samples the RSS of the process tree in the background and keeps the peak"""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self.peak_kb = 0
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            self.peak_kb = max(self.peak_kb, _tree_rss_kb(os.getpid()))
+            await asyncio.sleep(self.interval)
+
+    def __enter__(self) -> "RSSSampler":
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._task.cancel()
+        self.peak_kb = max(self.peak_kb, _tree_rss_kb(os.getpid()))
+        if not self.peak_kb:
+            # no /proc (macOS): fall back to the peak of this process alone
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            self.peak_kb = rss // 1024 if sys.platform == "darwin" else rss
+
+
+async def run_level(call, concurrency: int, requests: int) -> dict:
+    """
+    Issues `requests` calls with at most `concurrency` in flight
+
+    Args:
+        call (Callable[[int], Awaitable]): Scenario body, receives the request number.
+        concurrency (int): Calls in flight.
+        requests (int): Total calls.
+
+    Returns:
+        dict: Throughput, latency percentiles, outcome counts and peak RSS.
+    """
+    latencies: list[float] = []
+    outcome = {'ok': 0, 'empty': 0, 'errors': 0}
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        for number in counter:
+            started = time.perf_counter()
+            try:
+                result = await call(number)
+                outcome['ok' if result else 'empty'] += 1
+            except Exception:
+                outcome['errors'] += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    with RSSSampler() as sampler:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'concurrency': concurrency,
+        'requests': requests,
+        **outcome,
+        'rps': round(requests / elapsed, 2),
+        'p50_ms': round(_percentile(latencies, 50), 2),
+        'p95_ms': round(_percentile(latencies, 95), 2),
+        'p99_ms': round(_percentile(latencies, 99), 2),
+        'max_ms': round(latencies[-1], 2) if latencies else 0.0,
+        'peak_rss_kb': sampler.peak_kb,
+    }
+
+
+# -- stand-in server --
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    """Starts the stand-in server and waits until it accepts connections"""
+    port = _free_port()
+    server = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.standin_server", "--port", str(port),
+        "--latency", str(args.latency), "--jitter", str(args.jitter),
+        "--crew", str(args.crew), "--pages", str(args.pages),
+    ])
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return server, f"http://127.0.0.1:{port}"
+        except OSError:
+            if server.poll() is not None:
+                break
+            time.sleep(0.1)
+    server.kill()
+    sys.exit("Stand-in server did not start.")
+
+
+def configure(base_url: str, args: argparse.Namespace) -> None:
+    """
+    Points the app settings at the stand-in before the app is imported
+
+    Values already set in the environment win, so pool sizes etc. can be varied per run.
+    """
+    os.environ["KINORIUM_BASE_URL"] = base_url
+    os.environ.setdefault("HTTP_RATE_LIMIT", "0")         # measure the scraper, not the politeness limiter
+    os.environ.setdefault("CATALOGUE_ENABLED", "false")   # no database writes unless asked for
+    os.environ.setdefault("CREDENTIAL_POOL_MIN", "0")     # never mint sessions with the browser
+    os.environ.setdefault("TITLE_INDEX_ENABLED", "false") # measure the full search path
+    if args.store:
+        os.environ["CATALOGUE_ENABLED"] = "true"
+        os.environ.setdefault("CATALOGUE_DB_URL", "sqlite:///./benchmark.db")
+
+
+# -- scenarios --
+
+async def run_scenarios(args: argparse.Namespace) -> list[dict]:
+    # imported here: the settings are read from the environment at import time
+    from app.core.browser import browser_manager
+    from app.core.http_client import http_client
+    from app.core.workers import parse_pool
+    from app.services.catalogue_store import catalogue_store
+    from app.services.kinorium_http import KinoriumHTTPService
+    from app.services.kinorium_http_detail import KinoriumHTTPDetailService
+    from app.services.kinorium_playwright import KinoriumPlaywrightService
+
+    list_service = KinoriumHTTPService()
+    detail_service = KinoriumHTTPDetailService()
+    browser_service = KinoriumPlaywrightService(headless=True)
+    calls = {
+        'http_list': lambda n: list_service._scrape_page(genre_id=1, page=n % args.pages + 1, per_page=args.per_page),
+        'http_detail': lambda n: detail_service.movie_detail_executor(f"Інтерстеллар {n}"),
+        'playwright': lambda n: browser_service.movie_detail_executor(f"Інтерстеллар {n}"),
+    }
+
+    await http_client.start()
+    parse_pool.start()
+    await catalogue_store.start()
+    results = []
+    try:
+        for scenario in args.scenarios:
+            if scenario == "playwright":
+                try:
+                    await browser_manager.warm_up(headless=True)
+                except Exception as e:
+                    print(f"Skipping playwright: {str(e).splitlines()[0]}", file=sys.stderr)
+                    continue
+
+            await calls[scenario](0)  # warm-up: connections, imports, compiled XPath
+            for concurrency in args.concurrency:
+                row = {'scenario': scenario, **await run_level(calls[scenario], concurrency, args.requests)}
+                results.append(row)
+                if not args.json:
+                    _print_row(row)
+    finally:
+        await http_client.stop()
+        await parse_pool.stop()
+        await browser_manager.stop_engine()
+    return results
+
+
+# -- output --
+
+HEADER = (f"{'scenario':<12} | {'conc':>4} | {'rps':>8} | {'p50 ms':>8} | {'p95 ms':>8} | "
+          f"{'p99 ms':>8} | {'errors':>6} | {'peak RSS MiB':>12}")
+
+
+def _print_row(row: dict) -> None:
+    print(f"{row['scenario']:<12} | {row['concurrency']:>4} | {row['rps']:>8} | {row['p50_ms']:>8} | "
+          f"{row['p95_ms']:>8} | {row['p99_ms']:>8} | {row['errors'] + row['empty']:>6} | "
+          f"{row['peak_rss_kb'] / 1024:>12.1f}")
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Prints rps and p95 changes between two --output files"""
+    with open(before_path) as before_file, open(after_path) as after_file:
+        before, after = json.load(before_file), json.load(after_file)
+    print(f"{before['meta']['revision']} -> {after['meta']['revision']}")
+    print(f"{'scenario':<12} | {'conc':>4} | {'rps before':>10} | {'rps after':>10} | {'Δ rps':>7} | "
+          f"{'p95 before':>10} | {'p95 after':>10} | {'Δ p95':>7}")
+    old = {(row['scenario'], row['concurrency']): row for row in before['results']}
+    for row in after['results']:
+        base = old.get((row['scenario'], row['concurrency']))
+        if base is None:
+            continue
+        rps_change = (row['rps'] / base['rps'] - 1) * 100 if base['rps'] else 0.0
+        p95_change = (row['p95_ms'] / base['p95_ms'] - 1) * 100 if base['p95_ms'] else 0.0
+        print(f"{row['scenario']:<12} | {row['concurrency']:>4} | {base['rps']:>10} | {row['rps']:>10} | "
+              f"{rps_change:>+6.1f}% | {base['p95_ms']:>10} | {row['p95_ms']:>10} | {p95_change:>+6.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=["http_list", "http_detail"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16], help="calls in flight per level")
+    parser.add_argument("--requests", type=int, default=100, help="calls per level")
+    parser.add_argument("--latency", type=float, default=50.0, help="stand-in response delay in ms")
+    parser.add_argument("--jitter", type=float, default=10.0, help="random extra delay in ms")
+    parser.add_argument("--crew", type=int, default=100, help="people on the /cast/ page")
+    parser.add_argument("--pages", type=int, default=20, help="distinct filmList pages cycled through")
+    parser.add_argument("--per-page", type=int, default=50, help="items per filmList page")
+    parser.add_argument("--store", action="store_true", help="also write results to the catalogue store")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results only")
+    parser.add_argument("--output", help="write machine-readable results to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two --output files and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    server, base_url = start_server(args)
+    try:
+        configure(base_url, args)
+        if not args.json:
+            print(HEADER)
+            print("-" * len(HEADER))
+        results = asyncio.run(run_scenarios(args))
+    finally:
+        server.terminate()
+        server.wait()
+
+    report = {
+        'meta': {
+            'revision': _git_revision(),
+            'python': platform.python_version(),
+            'latency_ms': args.latency,
+            'jitter_ms': args.jitter,
+            'crew': args.crew,
+            'per_page': args.per_page,
+            'requests': args.requests,
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Local stand-in for ua.kinorium.com serving the benchmark fixtures.
+
+Routes:
+    /                      homepage with the topMenu__logo marker (health check)
+    /R2D2/                 catalogue page, sets session cookies (credential minting)
+    /search/?q=            search results linking to /<id>/
+    /<id>/                 movie detail page
+    /<id>/cast/            /cast/ page with --crew people
+    /handlers/filmList/    filmList JSON; pages past --pages return an empty list
+
+Every response is delayed by --latency ms (plus up to --jitter ms), like a remote site.
+
+Usage:
+    python -m benchmarks.standin_server --port 8089 --latency 50 --jitter 20
+    KINORIUM_BASE_URL=http://127.0.0.1:8089 uvicorn app.main:app
+"""
+import argparse
+import asyncio
+import random
+import uuid
+
+from aiohttp import web
+
+from benchmarks.fixtures import cast_page_html, detail_page_html, film_list_html, search_page_html
+
+HOMEPAGE_HTML = """<!DOCTYPE html>
+<html lang="uk"><head><meta charset="utf-8"><title>Кіноріум</title></head>
+<body><div class="topMenu__logo"></div></body></html>"""
+
+
+def create_app(latency_ms: float = 0.0, jitter_ms: float = 0.0, crew_size: int = 100, pages: int = 20) -> web.Application:
+    """
+    Builds the stand-in application
+
+    Args:
+        latency_ms (float): Fixed delay added to every response.
+        jitter_ms (float): Random extra delay, uniform in [0, jitter_ms].
+        crew_size (int): People on every /cast/ page.
+        pages (int): filmList pages per genre before an empty page is returned.
+    """
+    # pages are rendered once, the server should not be the bottleneck of the benchmark
+    cast_html = cast_page_html(crew_size)
+    search_html = search_page_html()
+    detail_cache: dict[int, str] = {}
+    list_cache: dict[tuple[int, int], str] = {}
+
+    @web.middleware
+    async def delay(request: web.Request, handler):
+        wait = latency_ms + (random.uniform(0, jitter_ms) if jitter_ms else 0.0)
+        if wait:
+            await asyncio.sleep(wait / 1000)
+        return await handler(request)
+
+    async def homepage(request: web.Request) -> web.Response:
+        return web.Response(text=HOMEPAGE_HTML, content_type="text/html")
+
+    async def catalogue(request: web.Request) -> web.Response:
+        response = web.Response(text=HOMEPAGE_HTML, content_type="text/html")
+        response.set_cookie("session", uuid.uuid4().hex[:26])
+        response.set_cookie("x119", str(random.randint(10000, 99999)))
+        response.set_cookie("PHPSESSID", uuid.uuid4().hex[:26])
+        return response
+
+    async def search(request: web.Request) -> web.Response:
+        return web.Response(text=search_html, content_type="text/html")
+
+    async def detail(request: web.Request) -> web.Response:
+        film_id = int(request.match_info["film_id"])
+        if film_id not in detail_cache:
+            detail_cache[film_id] = detail_page_html(film_id)
+        return web.Response(text=detail_cache[film_id], content_type="text/html")
+
+    async def cast(request: web.Request) -> web.Response:
+        return web.Response(text=cast_html, content_type="text/html")
+
+    async def film_list(request: web.Request) -> web.Response:
+        page = int(request.query.get("page", "1"))
+        per_page = int(request.query.get("perpage", "50"))
+        if page > pages:
+            return web.json_response({"result": {"html": ""}})
+        key = (page, per_page)
+        if key not in list_cache:
+            list_cache[key] = film_list_html(count=per_page, offset=(page - 1) * per_page)
+        return web.json_response({"result": {"html": list_cache[key]}})
+
+    app = web.Application(middlewares=[delay])
+    app.router.add_get("/", homepage)
+    app.router.add_get("/R2D2/", catalogue)
+    app.router.add_get("/search/", search)
+    app.router.add_get("/handlers/filmList/", film_list)
+    app.router.add_get(r"/{film_id:\d+}/", detail)
+    app.router.add_get(r"/{film_id:\d+}/cast/", cast)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0, help="fixed response delay in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra delay in ms")
+    parser.add_argument("--crew", type=int, default=100, help="people on the /cast/ page")
+    parser.add_argument("--pages", type=int, default=20, help="non-empty filmList pages per genre")
+    args = parser.parse_args()
+
+    app = create_app(args.latency, args.jitter, args.crew, args.pages)
+    web.run_app(app, host=args.host, port=args.port, print=None, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Regenerates tests/fixtures/*.playwright.json: what the browser engine extracts from the saved pages.
+
+The saved pages are served to Chromium at their kinorium URL and read with the bulk
+extraction script of KinoriumPlaywrightService, so test_http_parity.py compares the HTTP
+engine with real innerText output. Run after changing a fixture page:
+
+    playwright install chromium
+    python -m tests.capture_playwright_fixtures
+"""
+import asyncio
+import json
+from pathlib import Path
+
+from playwright.async_api import async_playwright
+
+from app.services.kinorium_playwright import KinoriumPlaywrightService
+
+FIXTURES = Path(__file__).parent / "fixtures"
+DETAIL_URL = "https://ua.kinorium.com/123456/"
+
+
+async def capture_detail() -> dict:
+    html = (FIXTURES / "detail_page.html").read_text(encoding="utf-8")
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch()
+        try:
+            page = await browser.new_page()
+            await page.route(DETAIL_URL, lambda route: route.fulfill(body=html, content_type="text/html; charset=utf-8"))
+            await page.goto(DETAIL_URL)
+            return await KinoriumPlaywrightService()._extract_details_bulk(page)
+        finally:
+            await browser.close()
+
+
+def main() -> None:
+    details = asyncio.run(capture_detail())
+    with open(FIXTURES / "detail_page.playwright.json", "w", encoding="utf-8") as file:
+        json.dump(details, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
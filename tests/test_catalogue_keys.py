@@ -0,0 +1,45 @@
+from app.services.catalogue_store import list_item_key
+from app.services.film_list_parsers import parse_film_list_bs4, parse_film_list_lxml
+
+# Two releases sharing title and year, plus one item the page shows without any link
+FILM_LIST_HTML = (
+    '<div class="filmList">'
+    '<div class="item filmList__item"><a class="filmList__item-title-link" href="/101/">'
+    '<i class="movie-title__text">Пастка</i></a>'
+    '<span class="filmList__small-text">Trap, 2024</span></div>'
+    '<div class="item filmList__item"><a class="filmList__item-title-link" href="/202/">'
+    '<i class="movie-title__text">Пастка</i></a>'
+    '<span class="filmList__small-text">Trap, 2024</span></div>'
+    '<div class="item filmList__item"><i class="movie-title__text">Без посилання</i>'
+    '<span class="filmList__small-text">No link, 2024</span></div>'
+    '</div>'
+)
+
+
+def test_parsers_return_the_detail_link():
+    bs4_items = parse_film_list_bs4(FILM_LIST_HTML)
+
+    assert bs4_items == parse_film_list_lxml(FILM_LIST_HTML)
+    assert [item['url'] for item in bs4_items] == ["/101/", "/202/", None]
+
+
+def test_same_name_releases_get_distinct_keys():
+    first, second, _ = parse_film_list_lxml(FILM_LIST_HTML)
+
+    assert (first['title'], first['year']) == (second['title'], second['year'])
+    assert list_item_key(first) != list_item_key(second)
+
+
+def test_key_ignores_how_the_link_is_written():
+    relative = {'title': "Пастка", 'year': "2024", 'url': "/101/"}
+    absolute = {'title': "Пастка", 'year': "2024", 'url': "https://uk.kinorium.com/101/?utm=list"}
+
+    assert list_item_key(relative) == list_item_key(absolute)
+
+
+def test_items_without_a_link_fall_back_to_the_title_hash():
+    item = parse_film_list_lxml(FILM_LIST_HTML)[2]
+    same_title = {'title': item['title'], 'title_eng': item['title_eng'], 'year': item['year']}
+
+    assert item['url'] is None
+    assert list_item_key(item) == list_item_key(same_title)
@@ -0,0 +1,88 @@
+import asyncio
+from app.core import config
+from app.core.credentials import Credential, CredentialPool
+
+
+def _minted() -> Credential:
+    return Credential("session", "x119", "phpsessid", "agent", source="minted")
+
+
+def test_failures_past_the_limit_remove_a_minted_set_once(monkeypatch):
+    monkeypatch.setattr(config, "CREDENTIAL_POOL_MIN", 0)
+    monkeypatch.setattr(config, "CREDENTIAL_MAX_FAILURES", 2)
+    pool = CredentialPool()
+    credential = _minted()
+    pool._credentials.append(credential)
+
+    # concurrent requests sharing the set keep reporting after it was benched
+    for _ in range(config.CREDENTIAL_MAX_FAILURES + 3):
+        pool.report_failure(credential, "rejected")
+
+    assert credential not in pool._credentials
+    assert not credential.healthy
+    assert pool.stats()['benched'] == 1
+
+
+def test_seed_sets_are_benched_not_removed(monkeypatch):
+    monkeypatch.setattr(config, "CREDENTIAL_POOL_MIN", 0)
+    monkeypatch.setattr(config, "CREDENTIAL_MAX_FAILURES", 1)
+    pool = CredentialPool()
+    seed = pool._credentials[0]
+
+    pool.report_failure(seed, "rejected")
+    pool.report_failure(seed, "rejected")
+
+    assert seed in pool._credentials
+    assert not seed.healthy
+    assert pool.acquire() is seed  # nothing healthy: the longest benched set is still tried
+
+
+def test_acquire_does_not_mint_before_a_rejection(monkeypatch):
+    monkeypatch.setattr(config, "CREDENTIAL_POOL_MIN", 2)
+    minted = []
+
+    async def mint(self):
+        minted.append(True)
+        return _minted()
+
+    monkeypatch.setattr(CredentialPool, "_mint", mint)
+
+    async def scenario():
+        pool = CredentialPool()
+        for _ in range(5):
+            pool.acquire()
+        assert pool._refresh_task is None
+
+        pool.report_failure(pool.acquire(), "rejected")
+        await pool._refresh_task
+        return pool
+
+    pool = asyncio.run(scenario())
+    assert minted
+    assert pool.stats()['healthy'] >= config.CREDENTIAL_POOL_MIN
+
+
+def test_failed_refresh_pauses_minting(monkeypatch):
+    monkeypatch.setattr(config, "CREDENTIAL_POOL_MIN", 2)
+    monkeypatch.setattr("app.core.credentials.MINT_ATTEMPTS", 1)
+    attempts = []
+
+    async def mint(self):
+        attempts.append(True)
+        raise RuntimeError("no browser")
+
+    async def no_sleep(_):
+        return None
+
+    monkeypatch.setattr(CredentialPool, "_mint", mint)
+    monkeypatch.setattr("app.core.credentials.asyncio.sleep", no_sleep)
+
+    async def scenario():
+        pool = CredentialPool()
+        pool.report_failure(pool.acquire(), "rejected")
+        await pool._refresh_task
+        pool.report_failure(pool.acquire(), "rejected")
+        assert pool._refresh_task.done()  # no new refresh while paused
+
+    asyncio.run(scenario())
+    assert len(attempts) == 1
@@ -0,0 +1,15 @@
+import json
+from pathlib import Path
+
+from app.services.kinorium_http_detail import parse_detail_page
+
+FIXTURES = Path(__file__).parent / "fixtures"
+DETAIL_URL = "https://ua.kinorium.com/123456/"
+
+
+def test_detail_page_matches_the_browser_engine():
+    """The HTTP engine must return what the browser engine extracted from the same page"""
+    html = (FIXTURES / "detail_page.html").read_text(encoding="utf-8")
+    expected = json.loads((FIXTURES / "detail_page.playwright.json").read_text(encoding="utf-8"))
+
+    assert parse_detail_page(html, DETAIL_URL) == expected
@@ -0,0 +1,57 @@
+import asyncio
+from app.core import config
+from app.services.catalogue_store import catalogue_store
+from app.services.kinorium_http import KinoriumHTTPService
+
+
+def test_store_errors_stop_the_crawl_instead_of_reporting_everything_as_new(monkeypatch):
+    async def crawl(self, genre_ids, per_page, **kwargs):
+        yield {'genre_id': genre_ids[0], 'page': 1, 'data': [{'title': 'Інтерстеллар', 'year': '2014'}]}
+
+    def broken(*args):
+        raise OSError("database is locked")
+
+    monkeypatch.setattr(KinoriumHTTPService, "crawl", crawl)
+    monkeypatch.setattr(catalogue_store, "enabled", True)
+    monkeypatch.setattr(catalogue_store, "_get_crawl_fingerprints", broken)
+    monkeypatch.setattr(catalogue_store, "_save_crawl_progress", broken)
+
+    async def scenario():
+        return [line async for line in KinoriumHTTPService().incremental_crawl([2], per_page=50, resume=False)]
+
+    lines = asyncio.run(scenario())
+    assert len(lines) == 1
+    assert lines[0]['summary']['pages'] == 0
+    assert 'error' in lines[0]
+    assert "database is locked" in lines[0]['error']
+
+
+def test_rejected_sessions_keep_the_checkpoint(monkeypatch):
+    checkpoints = {2: 3}
+    saved = []
+
+    async def get_crawl_checkpoints(genre_ids, per_page):
+        return dict(checkpoints)
+
+    async def save_crawl_progress(genre_id, per_page, fingerprints, last_page):
+        saved.append((genre_id, fingerprints, last_page))
+
+    async def rejected(self, credential, genre_id, page, per_page):
+        return None
+
+    monkeypatch.setattr(config, "CREDENTIAL_ATTEMPTS", 2)
+    monkeypatch.setattr(catalogue_store, "enabled", True)
+    monkeypatch.setattr(catalogue_store, "get_crawl_checkpoints", get_crawl_checkpoints)
+    monkeypatch.setattr(catalogue_store, "save_crawl_progress", save_crawl_progress)
+    monkeypatch.setattr(KinoriumHTTPService, "_request_list", rejected)
+    monkeypatch.setattr("app.services.kinorium_http.credential_pool.report_failure", lambda *args: None)
+
+    async def scenario():
+        return [line async for line in KinoriumHTTPService().incremental_crawl([2], per_page=50)]
+
+    lines = asyncio.run(scenario())
+    errors = lines[:-1]
+    assert errors and all('error' in line and line['page'] > 3 for line in errors)
+    assert lines[-1]['summary']['failed_pages'] == len(errors)
+    # the genre did not end: its fingerprints and checkpoint are left alone
+    assert saved == []
@@ -0,0 +1,31 @@
+import asyncio
+import pytest
+from app.core import config
+from app.core.profiling import profile_scrape, python_profile
+from app.core.workers import ParsePool
+from app.services.film_list_parsers import parse_film_list
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_pooled_parsing_is_profiled(monkeypatch, tmp_path, executor):
+    monkeypatch.setattr(config, "PARSE_EXECUTOR", executor)
+    monkeypatch.setattr(config, "PARSE_INLINE_THRESHOLD", 0)
+    monkeypatch.setattr(config, "PROFILE_DIR", str(tmp_path))
+    html = '<div class="item"><span class="filmList__small-text"><b>Title</b></span></div>'
+
+    async def scenario():
+        pool = ParsePool()
+        pool.start()
+        try:
+            async with profile_scrape("genre 2 page 1") as profile:
+                async with python_profile("http_list"):
+                    await pool.run(parse_film_list, html)
+                    await pool.run(parse_film_list, html)
+        finally:
+            await pool.stop()
+        return profile.summary()
+
+    summary = asyncio.run(scenario())
+    assert summary['python']['parse_pool']['calls'] == 2
+    assert any('parse_film_list' in entry['function'] for entry in summary['python']['parse_pool']['top_cumulative'])
+    assert (tmp_path / summary['id'] / "parse_pool.pstats").exists()
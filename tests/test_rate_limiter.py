@@ -0,0 +1,29 @@
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+import pytest
+from app.core.http_client import HostRateLimiter
+
+
+def _paused_for(retry_after: str | None) -> float:
+    limiter = HostRateLimiter(rate=10, burst=10, min_rate=1, backoff_max=60)
+    limiter.feedback(429, retry_after)
+    return limiter.stats()['paused_for']
+
+
+@pytest.mark.parametrize("value", ["1e9", "99999"])
+def test_retry_after_is_capped_at_backoff_max(value):
+    assert 59 <= _paused_for(value) <= 60
+
+
+@pytest.mark.parametrize("value", ["-5", "nan", "inf", "-inf", "soon", "Tue, 99 Foo 2026 00:00:00 GMT"])
+def test_invalid_retry_after_falls_back_to_the_backoff(value):
+    assert 0.9 <= _paused_for(value) <= 1  # first throttle: 2 ** 0 seconds
+
+
+def test_retry_after_as_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 28 <= _paused_for(format_datetime(retry_at, usegmt=True)) <= 30
+
+
+def test_retry_after_in_seconds():
+    assert 4.9 <= _paused_for("5") <= 5
@@ -0,0 +1,28 @@
+from app.core.routing import TYPICAL_RESOURCE_SIZES, RouteStats
+
+
+def test_fully_blocked_types_are_still_estimated():
+    stats = RouteStats()
+    stats.record_response("document", 50_000)
+    for _ in range(3):
+        stats.record_blocked("image")  # never allowed under the no-media preset
+
+    assert stats.stats()['estimated_blocked_bytes'] == 3 * TYPICAL_RESOURCE_SIZES["image"]
+    assert stats.stats()['unestimated_blocked_requests'] == 0
+
+
+def test_seen_sizes_win_over_the_typical_size():
+    stats = RouteStats()
+    stats.record_response("image", 1_000)
+    stats.record_response("image", 3_000)
+    stats.record_blocked("image")
+
+    assert stats.stats()['estimated_blocked_bytes'] == 2_000
+
+
+def test_types_without_any_size_are_counted_as_unestimated():
+    stats = RouteStats()
+    stats.record_blocked("websocket")
+
+    assert stats.stats()['estimated_blocked_bytes'] == 0
+    assert stats.stats()['unestimated_blocked_requests'] == 1
@@ -0,0 +1,105 @@
+import asyncio
+import aiohttp
+import pytest
+from aiohttp import web
+from app.core import config
+from app.core.http_client import HTTPClient, UpstreamBlocked
+from app.core.upstream import CLOSED, OPEN, CircuitBreaker
+
+
+async def _stalled_body(request):
+    response = web.StreamResponse()
+    await response.prepare(request)
+    await response.write(b"<html>")
+    await asyncio.sleep(2)
+    return response
+
+
+async def _forbidden(request):
+    return web.Response(status=403, text="Forbidden")
+
+
+async def _challenge(request):
+    return web.Response(text="<html>Checking your browser</html>")
+
+
+def _breaker() -> CircuitBreaker:
+    return CircuitBreaker(enabled=True, failure_threshold=2, reset_timeout=30, half_open_trials=1)
+
+
+def _run(handler, scenario):
+    async def main():
+        app = web.Application()
+        app.router.add_get("/", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        client = HTTPClient()
+        await client.start()
+        try:
+            await scenario(client, f"http://127.0.0.1:{port}/")
+        finally:
+            await client.stop()
+            await runner.cleanup()
+    asyncio.run(main())
+
+
+def test_a_body_timeout_is_one_failure(monkeypatch):
+    monkeypatch.setattr(config, "HTTP_RATE_LIMIT", 0)
+    breaker = _breaker()
+    breaker.record_failure("earlier")
+
+    async def scenario(client, url):
+        with pytest.raises(asyncio.TimeoutError):
+            async with client.get(url, timeout=0.5, breaker=breaker) as response:
+                await response.text()
+
+    _run(_stalled_body, scenario)
+    # a success on the status line would have reset the count before the timeout
+    assert breaker.state == OPEN
+
+
+def test_forbidden_counts_as_a_failure(monkeypatch):
+    monkeypatch.setattr(config, "HTTP_RATE_LIMIT", 0)
+    breaker = _breaker()
+
+    async def scenario(client, url):
+        async with client.get(url, breaker=breaker) as response:
+            await response.text()
+
+    _run(_forbidden, scenario)
+    assert breaker.stats()['consecutive_failures'] == 1
+
+
+def test_an_anti_bot_page_counts_as_a_failure(monkeypatch):
+    monkeypatch.setattr(config, "HTTP_RATE_LIMIT", 0)
+    breaker = _breaker()
+
+    async def scenario(client, url):
+        for _ in range(2):
+            with pytest.raises(UpstreamBlocked):
+                async with client.get(url, breaker=breaker) as response:
+                    if "Checking your browser" in await response.text():
+                        raise UpstreamBlocked("anti-bot page")
+
+    _run(_challenge, scenario)
+    assert breaker.state == OPEN
+
+
+def test_a_normal_page_closes_the_circuit(monkeypatch):
+    monkeypatch.setattr(config, "HTTP_RATE_LIMIT", 0)
+    breaker = _breaker()
+    breaker.record_failure("earlier")
+
+    async def ok(request):
+        return web.Response(text="<html>topMenu__logo</html>")
+
+    async def scenario(client, url):
+        async with client.get(url, breaker=breaker) as response:
+            await response.text()
+
+    _run(ok, scenario)
+    assert breaker.state == CLOSED
+    assert breaker.stats()['consecutive_failures'] == 0